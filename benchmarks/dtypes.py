@@ -0,0 +1,36 @@
+"""Cost of turning logged structures into columns, with and without the dtype bridge.
+
+    python benchmarks/dtypes.py
+
+Compares reading one field of every structure of a ctypes array through attribute
+access into a NumPy array against as_array, which views the same memory as a
+structured array and takes the column with no per-structure work.
+"""
+import timeit
+
+import numpy
+
+from pyscan_tlk.definitions.dtypes import as_array
+from pyscan_tlk.definitions.structures import QD_Readings
+
+
+def attributes(readings):
+    return numpy.array([reading.posDifference.x for reading in readings], dtype=numpy.int16)
+
+
+def bridged(readings):
+    return as_array(readings)['posDifference']['x']
+
+
+def main():
+    print("%10s %16s %14s %9s" % ("readings", "attributes us", "as_array us", "speedup"))
+    for count in (100, 10000, 1000000):
+        readings = (QD_Readings * count)()
+        assert (attributes(readings) == bridged(readings)).all()
+        slow = min(timeit.repeat(lambda: attributes(readings), number=1, repeat=3)) * 1e6
+        fast = min(timeit.repeat(lambda: bridged(readings), number=10, repeat=5)) / 10 * 1e6
+        print("%10d %16.0f %14.1f %8.0fx" % (count, slow, fast, slow / fast))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Cost of labelling raw enumeration values, one at a time and in bulk.
+
+    python benchmarks/enumerations.py
+
+Compares a linear scan of the members (what labelling a value used to take) with the
+dict lookup behind name_of, and a Python loop over a NumPy array of samples with
+decode.
+"""
+import timeit
+
+import numpy
+
+from pyscan_tlk.definitions.enumerations import MOT_LimitSwitchModes
+
+samples = 100000
+
+
+def scan(value):
+    for name, member in MOT_LimitSwitchModes._members_.items():
+        if member == value:
+            return name
+
+
+def main():
+    raw = numpy.random.default_rng(0).choice(list(MOT_LimitSwitchModes._names_), samples).astype(numpy.int16)
+    rows = [
+        ('linear scan, one value', lambda: scan(0x85), 1),
+        ('name_of, one value', lambda: MOT_LimitSwitchModes.name_of(0x85), 1),
+        ('name_of in a loop, %d samples' % samples, lambda: [MOT_LimitSwitchModes.name_of(v) for v in raw.tolist()], samples),
+        ('decode, %d samples' % samples, lambda: MOT_LimitSwitchModes.decode(raw), samples)]
+    print("%-40s %10s" % ("labelling", "ns/value"))
+    for label, call, values in rows:
+        number = max(1, 200000 // values)
+        seconds = min(timeit.repeat(call, number=number, repeat=3))
+        print("%-40s %10.1f" % (label, seconds / number / values * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Per-call cost of checking error codes, on the simulated backend.
+
+    python benchmarks/errorcheck.py
+
+Compares unchecked calls, check_errors (a ctypes errcheck, run inside the call) and
+the Python wrapper it replaces, on functions that return an error code. The first row
+uses the C library's abs, returning 0, to isolate the checking cost from the cost of
+the simulated call.
+"""
+import timeit
+from ctypes import CDLL, c_int, c_short
+from ctypes.util import find_library
+
+from pyscan_tlk import KinesisException, SerialNumber, backend, check_errors, kcubedcservo, kcubepiezo
+from pyscan_tlk.errorcheck import check_error_code
+
+number = 200000
+piezo = SerialNumber(29000001)
+servo = SerialNumber(27000001)
+
+calls = [
+    ('PCC_SetOutputVoltage', lambda: kcubepiezo.PCC_SetOutputVoltage(piezo, 100)),
+    ('PCC_RequestStatus', lambda: kcubepiezo.PCC_RequestStatus(piezo)),
+    ('KVS_RequestPosition', lambda: kcubedcservo.KVS_RequestPosition(servo))]
+
+
+def wrapped(call):
+    def checked():
+        error = call()
+        if error:
+            raise KinesisException(error)
+        return error
+    return checked
+
+
+def time(call):
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    backend.use_backend('simulated', devices=[piezo, servo])
+    print("%-24s %10s %10s %10s" % ("function", "unchecked", "errcheck", "wrapper"))
+    function = CDLL(find_library('c') or find_library('msvcrt')).abs
+    function.restype = c_short
+    function.argtypes = [c_int]
+    unchecked = time(lambda: function(0))
+    wrapper = time(wrapped(lambda: function(0)))
+    function.errcheck = check_error_code
+    print("%-24s %10.0f %10.0f %10.0f" % ('abs', unchecked, time(lambda: function(0)), wrapper))
+    for name, call in calls:
+        check_errors(False)
+        unchecked = time(call)
+        wrapper = time(wrapped(call))
+        check_errors()
+        errcheck = time(call)
+        check_errors(False)
+        print("%-24s %10.0f %10.0f %10.0f" % (name, unchecked, errcheck, wrapper))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Latency of move completion messages, by callback and by polling.
+
+    python benchmarks/messages.py [moves] [poll_ms] [backlog]
+
+Moves a simulated DC servo back and forth and times, from the end of each move, how
+long it takes to learn of its MoveCompleted message: from a MessageQueue woken by
+the device's callback, and from a loop polling MessageQueueSize every poll_ms. The
+simulated device queues the message from a timer thread, as the dll does from its
+polling thread. Then times draining a backlog of queued messages into a MessageQueue,
+as tuples, and into a MessageLog, as records; both pay for the simulated
+GetNextMessage calls.
+"""
+import statistics
+import sys
+import time
+from ctypes import byref, c_char_p, c_ulong, c_ushort
+
+from pyscan_tlk import backend, kcubedcservo
+from pyscan_tlk.backend.simulatedmotor import SimulatedMotor
+from pyscan_tlk.messagelog import MessageLog
+from pyscan_tlk.messages import MessageQueue
+
+servo = c_char_p(b'27000001')
+
+
+def _move(simulated, axis, target):
+    # Command a move and return the perf_counter time it ends at.
+    kcubedcservo.KVS_MoveToPosition(servo, target)
+    return time.perf_counter() + (axis.move.end - simulated.clock.now()) / simulated.clock.speed
+
+
+def by_callback(simulated, axis, moves):
+    messages = MessageQueue()
+    messages.register(kcubedcservo, servo.value.decode())
+    latencies = []
+    for n in range(moves):
+        end = _move(simulated, axis, 2000 * (n % 2))
+        messages.get()
+        latencies.append(time.perf_counter() - end)
+    messages.unregister(servo.value.decode())
+    return latencies
+
+
+def by_polling(simulated, axis, moves, poll_ms):
+    message = c_ushort(), c_ushort(), c_ulong()
+    latencies = []
+    for n in range(moves):
+        end = _move(simulated, axis, 2000 * (n % 2))
+        while not kcubedcservo.KVS_MessageQueueSize(servo):
+            time.sleep(poll_ms / 1000)
+        kcubedcservo.KVS_GetNextMessage(servo, *(byref(out) for out in message))
+        latencies.append(time.perf_counter() - end)
+    return latencies
+
+
+def drain(simulated, backlog):
+    device = simulated.device(servo.value, SimulatedMotor)
+    results = []
+    for name, make, empty in (("MessageQueue", MessageQueue, lambda queue: queue.drain()),
+                              ("MessageLog", lambda: MessageLog(capacity=backlog), lambda log: None)):
+        best = float('inf')
+        for _ in range(5):
+            device.messages.extend([(2, 1, 0)] * backlog)
+            sink = make()
+            start = time.perf_counter()
+            if isinstance(sink, MessageQueue):
+                sink.register(kcubedcservo, servo.value.decode())
+            else:
+                sink.add(kcubedcservo, servo.value.decode())
+            best = min(best, time.perf_counter() - start)
+            empty(sink)
+        results.append((name, best))
+    return results
+
+
+def main(moves=50, poll_ms=10, backlog=100000):
+    moves, poll_ms, backlog = int(moves), float(poll_ms), int(backlog)
+    simulated = backend.use_backend('simulated', devices=['27000001'], speed=10)
+    axis = simulated.device(servo.value, SimulatedMotor).axis(1)
+    for name, latencies in (("callback", by_callback(simulated, axis, moves)),
+                            ("poll %g ms" % poll_ms, by_polling(simulated, axis, moves, poll_ms))):
+        latencies = sorted(latency * 1e6 for latency in latencies)
+        print("%-12s median %8.1f us   p95 %8.1f us" % (
+            name, statistics.median(latencies), latencies[int(0.95 * (len(latencies) - 1))]))
+    for name, seconds in drain(simulated, backlog):
+        print("%-12s drains %d messages in %.1f ms, %.2f us each" % (name, backlog, seconds * 1e3, seconds / backlog * 1e6))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
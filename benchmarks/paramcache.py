@@ -0,0 +1,47 @@
+"""Cost of reading motor parameters through a ParameterCache, on the simulated backend.
+
+    python benchmarks/paramcache.py
+
+Compares calling each getter with fresh out-parameters against a ParameterCache hit,
+with and without a max_age bound. The simulated getters cost a few microseconds of
+Python, less than a round trip to a real dll.
+"""
+import timeit
+from ctypes import byref, c_double
+
+from pyscan_tlk import SerialNumber, backend, kcubedcservo
+from pyscan_tlk.definitions.structures import MOT_VelocityParameters
+from pyscan_tlk.paramcache import ParameterCache
+
+number = 100000
+servo = SerialNumber(27000001)
+
+
+def direct_velocity():
+    params = MOT_VelocityParameters()
+    kcubedcservo.KVS_GetVelParamsBlock(servo, byref(params))
+    return params
+
+
+def direct_motor():
+    outs = c_double(), c_double(), c_double()
+    kcubedcservo.KVS_GetMotorParamsExt(servo, *(byref(out) for out in outs))
+    return tuple(out.value for out in outs)
+
+
+def time(call):
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    backend.use_backend('simulated', devices=[servo])
+    cached = ParameterCache(kcubedcservo, servo)
+    bounded = ParameterCache(kcubedcservo, servo, max_age=60)
+    print("%-16s %12s %12s %14s" % ("getter", "dll ns", "cached ns", "max_age ns"))
+    for name, direct in (('VelParamsBlock', direct_velocity), ('MotorParamsExt', direct_motor)):
+        print("%-16s %12.0f %12.0f %14.0f" % (
+            name, time(direct), time(lambda: cached.get(name)), time(lambda: bounded.get(name))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Sampling rate and timing of a Sampler against simulated devices.
+
+    python benchmarks/sampler.py [rate] [devices] [seconds]
+
+Runs one Sampler per simulated DC servo, reading position and status bits, and
+reports the samples recorded, missed rounds and the spread of the intervals between
+samples. The simulated getters cost a few microseconds of Python each, more than the
+dll calls they stand in for.
+"""
+import sys
+import time
+
+import numpy
+
+from pyscan_tlk import backend, kcubedcservo
+from pyscan_tlk.sampler import Sampler
+
+
+def main(rate=1000, devices=4, seconds=2.0):
+    rate, devices, seconds = float(rate), int(devices), float(seconds)
+    serials = [27000001 + n for n in range(devices)]
+    backend.use_backend('simulated', devices=serials)
+    samplers = [Sampler(serial, {
+        'position': kcubedcservo.KVS_GetPosition,
+        'status': kcubedcservo.KVS_GetStatusBits}, rate, capacity=int(rate * seconds) + 1) for serial in serials]
+    cpu = time.process_time()
+    for sampler in samplers:
+        sampler.start()
+    time.sleep(seconds)
+    for sampler in samplers:
+        sampler.stop()
+    cpu = time.process_time() - cpu
+
+    print("%-10s %8s %8s %14s %14s" % ("serial", "samples", "missed", "interval us", "p99 jitter us"))
+    for sampler in samplers:
+        intervals = numpy.diff(sampler.latest()['time']) * 1e6
+        jitter = numpy.percentile(numpy.abs(intervals - 1e6 / rate), 99)
+        print("%-10s %8d %8d %14.1f %14.1f" % (sampler.serial, sampler.samples, sampler.missed, intervals.mean(), jitter))
+    print("cpu %.0f%% of one core" % (100 * cpu / seconds))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
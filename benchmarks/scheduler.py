@@ -0,0 +1,41 @@
+"""Polling a fleet of simulated devices from a PollScheduler.
+
+    python benchmarks/scheduler.py [devices] [rate] [workers] [seconds]
+
+Schedules one Sampler per simulated DC servo and reports the worker load and the
+worst lateness, jitter and misses across the fleet, for sizing how many devices a
+host can poll at a rate.
+"""
+import sys
+import time
+
+from pyscan_tlk import backend, kcubedcservo
+from pyscan_tlk.sampler import Sampler
+from pyscan_tlk.scheduler import PollScheduler
+
+
+def main(devices=40, rate=100, workers=1, seconds=2.0):
+    devices, rate, workers, seconds = int(devices), float(rate), int(workers), float(seconds)
+    serials = [27000001 + n for n in range(devices)]
+    backend.use_backend('simulated', devices=serials)
+    scheduler = PollScheduler(workers)
+    for serial in serials:
+        scheduler.add(Sampler(serial, {
+            'position': kcubedcservo.KVS_GetPosition,
+            'status': kcubedcservo.KVS_GetStatusBits}, rate, capacity=int(rate * seconds) + 1))
+    with scheduler:
+        time.sleep(seconds)
+        load = scheduler.load()
+    statistics = scheduler.statistics()
+    samples = sum(row['samples'] for row in statistics)
+    print("%d devices at %g Hz on %d workers for %gs" % (devices, rate, workers, seconds))
+    print("samples %d of %d, missed %d" % (samples, devices * rate * seconds, sum(row['missed'] for row in statistics)))
+    print("worker load %.0f%%" % (100 * load))
+    print("lateness mean %.0f us, max %.0f us, worst jitter %.0f us" % (
+        1e6 * sum(row['mean_lateness'] for row in statistics) / devices,
+        1e6 * max(row['max_lateness'] for row in statistics),
+        1e6 * max(row['jitter'] for row in statistics)))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
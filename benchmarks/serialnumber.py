@@ -0,0 +1,62 @@
+"""Per-call cost of the ways a serial number can be passed to the hot getters.
+
+    python benchmarks/serialnumber.py [kinesis|simulated]
+
+The getters run on the chosen backend (simulated by default, so the script works
+anywhere; simulated calls cost a microsecond or two of Python on top). The first
+table binds the C library's strlen with the same POINTER(c_char) signature, which
+isolates the conversion overhead every dll call pays.
+"""
+import sys
+import timeit
+from ctypes import CDLL, POINTER, c_char, c_char_p, c_size_t
+from ctypes.util import find_library
+
+from pyscan_tlk import SerialNumber, backend, kcubedcservo, kcubepiezo, kcubesteppermotor
+
+number = 200000
+
+getters = [
+    (kcubedcservo, 'KVS_GetPosition', 27000001),
+    (kcubesteppermotor, 'SCC_GetPosition', 26000001),
+    (kcubepiezo, 'PCC_GetOutputVoltage', 29000001),
+    (kcubepiezo, 'PCC_GetPosition', 29000001)]
+
+
+def calls(function, serial):
+    # (label, zero-argument callable) for each way of passing serial.
+    def per_call():
+        return function(c_char_p(bytes(str(serial), "utf-8")))
+
+    prebuilt = c_char_p(str(serial).encode())
+    handle = SerialNumber(serial)
+    return [
+        ('c_char_p(bytes(str(serial), "utf-8")) per call', per_call),
+        ('c_char_p built once', lambda: function(prebuilt)),
+        ('SerialNumber', lambda: function(handle))]
+
+
+def report(name, function, serial):
+    for label, call in calls(function, serial):
+        seconds = min(timeit.repeat(call, number=number, repeat=3))
+        print("%-24s %-48s %6.0f" % (name, label, seconds / number * 1e9))
+
+
+def main(name='simulated'):
+    print("%-24s %-48s %6s" % ("function", "serial", "ns/call"))
+    strlen = CDLL(find_library('c') or find_library('msvcrt')).strlen
+    strlen.restype = c_size_t
+    strlen.argtypes = [POINTER(c_char)]
+    report('strlen', strlen, 27000001)
+
+    if name == 'simulated':
+        backend.use_backend(name, devices=[serial for _, _, serial in getters])
+    else:
+        backend.use_backend(name)
+    for module, function, serial in getters:
+        getattr(module, function)(SerialNumber(serial))
+        report(function, getattr(module, function), serial)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
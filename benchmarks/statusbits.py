@@ -0,0 +1,29 @@
+"""Cost of decoding logged status words into named flags.
+
+    python benchmarks/statusbits.py [samples]
+
+Compares masking each named bit of each word in Python with StatusBits.columns, which
+unpacks the whole array in one vectorized pass.
+"""
+import sys
+import timeit
+
+import numpy
+
+from pyscan_tlk.statusbits import MOTOR
+
+
+def per_sample(statuses):
+    return [dict((flag, bool(status & mask)) for flag, mask in MOTOR.bits.items()) for status in statuses.tolist()]
+
+
+def main(samples=1000000):
+    statuses = numpy.random.default_rng(0).integers(0, 2 ** 32, int(samples), dtype=numpy.uint32)
+    print("%-32s %10s %12s" % ("decoding", "seconds", "ns/word"))
+    for label, decode in [('masking in Python', per_sample), ('StatusBits.columns', MOTOR.columns)]:
+        seconds = min(timeit.repeat(lambda: decode(statuses), number=1, repeat=3))
+        print("%-32s %10.3f %12.1f" % (label, seconds, seconds / len(statuses) * 1e9))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,56 @@
+"""Cost of a structure getter with fresh and pooled out-parameters, on the simulated backend.
+
+    python benchmarks/structpool.py
+
+Compares allocating the structure and its byref() on every call, passing the
+structure itself for ctypes to convert, and a StructPool. The simulated getter costs
+several microseconds of Python, which swamps the differences, so the cost of
+preparing the out-parameters alone is timed as well.
+"""
+import timeit
+from ctypes import byref
+
+from pyscan_tlk import SerialNumber, backend, kcubedcservo
+from pyscan_tlk.definitions.structures import MOT_VelocityParameters
+from pyscan_tlk.structpool import StructPool
+
+number = 100000
+servo = SerialNumber(27000001)
+
+
+def fresh():
+    params = MOT_VelocityParameters()
+    kcubedcservo.KVS_GetVelParamsBlock(servo, byref(params))
+    return params
+
+
+params = MOT_VelocityParameters()
+
+
+def reused():
+    kcubedcservo.KVS_GetVelParamsBlock(servo, params)
+    return params
+
+
+def prepare_fresh():
+    return (servo, byref(MOT_VelocityParameters()))
+
+
+def time(call):
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e9
+
+
+def main():
+    backend.use_backend('simulated', devices=[servo])
+    pool = StructPool(kcubedcservo, servo)
+    get = pool.get
+    outs = pool.outs('GetVelParamsBlock')
+    print("%-20s %10s %12s" % ("out-parameters", "call ns", "prepare ns"))
+    print("%-20s %10.0f %12.0f" % ("fresh structure", time(fresh), time(prepare_fresh)))
+    print("%-20s %10.0f %12s" % ("reused structure", time(reused), "-"))
+    print("%-20s %10.0f %12.0f" % ("StructPool", time(lambda: get('GetVelParamsBlock')),
+                                   time(lambda: pool._getters.get('GetVelParamsBlock') or outs)))
+
+
+if __name__ == '__main__':
+    main()
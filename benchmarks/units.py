@@ -0,0 +1,52 @@
+"""Cost of converting real units to device units and back, on the simulated backend.
+
+    python benchmarks/units.py
+
+Compares one GetDeviceUnitFromRealValue / GetRealValueFromDeviceUnit call per value
+against a UnitConverter converting the whole array. The simulated dll costs a few
+microseconds of Python per call, about what a real dll call costs through ctypes.
+"""
+import time
+from ctypes import byref, c_double, c_int
+
+import numpy
+
+from pyscan_tlk import SerialNumber, backend, kcubedcservo
+from pyscan_tlk.units import UnitConverter
+
+servo = SerialNumber(27000001)
+
+
+def per_call(values):
+    device, real = c_int(), c_double()
+    for value in values.tolist():
+        kcubedcservo.KVS_GetDeviceUnitFromRealValue(servo, value, byref(device), 0)
+        kcubedcservo.KVS_GetRealValueFromDeviceUnit(servo, device.value, byref(real), 0)
+
+
+def vectorized(units, values):
+    units.to_real(units.to_device(values))
+
+
+def seconds(call, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    backend.use_backend('simulated', devices=[servo])
+    units = UnitConverter(kcubedcservo, servo)
+    print("%10s %14s %14s %9s" % ("values", "dll ns/value", "numpy ns/value", "speedup"))
+    for count in (10, 1000, 100000):
+        values = numpy.random.default_rng(0).uniform(0.0, 25.0, count)
+        dll = seconds(lambda: per_call(values), 1 if count > 1000 else 5) / count * 1e9
+        array = seconds(lambda: vectorized(units, values)) / count * 1e9
+        print("%10d %14.0f %14.1f %8.0fx" % (count, dll, array, dll / array))
+
+
+if __name__ == '__main__':
+    main()
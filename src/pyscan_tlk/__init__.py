@@ -1,9 +1,67 @@
+import importlib
 import importlib.resources
 import json
 import os
 
+from .definitions.kinesisexception import KinesisException
+from .errorcheck import check_errors
+from .retry import RetryPolicy
+from .serialnumber import SerialNumber
+from .statusbits import status_bits
+
 
 dir = os.path.dirname(os.path.abspath(__file__))
 
 with importlib.resources.open_text("pyscan_tlk", "version.json") as file:
     __version__ = json.load(file)['version']
+
+# Device wrapper modules are imported on first attribute access (pyscan_tlk.kcubepiezo)
+# so importing the package stays cheap and each module keeps its own namespace.
+device_modules = (
+    'benchtopbrushlessmotor',
+    'benchtopdcservo',
+    'benchtopnanotrack',
+    'benchtoppiezo',
+    'benchtoppiezopdxc2',
+    'benchtopprecisionpiezo',
+    'benchtopsteppermotor',
+    'benchtopvoicecoil',
+    'filterflipper',
+    'integratedprecisionpiezo',
+    'integratedsteppermotor',
+    'kcubebrushlessmotor',
+    'kcubedcservo',
+    'kcubeinertialmotor',
+    'kcubelaserdiode',
+    'kcubelasersource',
+    'kcubenanotrack',
+    'kcubepiezo',
+    'kcubepiezostraingauge',
+    'kcubepositionaligner',
+    'kcubesolenoid',
+    'kcubesteppermotor',
+    'modularnanotrack',
+    'modularsteppermotor',
+    'polarizer',
+    'tcubebrushlessmotor',
+    'tcubeinertialmotor',
+    'tcubelaserdiode',
+    'tcubelasersource',
+    'tcubenanotrack',
+    'tcubepiezo',
+    'tcubequad',
+    'tcubeservo',
+    'tcubesolenoid',
+    'tcubesteppermotor',
+    'tcubestraingauge',
+    'tcubetec')
+
+
+def __getattr__(name):
+    if name in device_modules or name == 'devicemanager':
+        return importlib.import_module('.' + name, __name__)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(device_modules) | {'devicemanager'})
@@ -0,0 +1,198 @@
+"""Polling periods that follow motion and demand.
+
+StartPolling fixes how often the dll asks a device for its status. Fast polling is
+only useful while something changes or someone is watching, so AdaptivePolling
+checks a fleet of devices from one thread and gives each the fast period while it
+moves (from the moving, jogging and homing bits of GetStatusBits), while it has
+subscribers, or for linger seconds after either, and the slow heartbeat otherwise:
+
+    polling = AdaptivePolling()
+    polling.add(kcubedcservo, serial_number, fast=10, slow=1000)
+    with polling:
+        polling.kick(serial_number)            # about to move: poll fast now
+        kcubedcservo.KVS_MoveToPosition(serial_number, position)
+        with polling.subscribe(serial_number):
+            ...                                 # fast while a plot is open
+
+The status bits come from the dll's cache, so checking them costs no USB traffic;
+only changes of period call StartPolling.
+"""
+import contextlib
+import threading
+import time
+
+from .family import default_channel, family_function, family_prefix, takes_channel, with_channel
+from .serialnumber import SerialNumber
+from .statusbits import status_bits
+
+
+class PolledDevice(object):
+    """Polling state of one device (or channel) under AdaptivePolling."""
+
+    def __init__(self, module, serial, channel=None, fast=10, slow=1000, linger=1.0, prefix=None, status_channels=None):
+        self.serial = SerialNumber(serial)
+        self.fast = fast
+        self.slow = slow
+        self.linger = linger
+        prefix = prefix or family_prefix(module)
+        self._start = family_function(module, prefix, 'StartPolling')
+        self._get_status = family_function(module, prefix, 'GetStatusBits')
+        status_takes_channel = takes_channel(self._get_status)
+        if channel is not None and not (takes_channel(self._start, 2) or status_takes_channel):
+            raise ValueError("%s_ functions take no channel" % prefix)
+        self.channel = channel = default_channel(self._start, channel, 2)
+        if status_channels is None:
+            status_channels = [1 if channel is None else channel] if status_takes_channel else [None]
+        self.status_channels = list(status_channels)
+        layout = status_bits(module)
+        self.moving_mask = 0
+        for flag in layout:
+            if flag.startswith(('moving', 'jogging', 'homing')):
+                self.moving_mask |= layout[flag]
+        self.subscribers = 0
+        self.period = None
+        self.changes = 0
+        self.active_until = float('-inf')
+
+    def __repr__(self):
+        return "<PolledDevice %s polling every %s ms>" % (self.serial, self.period)
+
+    def moving(self):
+        """Whether the status bits of any watched channel show motion."""
+        if not self.moving_mask:
+            return False
+        for channel in self.status_channels:
+            arguments = (self.serial,) if channel is None else (self.serial, channel)
+            if self._get_status(*arguments) & self.moving_mask:
+                return True
+        return False
+
+    def wanted(self, now):
+        """The polling period, in ms, the device should have at now."""
+        if self.subscribers or self.moving():
+            self.active_until = now + self.linger
+            return self.fast
+        return self.fast if now < self.active_until else self.slow
+
+    def poll_every(self, period):
+        """Set the dll's polling period in ms, if it is not already."""
+        if period != self.period:
+            self._start(*with_channel(self._start, self.channel, (self.serial, period)))
+            self.period = period
+            self.changes += 1
+
+
+class AdaptivePolling(object):
+    """Check every added device each interval seconds and set its polling period.
+
+    Errors raised while the background thread checks the devices are counted in
+    errors, and the latest is kept in last_error.
+    """
+
+    def __init__(self, interval=0.1, clock=time.monotonic):
+        self.interval = interval
+        self.clock = clock
+        self.devices = {}
+        self.errors = 0
+        self.last_error = None
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __repr__(self):
+        return "<AdaptivePolling %d devices every %gs>" % (len(self.devices), self.interval)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def add(self, module, serial, channel=None, **options):
+        """Manage the polling of serial (and channel) through the family module.
+
+        options are fast and slow periods in ms, linger in seconds, the function
+        prefix for modules with several, and status_channels, the channels whose
+        status bits show motion. Families whose StartPolling takes a channel poll
+        channel 1 unless given one, and kick, subscribe and remove find the device
+        by the channel it polls. The device starts on its period straight away.
+        """
+        device = PolledDevice(module, serial, channel, **options)
+        with self._lock:
+            self.devices[(device.serial, device.channel)] = device
+            device.poll_every(device.wanted(self.clock()))
+        return device
+
+    def remove(self, serial, channel=None):
+        with self._lock:
+            return self.devices.pop(self._key(serial, channel))
+
+    def _key(self, serial, channel):
+        # Devices are keyed by the channel they poll; no channel finds the default, 1.
+        key = (SerialNumber(serial), channel)
+        if channel is None and key not in self.devices:
+            key = (key[0], 1)
+        return key
+
+    def _device(self, serial, channel):
+        return self.devices[self._key(serial, channel)]
+
+    def kick(self, serial, channel=None):
+        """Poll fast now, ahead of a move the status bits do not show yet."""
+        with self._lock:
+            device = self._device(serial, channel)
+            device.active_until = self.clock() + device.linger
+            device.poll_every(device.fast)
+
+    @contextlib.contextmanager
+    def subscribe(self, serial, channel=None):
+        """Keep the device polling fast while the with block runs."""
+        with self._lock:
+            device = self._device(serial, channel)
+            device.subscribers += 1
+            device.poll_every(device.wanted(self.clock()))
+        try:
+            yield device
+        finally:
+            with self._lock:
+                device.subscribers -= 1
+
+    def update(self):
+        """Check every device once and change the periods that need it.
+
+        A device whose calls fail does not hold up the others: the first error is
+        raised once every device has been checked.
+        """
+        error = None
+        with self._lock:
+            now = self.clock()
+            for device in list(self.devices.values()):
+                try:
+                    device.poll_every(device.wanted(now))
+                except Exception as exception:
+                    error = error or exception
+        if error is not None:
+            raise error
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="AdaptivePolling", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.update()
+            except Exception as error:
+                # Keep the thread checking; the failure is counted and kept for the caller.
+                self.errors += 1
+                self.last_error = error
@@ -0,0 +1,187 @@
+"""asyncio access to the motion families.
+
+An AsyncStage wraps one axis of a motion controller. Its dll calls run on an
+executor thread, never on the event loop, and its moves are awaitable: they return
+once the status bits show the axis has stopped, so one loop can drive many axes at
+once:
+
+    x = AsyncStage(kcubedcservo, '27000001')
+    y = AsyncStage(kcubedcservo, '27000002')
+    await asyncio.gather(x.home(), y.home())
+    await asyncio.gather(x.move_to(100000), y.move_to(50000))
+
+Cancelling a move or home (directly, or through asyncio.wait_for) stops the axis,
+with a profiled stop where the family has one, before the CancelledError propagates.
+The axis should be polling (StartPolling) so its status bits are current.
+
+With messages=True a stage registers the device's message callback and finishes a
+move on its MoveCompleted or Homed message; the status bits are still checked every
+poll_interval seconds in case a message is lost:
+
+    x = AsyncStage(kcubedcservo, '27000001', messages=True, poll_interval=0.5)
+"""
+import asyncio
+import functools
+
+from .family import check_result, default_channel, family_function, takes_channel
+from .messages import MessageQueue
+from .serialnumber import SerialNumber
+from .statusbits import MOTOR
+
+# Export (without prefix) behind each operation, per family prefix.
+families = {
+    'KVS': {'move_to': 'MoveToPosition', 'move_by': 'MoveRelative', 'home': 'Home', 'position': 'GetPosition',
+            'stop_profiled': 'StopProfiled', 'stop_immediate': 'StopImmediate'},
+    'SCC': {'move_to': 'MoveToPosition', 'move_by': 'MoveRelative', 'home': 'Home', 'position': 'GetPosition',
+            'stop_profiled': 'StopProfiled', 'stop_immediate': 'StopImmediate'},
+    'ISC': {'move_to': 'MoveToPosition', 'move_by': 'MoveRelative', 'home': 'Home', 'position': 'GetPosition',
+            'stop_profiled': 'StopProfiled', 'stop_immediate': 'StopImmediate'},
+    'BMC': {'move_to': 'MoveToPosition', 'move_by': 'MoveRelative', 'home': 'Home', 'position': 'GetPosition',
+            'stop_profiled': 'StopProfiled', 'stop_immediate': 'StopImmediate'},
+    'KIM': {'move_to': 'MoveAbsolute', 'move_by': 'MoveRelative', 'home': 'Home', 'position': 'GetCurrentPosition',
+            'stop_profiled': 'MoveStop', 'stop_immediate': 'MoveStop'},
+    'MPC': {'move_to': 'MoveToPosition', 'move_by': 'MoveRelative', 'home': 'Home', 'position': 'GetPosition',
+            'stop_profiled': 'Stop', 'stop_immediate': 'Stop', 'tolerance': 1e-3},
+    'FF': {'move_to': 'MoveToPosition', 'home': 'Home', 'position': 'GetPosition'}}
+
+MOVING = MOTOR['moving_forward'] | MOTOR['moving_reverse'] | MOTOR['jogging_forward'] | MOTOR['jogging_reverse']
+HOMING = MOTOR['homing']
+HOMED = MOTOR['homed']
+
+# GenericMotor messages that end a home, and a move.
+GENERIC_MOTOR = 2
+HOME_MESSAGES = frozenset([(GENERIC_MOTOR, 0)])
+MOVE_MESSAGES = frozenset([(GENERIC_MOTOR, 1), (GENERIC_MOTOR, 2)])
+
+
+class AsyncStage(object):
+    """One axis of a motion controller, driven from asyncio.
+
+    module is the family's wrapper module (kcubedcservo, kcubebrushlessmotor, ...),
+    channel the channel or paddle for families that have them (1 by default).
+    Status bits are checked every poll_interval seconds while waiting for motion
+    to finish; a move is done once the axis is seen moving and then stopped, or is
+    stopped within tolerance of its target, or has not been seen moving
+    start_timeout seconds after it was commanded. With messages, a stage also
+    wakes on every message of the device, and a Homed or MoveCompleted message
+    ends the wait unless other channels of the device share its messages. Only one
+    stage per device should take messages, as each registration replaces the last.
+    Nonzero error codes raise KinesisException. Calls run on executor, the loop's
+    default executor if None.
+    """
+
+    def __init__(self, module, serial, channel=None, prefix=None, poll_interval=0.01, start_timeout=1.0, executor=None,
+                 tolerance=None, messages=False):
+        if prefix is None:
+            prefix = next((name for name in families if hasattr(module, name + '_GetStatusBits')), None)
+        if prefix not in families:
+            raise ValueError("%s is not a supported motion family" % getattr(module, '__name__', module))
+        self.module = module
+        self.prefix = prefix
+        self.serial = SerialNumber(serial)
+        operations = families[prefix]
+        # Families with channels (or paddles) take one after the serial number.
+        self.channel = channel = default_channel(getattr(module, prefix + '_GetStatusBits'), channel)
+        self.poll_interval = poll_interval
+        self.start_timeout = start_timeout
+        self.executor = executor
+        self.tolerance = operations.get('tolerance', 0) if tolerance is None else tolerance
+        self._operations = operations
+        # Arguments before each operation's own: the serial, then the channel if any.
+        self._selector = (self.serial,) if channel is None else (self.serial, channel)
+        self._messages = None
+        self._messages_complete = False
+        if messages:
+            self._messages = MessageQueue()
+            self._messages.register(module, self.serial, channel, prefix)
+            # A device whose channels share one callback cannot say which channel finished.
+            self._messages_complete = channel is None or takes_channel(self._function('RegisterMessageCallback'), 2)
+
+    def __repr__(self):
+        return "<AsyncStage %s_ %s%s>" % (
+            self.prefix, self.serial, '' if self.channel is None else ' channel %s' % self.channel)
+
+    def _function(self, export):
+        return family_function(self.module, self.prefix, export)
+
+    async def call(self, export, *args):
+        """Call the family's export on the executor, with the serial (and channel) first."""
+        function = self._function(export)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, functools.partial(function, *(self._selector + args)))
+        return check_result(self.module, '%s_%s' % (self.prefix, export), result, self.serial)
+
+    async def status_bits(self):
+        return await self.call('GetStatusBits')
+
+    async def position(self):
+        return await self.call(self._operations['position'])
+
+    async def move_to(self, position):
+        """Move to position, in device units, and return once the axis has stopped."""
+        self._forget_messages()
+        await self.call(self._operations['move_to'], position)
+        await self._settle(MOVING, lambda status: self._at(position), self.start_timeout, MOVE_MESSAGES)
+
+    async def move_by(self, distance):
+        """Move by distance, in device units, and return once the axis has stopped.
+
+        Families without relative moves (FF) raise ValueError.
+        """
+        if 'move_by' not in self._operations:
+            raise ValueError("%s_ devices have no relative move; use move_to" % self.prefix)
+        target = await self.position() + distance
+        self._forget_messages()
+        await self.call(self._operations['move_by'], distance)
+        await self._settle(MOVING, lambda status: self._at(target), self.start_timeout, MOVE_MESSAGES)
+
+    async def home(self):
+        """Home the axis and return once the status bits show it homed."""
+        self._forget_messages()
+        await self.call(self._operations['home'])
+
+        async def homed(status):
+            return bool(status & HOMED)
+        await self._settle(MOVING | HOMING, homed, done_messages=HOME_MESSAGES)
+
+    async def stop(self, immediate=False):
+        """Stop the axis, with the family's profiled stop unless immediate."""
+        export = self._operations.get('stop_immediate' if immediate else 'stop_profiled')
+        if export is not None:
+            await self.call(export)
+
+    async def _at(self, target):
+        return abs(await self.position() - target) <= self.tolerance
+
+    def _forget_messages(self):
+        # Messages of earlier commands must not end the next wait.
+        if self._messages is not None:
+            self._messages.drain()
+
+    async def _pause(self, done_messages):
+        # Wait for the next check of the status bits; True if a message ended the wait.
+        if self._messages is None:
+            await asyncio.sleep(self.poll_interval)
+            return False
+        messages = await self._messages.wait(self.poll_interval)
+        return self._messages_complete and any((message.type, message.id) in done_messages for message in messages)
+
+    async def _settle(self, busy, ready, start_timeout=None, done_messages=()):
+        # Wait until the status bits have shown busy and then cleared. The dll's cached
+        # status can miss a short move entirely, so an axis never seen busy is also done
+        # once ready(status) holds, or start_timeout seconds have passed.
+        loop = asyncio.get_running_loop()
+        give_up = None if start_timeout is None else loop.time() + start_timeout
+        seen = False
+        try:
+            while True:
+                status = await self.status_bits()
+                if status & busy:
+                    seen = True
+                elif seen or await ready(status) or (give_up is not None and loop.time() > give_up):
+                    return
+                if await self._pause(done_messages):
+                    return
+        except asyncio.CancelledError:
+            await asyncio.shield(self.stop())
+            raise
@@ -0,0 +1,68 @@
+import os
+
+from .lazylibrary import reset_libraries, set_loader
+
+
+# Backends provide the Kinesis dll exports. A backend is any object with a load(name)
+# method returning something that behaves like a ctypes CDLL for that dll name.
+
+_factories = {}
+_backend = None
+
+
+def register_backend(name, factory):
+    """Register a callable that creates a backend from keyword options."""
+    _factories[name] = factory
+
+
+def available_backends():
+    return sorted(_factories)
+
+
+def use_backend(backend=None, **options):
+    """Select the backend that provides the Kinesis dlls and return it.
+
+    backend is a registered name or a backend instance. With no argument the name is
+    read from the PYSCAN_TLK_BACKEND environment variable, defaulting to 'kinesis'.
+    Dlls already loaded through the previous backend are released, so wrappers pick
+    up the new backend on their next call.
+    """
+    global _backend
+    if backend is None:
+        backend = os.environ.get('PYSCAN_TLK_BACKEND', 'kinesis')
+    if isinstance(backend, str):
+        try:
+            factory = _factories[backend]
+        except KeyError:
+            raise ValueError("Unknown backend %r, expected one of %s" % (backend, available_backends()))
+        backend = factory(**options)
+    _backend = backend
+    reset_libraries()
+    return backend
+
+
+def get_backend():
+    """Return the active backend, creating the configured one on first use."""
+    if _backend is None:
+        use_backend()
+    return _backend
+
+
+def load_library(name):
+    return get_backend().load(name)
+
+
+def _kinesis(**options):
+    from .kinesis import KinesisBackend
+    return KinesisBackend(**options)
+
+
+def _simulated(**options):
+    from .simulated import SimulatedBackend
+    return SimulatedBackend(**options)
+
+
+register_backend('kinesis', _kinesis)
+register_backend('simulated', _simulated)
+
+set_loader(load_library)
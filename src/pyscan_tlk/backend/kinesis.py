@@ -0,0 +1,26 @@
+import os
+from ctypes import cdll
+
+
+default_path = "C:/Program Files/Thorlabs/Kinesis/"
+
+
+class KinesisBackend(object):
+    """Loads the Thorlabs Kinesis dlls from disk.
+
+    The install folder is taken from path, then the PYSCAN_TLK_KINESIS_PATH environment
+    variable, then the default Kinesis install location.
+    """
+
+    name = 'kinesis'
+
+    def __init__(self, path=None):
+        if path is None:
+            path = os.environ.get('PYSCAN_TLK_KINESIS_PATH', default_path)
+        self.path = path
+
+    def __repr__(self):
+        return "<KinesisBackend %r>" % self.path
+
+    def load(self, name):
+        return cdll.LoadLibrary(os.path.join(self.path, name))
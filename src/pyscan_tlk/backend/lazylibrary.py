@@ -0,0 +1,241 @@
+import threading
+import weakref
+from ctypes import c_int, cdll
+
+
+_loader = cdll.LoadLibrary
+_libraries = weakref.WeakSet()
+_errcheck_for = None
+
+
+def get_loader():
+    """Return the callable used to load dlls that were not given their own loader."""
+    return _loader
+
+
+def set_loader(loader):
+    """Replace the default dll loader and return the previous one.
+
+    The loader is called with the dll name the first time a function from that dll
+    is called. pyscan_tlk.backend installs a loader that asks the active backend;
+    tests install a stand-in loader here so the wrappers can be imported, called and
+    timed on machines without Kinesis installed.
+    """
+    global _loader
+    previous, _loader = _loader, loader
+    return previous
+
+
+def set_errcheck(errcheck_for):
+    """Give every declared function the errcheck chosen by errcheck_for(function).
+
+    errcheck_for receives each LazyFunction, in every library now and as later ones
+    are declared, and returns the errcheck to attach or None. Passing None removes
+    the errcheck from every function. The previous errcheck_for is returned.
+    """
+    global _errcheck_for
+    previous, _errcheck_for = _errcheck_for, errcheck_for
+    for library in list(_libraries):
+        for function in list(library.functions.values()):
+            function.errcheck = errcheck_for(function) if errcheck_for else None
+    return previous
+
+
+def reset_libraries():
+    """Reset every LazyLibrary so the next call loads its dll through the current loader."""
+    for library in list(_libraries):
+        library.reset()
+
+
+class LazyLibrary(object):
+    """A dll that is only loaded when one of its functions is first called.
+
+    Functions are declared as a table of (name, restype, argtypes) rows. Each row
+    becomes a LazyFunction that records the signature and only resolves and types the
+    real function pointer on its first call. If namespace is given (normally the
+    wrapper module's globals()), declared functions are placed there and each one
+    rebinds its name to the real ctypes function once resolved, so later calls go
+    straight to ctypes.
+    """
+
+    def __init__(self, path, namespace=None, loader=None):
+        self._path = path
+        self._namespace = namespace
+        self._loader = loader
+        self._handle = None
+        self._functions = {}
+        self._lock = threading.Lock()
+        _libraries.add(self)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._functions[name]
+        except KeyError:
+            function = self._functions[name] = LazyFunction(self, name)
+            return function
+
+    def __repr__(self):
+        state = 'loaded' if self.loaded else 'not loaded'
+        return "<LazyLibrary %r (%s)>" % (self._path, state)
+
+    def declare(self, signatures):
+        """Add (name, restype, argtypes) rows to the library's signature table.
+
+        Declaring a name again replaces its signature, including on an already
+        resolved function.
+        """
+        for name, restype, argtypes in signatures:
+            function = self._functions.get(name)
+            if function is None:
+                function = self._functions[name] = LazyFunction(self, name, restype, argtypes)
+            else:
+                function.restype = restype
+                function.argtypes = argtypes
+            if _errcheck_for is not None:
+                function.errcheck = _errcheck_for(function)
+            if self._namespace is not None:
+                resolved = function._function
+                self._namespace[name] = function if resolved is None else resolved
+
+    @property
+    def functions(self):
+        """The LazyFunction for every declared or accessed name, keyed by name."""
+        return self._functions
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def loaded(self):
+        return self._handle is not None
+
+    @property
+    def handle(self):
+        """The loaded dll, loading it on first access."""
+        handle = self._handle
+        if handle is None:
+            with self._lock:
+                if self._handle is None:
+                    loader = self._loader or _loader
+                    self._handle = loader(self._path)
+                handle = self._handle
+        return handle
+
+    def reset(self):
+        """Forget the loaded dll and every resolved function.
+
+        Names rebound in the namespace are pointed back at their LazyFunction, so the
+        next call loads the dll again through the current loader.
+        """
+        with self._lock:
+            self._handle = None
+            for name, function in self._functions.items():
+                resolved = function._function
+                function._function = None
+                if self._namespace is not None and resolved is not None \
+                        and self._namespace.get(name) is resolved:
+                    self._namespace[name] = function
+
+
+_unset = object()
+
+
+class LazyFunction(object):
+    """Stand-in for a dll function pointer that resolves itself on first call."""
+
+    __slots__ = ('name', '_library', '_function', '_restype', '_argtypes', '_errcheck')
+
+    def __init__(self, library, name, restype=_unset, argtypes=_unset):
+        self.name = name
+        self._library = library
+        self._function = None
+        self._restype = restype
+        self._argtypes = argtypes
+        self._errcheck = _unset
+
+    def __call__(self, *args):
+        function = self._function
+        if function is None:
+            function = self._resolve()
+        return function(*args)
+
+    def __repr__(self):
+        return "<LazyFunction %s of %r>" % (self.name, self._library.path)
+
+    def _resolve(self):
+        handle = self._library.handle
+        # Backends that build functions themselves (rather than looking up an export)
+        # provide foreign_function and need the declared signature up front.
+        foreign_function = getattr(type(handle), 'foreign_function', None)
+        if foreign_function is not None:
+            restype = c_int if self._restype is _unset else self._restype
+            argtypes = None if self._argtypes is _unset else self._argtypes
+            function = foreign_function(handle, self.name, restype, argtypes)
+        else:
+            function = getattr(handle, self.name)
+        if self._restype is not _unset:
+            function.restype = self._restype
+        if self._argtypes is not _unset:
+            function.argtypes = self._argtypes
+        if self._errcheck is not _unset:
+            function.errcheck = self._errcheck
+        self._function = function
+        namespace = self._library._namespace
+        if namespace is not None and namespace.get(self.name) is self:
+            namespace[self.name] = function
+        return function
+
+    def _set(self, attribute, value):
+        setattr(self, '_' + attribute, value)
+        if self._function is not None:
+            setattr(self._function, attribute, value)
+
+    def _clear_errcheck(self):
+        # ctypes only accepts a callable errcheck; deleting it restores the default.
+        self._errcheck = _unset
+        if self._function is not None:
+            try:
+                del self._function.errcheck
+            except AttributeError:
+                pass
+
+    @property
+    def resolved(self):
+        return self._function is not None
+
+    def resolve(self):
+        """Load the dll if needed and return the typed ctypes function."""
+        function = self._function
+        if function is None:
+            function = self._resolve()
+        return function
+
+    @property
+    def restype(self):
+        return None if self._restype is _unset else self._restype
+
+    @restype.setter
+    def restype(self, value):
+        self._set('restype', value)
+
+    @property
+    def argtypes(self):
+        return None if self._argtypes is _unset else self._argtypes
+
+    @argtypes.setter
+    def argtypes(self, value):
+        self._set('argtypes', value)
+
+    @property
+    def errcheck(self):
+        return None if self._errcheck is _unset else self._errcheck
+
+    @errcheck.setter
+    def errcheck(self, value):
+        if value is None:
+            self._clear_errcheck()
+        else:
+            self._set('errcheck', value)
@@ -0,0 +1,440 @@
+"""In-process simulation of the Kinesis dlls.
+
+Every simulated export is a real ctypes function pointer whose target is a Python
+method, so argtypes, restype and errcheck behave exactly as they do against the dlls.
+This replaces the external Kinesis Simulator: devices are added directly with
+add_device or read from a Simulations.Simulations file, and TLI_InitializeSimulations
+becomes a no-op.
+"""
+import os
+import threading
+from collections import deque
+from ctypes import (
+    CFUNCTYPE,
+    Structure,
+    _Pointer,
+    c_char_p,
+    c_short,
+    c_void_p,
+    c_wchar_p,
+    memmove,
+    string_at)
+
+from ..definitions.enumeration import simple_type
+from .virtualclock import VirtualClock
+
+
+FT_InvalidParameter = 6
+FT_DeviceNotFound = 2
+
+
+def _callback_restype(name, restype):
+    # ctypes callbacks can only return simple types. Pointers travel as void* and are
+    # reinterpreted by the caller's restype; structures cannot be returned at all.
+    if restype is None:
+        return None
+    if issubclass(restype, (_Pointer, c_char_p, c_wchar_p)):
+        return c_void_p
+    if issubclass(restype, Structure):
+        raise AttributeError("function %r returns a structure and is not simulated" % name)
+    return simple_type(restype)
+
+
+def _not_found(restype):
+    # Value returned when the serial number is not a simulated device.
+    if restype is c_short:
+        return FT_DeviceNotFound
+    if restype is None or restype is c_void_p:
+        return None
+    return 0
+
+
+class SimulatedDevice(object):
+    """State and generic functions shared by every simulated device.
+
+    Methods are named after the dll export without its family prefix and receive the
+    arguments that follow the serial number, already converted by ctypes.
+    """
+
+    firmware_version = 0x00010000
+    software_version = 0x00010000
+
+    def __init__(self, backend, serial, type_id):
+        self.backend = backend
+        self.serial = serial
+        self.type_id = type_id
+        self.clock = backend.clock
+        self.connected = False
+        self.polling_duration = 0
+        # Queued (message type, message id, message data) tuples.
+        self.messages = deque()
+        # The RegisterMessageCallback function, and the timer that calls it.
+        self.callback = None
+        self._timer = None
+        self._timer_lock = threading.Lock()
+
+    def __repr__(self):
+        return "<%s %s>" % (type(self).__name__, self.serial)
+
+    def status_bits(self, *channel):
+        return 0
+
+    def update(self):
+        """Bring the device up to the clock's current time, queueing any messages."""
+
+    def next_event(self):
+        """Simulated time of the next message the device will queue, or None."""
+        return None
+
+    def schedule(self):
+        """Arrange to call the registered callback when the next message is queued.
+
+        As the dlls do from their polling threads, the callback runs on a timer thread
+        once the device has messages. Only a running clock triggers it: with a manual
+        clock call notify() after advancing.
+        """
+        when = self.next_event() if self.callback is not None and self.clock.speed else None
+        with self._timer_lock:
+            timer = self._timer
+            if timer is not None:
+                if timer.when == when:
+                    return
+                timer.cancel()
+            self._timer = None
+            if when is None:
+                return
+            timer = self._timer = threading.Timer(max(when - self.clock.now(), 0.0) / self.clock.speed, self.notify)
+            timer.when = when
+            timer.daemon = True
+            timer.start()
+
+    def notify(self):
+        """Queue the messages due by now and call the callback if there are any."""
+        with self._timer_lock:
+            self._timer = None
+        self.update()
+        callback = self.callback
+        if callback is not None and self.messages:
+            callback()
+        self.schedule()
+
+    def Open(self):
+        self.connected = True
+        return 0
+
+    def Close(self, *args):
+        self.connected = False
+        self.polling_duration = 0
+        return 0
+
+    def Disconnect(self, *args):
+        return self.Close()
+
+    def CheckConnection(self, *args):
+        return self.connected
+
+    def Identify(self, *args):
+        return 0
+
+    def GetFirmwareVersion(self, *args):
+        return self.firmware_version
+
+    def GetSoftwareVersion(self, *args):
+        return self.software_version
+
+    def GetHardwareInfoBlock(self, *args):
+        info = args[-1]
+        if not isinstance(info, _Pointer):
+            return FT_InvalidParameter
+        info = info.contents
+        info.serialNumber = int(self.serial)
+        info.modelNumber = b'SIM%d' % self.type_id
+        info.type = self.type_id
+        info.firmwareVersion = self.firmware_version
+        info.hardwareVersion = 1
+        info.numChannels = getattr(self, 'channels', 0) or 1
+        return 0
+
+    def StartPolling(self, *args):
+        self.polling_duration = args[-1]
+        return True
+
+    def StopPolling(self, *args):
+        self.polling_duration = 0
+        return 0
+
+    def PollingDuration(self, *args):
+        return self.polling_duration
+
+    def ClearMessageQueue(self, *args):
+        self.messages.clear()
+        return 0
+
+    def MessageQueueSize(self, *args):
+        self.update()
+        return len(self.messages)
+
+    def GetNextMessage(self, *args):
+        # Multi-channel families pass the channel first; their channels share one queue.
+        message_type, message_id, message_data = args[-3:]
+        self.update()
+        try:
+            message = self.messages.popleft()
+        except IndexError:
+            return False
+        for out, value in zip((message_type, message_id, message_data), message):
+            if isinstance(out, _Pointer):
+                out[0] = value
+        return True
+
+    def WaitForMessage(self, *args):
+        # Waits on the virtual clock; a manual clock jumps straight to the next event.
+        self.update()
+        while not self.messages:
+            when = self.next_event()
+            if when is None:
+                return False
+            self.clock.wait_until(when)
+            self.update()
+        return self.GetNextMessage(*args)
+
+    def RegisterMessageCallback(self, *args):
+        # A null function pointer (no callback) is false.
+        self.callback = args[-1] or None
+        self.schedule()
+        return 0
+
+    def GetStatusBits(self, *args):
+        return self.status_bits(*args)
+
+    def RequestStatusBits(self, *args):
+        return 0
+
+    RequestStatus = RequestStatusBits
+    RequestSettings = RequestStatusBits
+
+    def LoadSettings(self, *args):
+        return True
+
+    PersistSettings = LoadSettings
+
+    def EnableChannel(self, *args):
+        return 0
+
+    DisableChannel = EnableChannel
+    Enable = EnableChannel
+    Disable = EnableChannel
+
+
+class SimulatedPiezo(SimulatedDevice):
+    """KCube and TCube piezo controller (PCC_)."""
+
+    def __init__(self, backend, serial, type_id):
+        super().__init__(backend, serial, type_id)
+        self.max_output_voltage = 750
+        self.output_voltage = 0
+        self.position = 0
+        self.position_control_mode = 1
+
+    def GetMaxOutputVoltage(self):
+        return self.max_output_voltage
+
+    def SetMaxOutputVoltage(self, voltage):
+        if voltage not in (750, 1000, 1500):
+            return FT_InvalidParameter
+        self.max_output_voltage = voltage
+        return 0
+
+    def GetOutputVoltage(self):
+        return self.output_voltage
+
+    def SetOutputVoltage(self, voltage):
+        if not -32767 <= voltage <= 32767:
+            return FT_InvalidParameter
+        self.output_voltage = voltage
+        return 0
+
+    def GetPosition(self):
+        return self.position
+
+    def SetPosition(self, position):
+        if not 0 <= position <= 32767:
+            return FT_InvalidParameter
+        self.position = position
+        return 0
+
+    def GetPositionControlMode(self):
+        return self.position_control_mode
+
+    def SetPositionControlMode(self, mode):
+        self.position_control_mode = mode
+        return 0
+
+    def SetZero(self):
+        self.output_voltage = 0
+        self.position = 0
+        return True
+
+
+class SimulatedLibrary(object):
+    """One simulated dll; exports are built on request by LazyFunction."""
+
+    def __init__(self, backend, name, family):
+        self.backend = backend
+        self.name = name
+        self.family = family
+
+    def __repr__(self):
+        return "<SimulatedLibrary %s (%s)>" % (self.name, self.family.__name__)
+
+    def __getattr__(self, name):
+        raise AttributeError("function %r is not simulated" % name)
+
+    def foreign_function(self, name, restype, argtypes):
+        target = self.backend.implementation(name, self.family, restype)
+        prototype = CFUNCTYPE(_callback_restype(name, restype), *(simple_type(argtype) for argtype in argtypes or ()))
+        function = prototype(target)
+        function.__name__ = name
+        function.restype = restype
+        return function
+
+
+class SimulatedBackend(object):
+    """Pure-Python backend exposing the Kinesis exports for simulated devices.
+
+    Devices come from the devices argument (serial numbers, or (serial, type_id)
+    pairs), the Simulations.Simulations file at simulations, or the file named by the
+    PYSCAN_TLK_SIMULATIONS environment variable. Simulated time runs speed times faster
+    than real time, or only when advanced if speed is None; see VirtualClock.
+    """
+
+    name = 'simulated'
+
+    # Device class used for each simulated dll, keyed by lower case dll name.
+    families = {
+        'thorlabs.motioncontrol.kcube.piezo.dll': SimulatedPiezo,
+        'thorlabs.motioncontrol.tcube.piezo.dll': SimulatedPiezo}
+
+    def __init__(self, devices=(), simulations=None, speed=1.0):
+        self.clock = VirtualClock(speed)
+        self._lock = threading.RLock()
+        self._type_ids = {}
+        self._instances = {}
+        self._device_list = []
+        for device in devices:
+            if isinstance(device, (tuple, list)):
+                self.add_device(*device)
+            else:
+                self.add_device(device)
+        if simulations is None:
+            simulations = os.environ.get('PYSCAN_TLK_SIMULATIONS')
+        if simulations:
+            self.load_simulations(simulations)
+
+    def __repr__(self):
+        return "<SimulatedBackend %d devices>" % len(self._type_ids)
+
+    def add_device(self, serial, type_id=None):
+        """Add a simulated device; the type id defaults to the serial's first two digits."""
+        serial = str(serial)
+        if type_id is None:
+            type_id = int(serial[:2])
+        with self._lock:
+            self._type_ids[serial.encode()] = int(type_id)
+
+    def remove_device(self, serial):
+        key = str(serial).encode()
+        with self._lock:
+            self._type_ids.pop(key, None)
+            for devices in self._instances.values():
+                devices.pop(key, None)
+
+    def load_simulations(self, path):
+        """Add the devices listed in a Kinesis Simulator Simulations.Simulations file."""
+        from xml.etree import ElementTree
+        for simulation in ElementTree.parse(path).getroot().iter('Simulation'):
+            self.add_device(simulation.get('SerialNo'), simulation.get('DeviceType'))
+
+    def device(self, serial, family=SimulatedDevice):
+        """Return the simulated device of the given family for serial, or None."""
+        key = serial if isinstance(serial, bytes) else str(serial).encode()
+        devices = self._instances.setdefault(family, {})
+        device = devices.get(key)
+        if device is None:
+            with self._lock:
+                type_id = self._type_ids.get(key)
+                if type_id is None:
+                    return None
+                device = devices.setdefault(key, family(self, key.decode(), type_id))
+        return device
+
+    def load(self, name):
+        family = self.families.get(os.path.basename(name).lower(), SimulatedDevice)
+        return SimulatedLibrary(self, name, family)
+
+    def implementation(self, name, family, restype):
+        """Return the Python callable behind the dll export name."""
+        prefix, _, member = name.partition('_')
+        if prefix == 'TLI':
+            try:
+                return getattr(self, name)
+            except AttributeError:
+                raise AttributeError("function %r is not simulated" % name)
+        method = getattr(family, member, None)
+        if method is None:
+            raise AttributeError("function %r is not simulated" % name)
+        devices = self._instances.setdefault(family, {})
+        missing = _not_found(restype)
+
+        def call(serial, *args):
+            key = string_at(serial)
+            device = devices.get(key) or self.device(key, family)
+            if device is None:
+                return missing
+            return method(device, *args)
+        return call
+
+    def _write_list(self, buffer, size, serials):
+        text = ','.join(serials).encode() + b'\0'
+        if len(text) > size:
+            return FT_InvalidParameter
+        memmove(buffer, text, len(text))
+        return 0
+
+    def TLI_BuildDeviceList(self):
+        with self._lock:
+            self._device_list = sorted(self._type_ids)
+        return 0
+
+    def TLI_GetDeviceListSize(self):
+        return len(self._device_list)
+
+    def TLI_GetDeviceListExt(self, buffer, size):
+        return self._write_list(buffer, size, [serial.decode() for serial in self._device_list])
+
+    def TLI_GetDeviceListByTypeExt(self, buffer, size, type_id):
+        serials = [serial.decode() for serial in self._device_list if self._type_ids.get(serial) == type_id]
+        return self._write_list(buffer, size, serials)
+
+    def TLI_GetDeviceInfo(self, serial, info):
+        # Like the dll, 1 once info is filled and 0 for a device not in the list.
+        key = string_at(serial)
+        type_id = self._type_ids.get(key)
+        if type_id is None or key not in self._device_list:
+            return 0
+        info = info.contents
+        info.typeID = type_id
+        info.serialNo = key
+        info.description = b'Simulated device'
+        info.isKnownType = True
+        return 1
+
+    def TLI_InitializeSimulations(self):
+        return 0
+
+    def TLI_UninitializeSimulations(self):
+        return 0
+
+
+# The motion controllers build on SimulatedDevice and register their dlls in families.
+from . import simulatedmotor  # noqa: E402,F401
@@ -0,0 +1,738 @@
+"""Simulated motion controllers driven by a virtual clock.
+
+Moves follow the trapezoidal velocity profile a controller generates from its
+MOT_VelocityParameters: constant acceleration up to the maximum velocity, a cruise, and
+a symmetric deceleration. Each move is planned analytically when it is commanded, so
+the position and status bits at any instant, and the time its MoveCompleted or Homed
+message is queued, are exact for the chosen parameters however fast the clock runs.
+"""
+import math
+import threading
+from ctypes import Structure, _Pointer
+
+from ..statusbits import MOTOR
+from .simulated import FT_InvalidParameter, SimulatedBackend, SimulatedDevice
+
+
+TL_INVALID_VELOCITY_PARAMETER = 39
+TL_INVALID_CHANNEL = 43
+TL_JOG_CONTINOUS_MODE = 45
+
+# Motor status bits the simulation reports, shared by the DC servo, stepper,
+# brushless and inertial controllers.
+FORWARD_HARDWARE_LIMIT = MOTOR['forward_hardware_limit']
+REVERSE_HARDWARE_LIMIT = MOTOR['reverse_hardware_limit']
+MOVING_FORWARD = MOTOR['moving_forward']
+MOVING_REVERSE = MOTOR['moving_reverse']
+JOGGING_FORWARD = MOTOR['jogging_forward']
+JOGGING_REVERSE = MOTOR['jogging_reverse']
+HOMING = MOTOR['homing']
+HOMED = MOTOR['homed']
+ENABLED = MOTOR['enabled']
+
+# Message type and ids reported through GetNextMessage.
+GENERIC_MOTOR = 2
+HOMED_MESSAGE = 0
+MOVE_COMPLETED = 1
+MOVE_STOPPED = 2
+
+# MOT_TravelDirection, MOT_JogModes and MOT_StopModes values.
+FORWARDS = 1
+REVERSE = 2
+CONTINUOUS_JOG = 1
+SINGLE_STEP_JOG = 2
+STOP_IMMEDIATE = 1
+STOP_PROFILED = 2
+
+
+def profile_duration(distance, velocity, acceleration):
+    """Seconds taken by a trapezoidal move of distance at the given limits.
+
+    The units only need to agree (counts, counts/s and counts/s^2, say); a move too
+    short to reach velocity follows a triangular profile.
+    """
+    distance = abs(distance)
+    if acceleration <= 0:
+        return distance / velocity
+    ramp = velocity / acceleration
+    if acceleration * ramp * ramp >= distance:
+        return 2 * math.sqrt(distance / acceleration)
+    return 2 * ramp + (distance - acceleration * ramp * ramp) / velocity
+
+
+def _trapezoid(start, origin, target, velocity, acceleration):
+    # Phases (start, end, position, velocity, acceleration) of a move from rest to rest.
+    distance = abs(target - origin)
+    direction = 1 if target >= origin else -1
+    if distance == 0:
+        return []
+    if acceleration <= 0:
+        return [(start, start + distance / velocity, origin, direction * velocity, 0.0)]
+    ramp = velocity / acceleration
+    if acceleration * ramp * ramp >= distance:
+        ramp = math.sqrt(distance / acceleration)
+        cruise = 0.0
+    else:
+        cruise = (distance - acceleration * ramp * ramp) / velocity
+    peak = acceleration * ramp
+    phases = []
+    when, position = start, origin
+    for duration, speed, accel in ((ramp, 0.0, acceleration), (cruise, peak, 0.0), (ramp, peak, -acceleration)):
+        if duration > 0:
+            phases.append((when, when + duration, position, direction * speed, direction * accel))
+            position += direction * (speed * duration + accel * duration * duration / 2)
+            when += duration
+    return phases
+
+
+def _ramp(start, origin, speed, acceleration, velocity):
+    # Phases accelerating from speed to velocity (signed) and holding it indefinitely.
+    phases = []
+    if acceleration > 0 and velocity != speed:
+        duration = abs(velocity - speed) / acceleration
+        accel = math.copysign(acceleration, velocity - speed)
+        phases.append((start, start + duration, origin, speed, accel))
+        origin += speed * duration + accel * duration * duration / 2
+        start += duration
+    phases.append((start, math.inf, origin, velocity, 0.0))
+    return phases
+
+
+def _write(out, value):
+    # Out-parameters can only be filled when declared by reference; a by-value copy is
+    # discarded by ctypes, exactly as the dll would leave the caller's variable alone.
+    if isinstance(out, _Pointer):
+        out[0] = value
+
+
+def _contents(argument):
+    # A structure argument, passed by value or (as the dlls declare) by reference.
+    return argument.contents if isinstance(argument, _Pointer) else argument
+
+
+def _fill(out, **fields):
+    out = _contents(out)
+    if isinstance(out, Structure):
+        for name, value in fields.items():
+            setattr(out, name, value)
+
+
+class Move(object):
+    """A commanded move: its profile phases and what it reports on completion."""
+
+    __slots__ = ('kind', 'direction', 'phases', 'end', 'target', 'message')
+
+    def __init__(self, kind, direction, phases, target, message=MOVE_COMPLETED):
+        self.kind = kind
+        self.direction = direction
+        self.phases = phases
+        self.end = phases[-1][1] if phases else -math.inf
+        self.target = target
+        self.message = message
+
+    def __repr__(self):
+        return "<Move %s to %s ending %.6fs>" % (self.kind, self.target, self.end)
+
+
+class SimulatedAxis(object):
+    """One motor channel, in counts (encoder counts, microsteps or inertial steps).
+
+    Velocity parameters are stored in device units as the dll reports them and
+    converted with the controller's velocity_scale and acceleration_scale.
+    """
+
+    def __init__(self, device):
+        self.device = device
+        self.clock = device.clock
+        self.enabled = True
+        self.homed = False
+        self.position = 0.0
+        self.move = None
+        self.velocity = device.default_velocity
+        self.acceleration = device.default_acceleration
+        self.min_velocity = 0
+        self.homing_velocity = device.default_homing_velocity
+        self.backlash = device.default_backlash
+        self.jog_mode = SINGLE_STEP_JOG
+        self.jog_stop_mode = STOP_PROFILED
+        self.jog_step_size = device.default_jog_step
+        self.jog_velocity = device.default_velocity
+        self.jog_acceleration = device.default_acceleration
+        self.move_absolute_position = 0
+        self.move_relative_distance = 0
+        self.motor_params = device.default_motor_params
+
+    def __repr__(self):
+        return "<SimulatedAxis %s at %d>" % (self.device.serial, self.get_position())
+
+    def state(self, now=None):
+        """Return (position, velocity) in counts and counts/s at now."""
+        move = self.move
+        if move is None:
+            return self.position, 0.0
+        if now is None:
+            now = self.clock.now()
+        if now >= move.end:
+            return move.target, 0.0
+        for start, end, position, velocity, acceleration in move.phases:
+            if now < end:
+                elapsed = max(now - start, 0.0)
+                return (position + velocity * elapsed + acceleration * elapsed * elapsed / 2,
+                        velocity + acceleration * elapsed)
+        return move.target, 0.0
+
+    def get_position(self):
+        return int(round(self.state()[0]))
+
+    def status_bits(self, now=None):
+        if now is None:
+            now = self.clock.now()
+        bits = ENABLED if self.enabled else 0
+        if self.homed:
+            bits |= HOMED
+        move = self.move
+        if move is not None and now < move.end:
+            if move.kind == 'home':
+                bits |= HOMING
+            elif move.kind == 'jog':
+                bits |= JOGGING_FORWARD if move.direction > 0 else JOGGING_REVERSE
+            bits |= MOVING_FORWARD if move.direction > 0 else MOVING_REVERSE
+        return bits
+
+    def finish(self):
+        """Complete the current move and return its (type, id, data) message."""
+        move, self.move = self.move, None
+        self.position = move.target
+        if move.kind == 'home':
+            self.homed = True
+        return GENERIC_MOTOR, move.message, 0
+
+    def _limits(self, velocity, acceleration):
+        device = self.device
+        return velocity / device.velocity_scale, acceleration / device.acceleration_scale
+
+    def _start(self, now):
+        # Where a new move starts: a move in progress is first brought to rest with a
+        # profiled stop rather than blending into the new profile.
+        position, speed = self.state(now)
+        phases = []
+        if speed:
+            phases = self._deceleration(now, position, speed)
+            now, position = phases[-1][1], self._end_position(phases[-1])
+        return now, position, phases
+
+    def _deceleration(self, now, position, speed):
+        acceleration = self._limits(0, self.acceleration)[1]
+        if acceleration <= 0:
+            return [(now, now, position, 0.0, 0.0)]
+        return [(now, now + abs(speed) / acceleration, position, speed, -math.copysign(acceleration, speed))]
+
+    @staticmethod
+    def _end_position(phase):
+        start, end, position, velocity, acceleration = phase
+        duration = end - start
+        return position + velocity * duration + acceleration * duration * duration / 2
+
+    def move_to(self, target, kind='move', velocity=None, acceleration=None, message=MOVE_COMPLETED):
+        if not self.enabled:
+            return 0
+        if velocity is None:
+            velocity, acceleration = self.velocity, self.acceleration
+        velocity, acceleration = self._limits(velocity, acceleration)
+        if velocity <= 0:
+            return TL_INVALID_VELOCITY_PARAMETER
+        now, position, phases = self._start(self.clock.now())
+        direction = 1 if target >= position else -1
+        if direction < 0 and self.backlash and kind != 'home':
+            # Approach reverse moves from below: overshoot by the backlash distance and
+            # come back, so every move ends travelling forwards.
+            overshoot = _trapezoid(now, position, target - self.backlash, velocity, acceleration)
+            if overshoot:
+                now = overshoot[-1][1]
+            phases += overshoot + _trapezoid(now, target - self.backlash, target, velocity, acceleration)
+        else:
+            phases += _trapezoid(now, position, target, velocity, acceleration)
+        if kind == 'home':
+            self.homed = False
+        self.move = Move(kind, direction, phases or [(now, now, target, 0.0, 0.0)], target, message)
+        return 0
+
+    def move_at(self, direction, kind='velocity', velocity=None, acceleration=None):
+        if not self.enabled:
+            return 0
+        if velocity is None:
+            velocity, acceleration = self.velocity, self.acceleration
+        velocity, acceleration = self._limits(velocity, acceleration)
+        if velocity <= 0:
+            return TL_INVALID_VELOCITY_PARAMETER
+        now = self.clock.now()
+        position, speed = self.state(now)
+        phases = _ramp(now, position, speed, acceleration, direction * velocity)
+        self.move = Move(kind, direction, phases, None)
+        return 0
+
+    def jog(self, direction, step=None):
+        if self.jog_mode == CONTINUOUS_JOG:
+            return self.move_at(direction, 'jog', self.jog_velocity, self.jog_acceleration)
+        if self.jog_mode != SINGLE_STEP_JOG:
+            return TL_JOG_CONTINOUS_MODE
+        if step is None:
+            step = self.jog_step_size
+        # A step commanded during a step jog extends it, as repeated jog button presses do.
+        move = self.move
+        origin = move.target if move is not None and move.kind == 'jog' and move.target is not None \
+            else self.state()[0]
+        return self.move_to(origin + direction * step, 'jog', self.jog_velocity, self.jog_acceleration)
+
+    def home(self):
+        return self.move_to(0, 'home', self.homing_velocity, self.acceleration, HOMED_MESSAGE)
+
+    def stop(self, mode=STOP_PROFILED):
+        move = self.move
+        if move is None:
+            return 0
+        now = self.clock.now()
+        position, speed = self.state(now)
+        if mode == STOP_IMMEDIATE or not speed:
+            self.move = Move('stop', move.direction, [(now, now, position, 0.0, 0.0)], position, MOVE_STOPPED)
+        else:
+            phases = self._deceleration(now, position, speed)
+            self.move = Move('stop', move.direction, phases, self._end_position(phases[-1]), MOVE_STOPPED)
+        return 0
+
+
+def _set_velocity(axis, acceleration, velocity):
+    if velocity <= 0 or acceleration < 0:
+        return TL_INVALID_VELOCITY_PARAMETER
+    axis.acceleration, axis.velocity = acceleration, velocity
+    return 0
+
+
+class SimulatedMotor(SimulatedDevice):
+    """Single channel DC servo controller (KCube and TCube DC servo, KVS_ and CC_).
+
+    Subclasses set the device unit scales and defaults of the other motion families;
+    channels is the number of channels of families whose functions take one.
+    """
+
+    channels = 0
+    # Device units per count/s and per count/s^2, and defaults in counts.
+    velocity_scale = 22.369621
+    acceleration_scale = 0.0076355
+    default_velocity = 79476 * velocity_scale
+    default_acceleration = 51832 * acceleration_scale
+    default_homing_velocity = 34555 * velocity_scale
+    default_backlash = 1728
+    default_jog_step = 3455
+    # GetMotorParamsExt: steps per revolution, gearbox ratio and pitch of a Z8 stage,
+    # and the counts of each step.
+    default_motor_params = (512.0, 67.49, 1.0)
+    microsteps = 1
+
+    def __init__(self, backend, serial, type_id):
+        super().__init__(backend, serial, type_id)
+        self.clock = backend.clock
+        self.lock = threading.RLock()
+        self.axes = {}
+
+    def axis(self, channel=1):
+        axis = self.axes.get(channel)
+        if axis is None:
+            axis = self.axes.setdefault(channel, SimulatedAxis(self))
+        return axis
+
+    def _split(self, args):
+        # The axis addressed by a call, and the arguments after the channel if any.
+        if not self.channels:
+            return self.axis(), args
+        channel = args[0]
+        if not 1 <= channel <= self.channels:
+            return None, args[1:]
+        return self.axis(channel), args[1:]
+
+    def update(self):
+        """Queue the messages of every move that has completed by now."""
+        now = self.clock.now()
+        with self.lock:
+            finished = sorted((axis.move.end, channel) for channel, axis in self.axes.items()
+                              if axis.move is not None and axis.move.end <= now)
+            for end, channel in finished:
+                self.messages.append(self.axes[channel].finish())
+
+    def next_event(self):
+        ends = [axis.move.end for axis in self.axes.values() if axis.move is not None]
+        return min(ends) if ends else None
+
+    def _command(self, args, action):
+        axis, args = self._split(args)
+        if axis is None:
+            return TL_INVALID_CHANNEL
+        self.update()
+        with self.lock:
+            result = action(axis, *args)
+        self.schedule()
+        return result
+
+    def status_bits(self, *args):
+        axis, _ = self._split(args)
+        if axis is None:
+            return 0
+        self.update()
+        return axis.status_bits()
+
+    def GetPosition(self, *args):
+        axis, _ = self._split(args)
+        return 0 if axis is None else axis.get_position()
+
+    GetPositionCounter = GetPosition
+
+    def SetPositionCounter(self, *args):
+        def set_counter(axis, count):
+            axis.position = count
+            return 0
+        return self._command(args, set_counter)
+
+    def RequestPosition(self, *args):
+        return 0
+
+    def MoveToPosition(self, *args):
+        return self._command(args, SimulatedAxis.move_to)
+
+    def MoveRelative(self, *args):
+        return self._command(args, lambda axis, distance: axis.move_to(axis.state()[0] + distance))
+
+    def SetMoveAbsolutePosition(self, *args):
+        return self._command(args, lambda axis, position: setattr(axis, 'move_absolute_position', position) or 0)
+
+    def GetMoveAbsolutePosition(self, *args):
+        return self._command(args, lambda axis: axis.move_absolute_position)
+
+    def MoveAbsolute(self, *args):
+        return self._command(args, lambda axis: axis.move_to(axis.move_absolute_position))
+
+    def SetMoveRelativeDistance(self, *args):
+        return self._command(args, lambda axis, distance: setattr(axis, 'move_relative_distance', distance) or 0)
+
+    def GetMoveRelativeDistance(self, *args):
+        return self._command(args, lambda axis: axis.move_relative_distance)
+
+    def MoveRelativeDistance(self, *args):
+        return self._command(args, lambda axis: axis.move_to(axis.state()[0] + axis.move_relative_distance))
+
+    def MoveJog(self, *args):
+        return self._command(args, lambda axis, direction: axis.jog(1 if direction == FORWARDS else -1))
+
+    def MoveAtVelocity(self, *args):
+        return self._command(args, lambda axis, direction: axis.move_at(1 if direction == FORWARDS else -1))
+
+    def Home(self, *args):
+        return self._command(args, SimulatedAxis.home)
+
+    def StopImmediate(self, *args):
+        return self._command(args, lambda axis: axis.stop(STOP_IMMEDIATE))
+
+    def StopProfiled(self, *args):
+        return self._command(args, lambda axis: axis.stop(STOP_PROFILED))
+
+    def CanHome(self, *args):
+        return True
+
+    def CanMoveWithoutHomingFirst(self, *args):
+        return True
+
+    def NeedsHoming(self, *args):
+        return self._command(args, lambda axis: not axis.homed)
+
+    def EnableChannel(self, *args):
+        return self._command(args, lambda axis: setattr(axis, 'enabled', True) or 0)
+
+    def DisableChannel(self, *args):
+        def disable(axis):
+            axis.stop(STOP_IMMEDIATE)
+            axis.enabled = False
+            return 0
+        return self._command(args, disable)
+
+    def SetVelParams(self, *args):
+        return self._command(args, _set_velocity)
+
+    def GetVelParams(self, *args):
+        def get_velocity(axis, acceleration, velocity):
+            _write(acceleration, int(axis.acceleration))
+            _write(velocity, int(axis.velocity))
+            return 0
+        return self._command(args, get_velocity)
+
+    def SetVelParamsBlock(self, *args):
+        params = _contents(args[-1])
+        return self._command(args[:-1] + (params.acceleration, params.maxVelocity), _set_velocity)
+
+    def GetVelParamsBlock(self, *args):
+        def get_block(axis, params):
+            _fill(params, minVelocity=axis.min_velocity, acceleration=int(axis.acceleration),
+                  maxVelocity=int(axis.velocity))
+            return 0
+        return self._command(args, get_block)
+
+    def SetJogVelParams(self, *args):
+        def set_jog_velocity(axis, acceleration, velocity):
+            if velocity <= 0 or acceleration < 0:
+                return TL_INVALID_VELOCITY_PARAMETER
+            axis.jog_acceleration, axis.jog_velocity = acceleration, velocity
+            return 0
+        return self._command(args, set_jog_velocity)
+
+    def GetJogVelParams(self, *args):
+        def get_jog_velocity(axis, acceleration, velocity):
+            _write(acceleration, int(axis.jog_acceleration))
+            _write(velocity, int(axis.jog_velocity))
+            return 0
+        return self._command(args, get_jog_velocity)
+
+    def SetJogMode(self, *args):
+        def set_jog_mode(axis, mode, stop_mode):
+            if mode not in (CONTINUOUS_JOG, SINGLE_STEP_JOG) or stop_mode not in (STOP_IMMEDIATE, STOP_PROFILED):
+                return FT_InvalidParameter
+            axis.jog_mode, axis.jog_stop_mode = mode, stop_mode
+            return 0
+        return self._command(args, set_jog_mode)
+
+    def GetJogMode(self, *args):
+        def get_jog_mode(axis, mode, stop_mode):
+            _write(mode, axis.jog_mode)
+            _write(stop_mode, axis.jog_stop_mode)
+            return 0
+        return self._command(args, get_jog_mode)
+
+    def SetJogStepSize(self, *args):
+        return self._command(args, lambda axis, step: setattr(axis, 'jog_step_size', step) or 0)
+
+    def GetJogStepSize(self, *args):
+        return self._command(args, lambda axis: axis.jog_step_size)
+
+    def SetJogParamsBlock(self, *args):
+        def set_jog(axis, params):
+            params = _contents(params)
+            velocity = params.velParams
+            if velocity.maxVelocity <= 0 or velocity.acceleration < 0:
+                return TL_INVALID_VELOCITY_PARAMETER
+            if params.mode not in (CONTINUOUS_JOG, SINGLE_STEP_JOG):
+                return FT_InvalidParameter
+            # Enumeration fields read back as views of the caller's structure; keep their values.
+            axis.jog_mode, axis.jog_stop_mode = params.mode.value, params.stopMode.value
+            axis.jog_step_size = params.stepSize
+            axis.jog_acceleration, axis.jog_velocity = velocity.acceleration, velocity.maxVelocity
+            return 0
+        return self._command(args, set_jog)
+
+    def GetJogParamsBlock(self, *args):
+        def get_jog(axis, params):
+            params = _contents(params)
+            _fill(params, mode=axis.jog_mode, stepSize=axis.jog_step_size, stopMode=axis.jog_stop_mode)
+            _fill(params.velParams, minVelocity=0, acceleration=int(axis.jog_acceleration),
+                  maxVelocity=int(axis.jog_velocity))
+            return 0
+        return self._command(args, get_jog)
+
+    def SetMotorParamsExt(self, *args):
+        def set_motor_params(axis, *params):
+            if len(params) != len(axis.motor_params) or any(value <= 0 for value in params):
+                return FT_InvalidParameter
+            axis.motor_params = params
+            return 0
+        return self._command(args, set_motor_params)
+
+    def GetMotorParamsExt(self, *args):
+        def get_motor_params(axis, *outs):
+            for out, value in zip(outs, axis.motor_params):
+                _write(out, value)
+            return 0
+        return self._command(args, get_motor_params)
+
+    def _unit_scale(self, axis, unit_type):
+        # Device units per real unit of position (0), velocity (1) or acceleration (2).
+        if len(axis.motor_params) == 1:
+            counts = axis.motor_params[0]
+        else:
+            steps_per_rev, gearbox_ratio, pitch = axis.motor_params
+            counts = steps_per_rev * self.microsteps * gearbox_ratio / pitch
+        return counts * (1.0, self.velocity_scale, self.acceleration_scale)[unit_type]
+
+    def GetDeviceUnitFromRealValue(self, *args):
+        def to_device(axis, value, out, unit_type):
+            if unit_type not in (0, 1, 2):
+                return FT_InvalidParameter
+            scaled = value * self._unit_scale(axis, unit_type)
+            _write(out, math.trunc(scaled + math.copysign(0.5, scaled)))
+            return 0
+        return self._command(args, to_device)
+
+    def GetRealValueFromDeviceUnit(self, *args):
+        def to_real(axis, device_unit, out, unit_type):
+            if unit_type not in (0, 1, 2):
+                return FT_InvalidParameter
+            _write(out, device_unit / self._unit_scale(axis, unit_type))
+            return 0
+        return self._command(args, to_real)
+
+    def SetBacklash(self, *args):
+        return self._command(args, lambda axis, distance: setattr(axis, 'backlash', distance) or 0)
+
+    def GetBacklash(self, *args):
+        return self._command(args, lambda axis: axis.backlash)
+
+    def SetHomingVelocity(self, *args):
+        def set_homing_velocity(axis, velocity):
+            if velocity <= 0:
+                return TL_INVALID_VELOCITY_PARAMETER
+            axis.homing_velocity = velocity
+            return 0
+        return self._command(args, set_homing_velocity)
+
+    def GetHomingVelocity(self, *args):
+        return self._command(args, lambda axis: int(axis.homing_velocity))
+
+    def SetHomingParamsBlock(self, *args):
+        return self.SetHomingVelocity(*(args[:-1] + (_contents(args[-1]).velocity,)))
+
+    def GetHomingParamsBlock(self, *args):
+        def get_homing(axis, params):
+            _fill(params, direction=REVERSE, limitSwitch=1, offsetDistance=0, velocity=int(axis.homing_velocity))
+            return 0
+        return self._command(args, get_homing)
+
+
+class SimulatedStepperMotor(SimulatedMotor):
+    """KCube and TCube stepper (SCC_) and integrated stepper (ISC_) controllers, in microsteps."""
+
+    velocity_scale = 53.687091
+    acceleration_scale = 0.0109951
+    default_velocity = 409600 * velocity_scale
+    default_acceleration = 409600 * acceleration_scale
+    default_homing_velocity = 409600 * velocity_scale
+    default_backlash = 20480
+    default_jog_step = 40960
+    default_motor_params = (200.0, 1.0, 1.0)
+    microsteps = 2048
+
+
+class SimulatedBrushlessMotor(SimulatedMotor):
+    """KCube and TCube brushless controller (BMC_), addressed by channel."""
+
+    channels = 1
+    velocity_scale = 6.7108864
+    acceleration_scale = 0.00068719
+    default_velocity = 200000 * velocity_scale
+    default_acceleration = 10000000 * acceleration_scale
+    default_homing_velocity = 20000 * velocity_scale
+    default_backlash = 0
+    default_jog_step = 2000
+    # Brushless controllers report a single counts per real unit.
+    default_motor_params = (20000.0,)
+
+
+class SimulatedBenchtopBrushlessMotor(SimulatedBrushlessMotor):
+    """Benchtop brushless controller (BMC_) with up to three channels."""
+
+    channels = 3
+
+
+class SimulatedInertialMotor(SimulatedMotor):
+    """KCube inertial motor controller (KIM_), four channels of piezo inertial drive.
+
+    Positions are steps; the drive parameters give the step rate and acceleration in
+    steps/s and steps/s^2 directly, and there is no backlash correction.
+    """
+
+    channels = 4
+    velocity_scale = 1.0
+    acceleration_scale = 1.0
+    default_velocity = 500
+    default_acceleration = 100000
+    default_homing_velocity = 500
+    default_backlash = 0
+    default_jog_step = 100
+
+    def GetCurrentPosition(self, *args):
+        return self.GetPosition(*args)
+
+    def SetPosition(self, *args):
+        return self.SetPositionCounter(*args)
+
+    def ZeroPosition(self, *args):
+        return self._command(args, lambda axis: setattr(axis, 'position', 0) or 0)
+
+    def MoveAbsolute(self, *args):
+        return self.MoveToPosition(*args)
+
+    def MoveJog(self, *args):
+        # KIM_TravelDirection: Forward = 1, Reverse = 2.
+        def jog(axis, direction):
+            if direction == FORWARDS:
+                return axis.jog(1, axis.jog_step_size)
+            return axis.jog(-1, axis.jog_step_size_reverse)
+        return self._command(args, jog)
+
+    def MoveStop(self, *args):
+        return self.StopProfiled(*args)
+
+    def SetDriveOPParameters(self, *args):
+        def set_drive(axis, max_voltage, step_rate, step_acceleration):
+            return _set_velocity(axis, step_acceleration, step_rate)
+        return self._command(args, set_drive)
+
+    def SetDriveOPParametersStruct(self, *args):
+        params = _contents(args[-1])
+        return self.SetDriveOPParameters(*(args[:-1] + (params.maxVoltage, params.stepRate, params.stepAcceleration)))
+
+    def GetDriveOPParametersStruct(self, *args):
+        def get_drive(axis, params):
+            _fill(params, maxVoltage=110, stepRate=int(axis.velocity), stepAcceleration=int(axis.acceleration))
+            return 0
+        return self._command(args, get_drive)
+
+    def SetJogParameters(self, *args):
+        def set_jog(axis, mode, step_forward, step_reverse, step_rate, step_acceleration):
+            if mode not in (CONTINUOUS_JOG, SINGLE_STEP_JOG):
+                return FT_InvalidParameter
+            if step_rate <= 0 or step_acceleration < 0:
+                return TL_INVALID_VELOCITY_PARAMETER
+            axis.jog_mode = mode
+            axis.jog_step_size, axis.jog_step_size_reverse = step_forward, step_reverse
+            axis.jog_velocity, axis.jog_acceleration = step_rate, step_acceleration
+            return 0
+        return self._command(args, set_jog)
+
+    def SetJogParametersStruct(self, *args):
+        params = _contents(args[-1])
+        return self.SetJogParameters(*(args[:-1] + (
+            params.jogMode.value, params.jogStepSizeFwd, params.jogStepSizeRev, params.jogStepRate,
+            params.jogStepAcceleration)))
+
+    def GetJogParametersStruct(self, *args):
+        def get_jog(axis, params):
+            _fill(params, jogMode=axis.jog_mode, jogStepSizeFwd=axis.jog_step_size,
+                  jogStepSizeRev=axis.jog_step_size_reverse, jogStepRate=int(axis.jog_velocity),
+                  jogStepAcceleration=int(axis.jog_acceleration))
+            return 0
+        return self._command(args, get_jog)
+
+    def axis(self, channel=1):
+        axis = self.axes.get(channel)
+        if axis is None:
+            axis = SimulatedAxis(self)
+            axis.jog_step_size_reverse = axis.jog_step_size
+            axis = self.axes.setdefault(channel, axis)
+        return axis
+
+
+SimulatedBackend.families.update({
+    'thorlabs.motioncontrol.kcube.dcservo.dll': SimulatedMotor,
+    'thorlabs.motioncontrol.tcube.dcservo.dll': SimulatedMotor,
+    'thorlabs.motioncontrol.kcube.steppermotor.dll': SimulatedStepperMotor,
+    'thorlabs.motioncontrol.tcube.steppermotor.dll': SimulatedStepperMotor,
+    'thorlabs.motioncontrol.integratedsteppermotors.dll': SimulatedStepperMotor,
+    'thorlabs.motioncontrol.kcube.brushlessmotor.dll': SimulatedBrushlessMotor,
+    'thorlabs.motioncontrol.tcube.brushlessmotor.dll': SimulatedBrushlessMotor,
+    'thorlabs.motioncontrol.benchtop.brushlessmotor.dll': SimulatedBenchtopBrushlessMotor,
+    'thorlabs.motioncontrol.kcube.inertialmotor.dll': SimulatedInertialMotor})
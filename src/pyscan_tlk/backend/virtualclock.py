@@ -0,0 +1,54 @@
+import threading
+import time
+
+
+class VirtualClock(object):
+    """Simulated time in seconds.
+
+    The clock runs speed times faster than real time, so speed=100 rehearses an
+    hour-long scan in 36 seconds. With speed=None the clock only moves when advanced,
+    either explicitly or by a simulated WaitForMessage skipping to the next event,
+    which runs a scan as fast as the host can execute its calls.
+    """
+
+    def __init__(self, speed=1.0):
+        self._lock = threading.Lock()
+        self._speed = speed
+        self._origin = time.perf_counter()
+        self._offset = 0.0
+
+    def __repr__(self):
+        return "<VirtualClock %.6fs x%s>" % (self.now(), self._speed)
+
+    def now(self):
+        if not self._speed:
+            return self._offset
+        return self._offset + (time.perf_counter() - self._origin) * self._speed
+
+    @property
+    def speed(self):
+        return self._speed
+
+    @speed.setter
+    def speed(self, speed):
+        with self._lock:
+            self._offset = self.now()
+            self._origin = time.perf_counter()
+            self._speed = speed
+
+    def advance(self, seconds):
+        """Move simulated time forward by seconds without waiting."""
+        with self._lock:
+            self._offset += seconds
+
+    def sleep(self, seconds):
+        """Let seconds of simulated time pass."""
+        if self._speed:
+            time.sleep(seconds / self._speed)
+        else:
+            self.advance(seconds)
+
+    def wait_until(self, when):
+        delay = when - self.now()
+        if delay > 0:
+            self.sleep(delay)
@@ -0,0 +1,5 @@
+from ctypes import CFUNCTYPE
+
+# void (*functionPointer)(), called by the dlls when a device queues a message. The
+# dlls are built __cdecl, so the callbacks are CFUNCTYPE on every platform.
+MessageCallback = CFUNCTYPE(None)
@@ -0,0 +1,87 @@
+"""NumPy structured dtypes of the ctypes structures in definitions.structures.
+
+dtype_of derives, once per structure, a dtype with the structure's field names,
+offsets and size: nested structures become nested dtypes, char arrays fixed-width
+byte strings ('S65') and enumerations their plain integer type. as_array and
+as_structures convert between ctypes structures and structured ndarrays without
+copying, so thousands of readings or parameter snapshots can be analysed as columns:
+
+    readings = (QD_Readings * 10000)()
+    for reading in readings:
+        tcubequad.QD_GetReading(serial_number, reading)
+    table = as_array(readings)                 # a view of the same memory
+    table['posDifference']['x'].mean()
+
+    log = numpy.zeros(10000, dtype_of(MOT_VelocityParameters))
+    kcubedcservo.KVS_GetVelParamsBlock(serial_number, as_structures(log, MOT_VelocityParameters)[0])
+"""
+import functools
+from ctypes import Array, Structure, c_char, sizeof
+
+import numpy
+
+from . import structures
+from .enumeration import simple_type
+
+
+def _format(ctype):
+    # NumPy format of a field of type ctype.
+    if issubclass(ctype, Structure):
+        return _dtype(ctype)
+    if issubclass(ctype, Array):
+        if ctype._type_ is c_char:
+            return numpy.dtype('S%d' % ctype._length_)
+        return numpy.dtype((_format(ctype._type_), (ctype._length_,)))
+    return numpy.dtype(simple_type(ctype))
+
+
+def dtype_of(structure):
+    """Structured dtype with the layout of structure, a Structure subclass or its name."""
+    if isinstance(structure, str):
+        structure = getattr(structures, structure)
+    return _dtype(structure)
+
+
+@functools.lru_cache(maxsize=None)
+def _dtype(structure):
+    names = [field[0] for field in structure._fields_]
+    return numpy.dtype({
+        'names': names,
+        'formats': [_format(field[1]) for field in structure._fields_],
+        'offsets': [getattr(structure, name).offset for name in names],
+        'itemsize': sizeof(structure),
+        'aligned': True})
+
+
+def _element(ctype):
+    # The structure type and shape of a ctypes (possibly nested) array of structures.
+    shape = []
+    while issubclass(ctype, Array):
+        shape.append(ctype._length_)
+        ctype = ctype._type_
+    if not issubclass(ctype, Structure):
+        raise TypeError("%s is not a structure or array of structures" % ctype.__name__)
+    return ctype, tuple(shape)
+
+
+def as_array(value):
+    """Structured ndarray viewing the memory of a structure or ctypes array of structures.
+
+    A single structure gives a 0-d array. Writes through the array change the
+    structures, and the array keeps them alive.
+    """
+    structure, shape = _element(type(value))
+    return numpy.frombuffer(value, _dtype(structure)).reshape(shape)
+
+
+def as_structures(array, structure):
+    """ctypes array of structure viewing the memory of a structured ndarray.
+
+    array must be writable, C-contiguous and have the layout of dtype_of(structure);
+    the result keeps it alive.
+    """
+    if array.dtype != dtype_of(structure):
+        raise ValueError("array of %s is not laid out as %s" % (array.dtype, structure.__name__))
+    if not array.flags.c_contiguous:
+        raise ValueError("array is not C-contiguous")
+    return (structure * array.size).from_buffer(array)
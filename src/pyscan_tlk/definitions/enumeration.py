@@ -1,48 +1,164 @@
-from ctypes import c_uint
-
-
-class EnumerationType(type(c_uint)):
-    def __new__(metacls, name, bases, dict):
-        if "_members_" not in dict:
-            _members_ = {}
-            for key, value in dict.items():
-                if not key.startswith("_"):
-                    _members_[key] = value
-            dict["_members_"] = _members_
-        cls = type(c_uint).__new__(metacls, name, bases, dict)
-        for key, value in cls._members_.items():
-            globals()[key] = value
+from ctypes import (
+    _SimpleCData,
+    c_byte,
+    c_int,
+    c_long,
+    c_longlong,
+    c_short,
+    c_ubyte,
+    c_uint,
+    c_ulong,
+    c_ulonglong,
+    c_ushort)
+
+# Plain ctypes integer type for each _type_ code.
+_simple_types = dict((ctype._type_, ctype) for ctype in (
+    c_byte, c_ubyte, c_short, c_ushort, c_int, c_uint, c_long, c_ulong, c_longlong, c_ulonglong))
+
+
+class EnumerationType(type(c_int)):
+    """Metaclass building the lookup tables of an Enumeration.
+
+    Integer class attributes become the members: _members_ maps each name to its
+    value and _names_ each value to the first name declared with it, so lookups in
+    either direction are a single dict access. _type_ may be given as a ctypes type.
+    """
+
+    def __new__(metacls, name, bases, namespace):
+        if isinstance(namespace.get('_type_'), type):
+            namespace['_type_'] = namespace['_type_']._type_
+        members = {}
+        for key, value in list(namespace.items()):
+            if not key.startswith('_') and isinstance(value, int) and not isinstance(value, bool):
+                members[key] = value
+        cls = super().__new__(metacls, name, bases, namespace)
+        cls._members_ = members
+        cls._names_ = {}
+        cls._table_ = None
+        for key, value in members.items():
+            cls._names_.setdefault(value, key)
+            setattr(cls, key, cls(value))
         return cls
 
-    def __contains__(self, value):
-        return value in self._members_.values()
+    def __contains__(cls, value):
+        return getattr(value, 'value', value) in cls._names_
 
-    def __repr__(self):
-        return "<Enumeration %s>" % self.__name__
+    def __getitem__(cls, name):
+        """The member called name."""
+        if name not in cls._members_:
+            raise KeyError("%s has no member %r" % (cls.__name__, name))
+        return getattr(cls, name)
 
+    def __iter__(cls):
+        return (getattr(cls, name) for name in cls._members_)
 
-class Enumeration(c_uint):
-    __metaclass__ = EnumerationType
-    _members_ = {}
+    def __len__(cls):
+        return len(cls._members_)
 
-    def __init__(self, value):
-        for k, v in self._members_.items():
-            if v == value:
-                self.name = k
-                break
-        else:
-            raise ValueError("No enumeration member with value %r" % value)
-        c_uint.__init__(self, value)
-
-    @classmethod
-    def from_param(cls, param):
-        if isinstance(param, Enumeration):
-            if param.__class__ != cls:
-                raise ValueError("Cannot mix enumeration members")
-            else:
-                return param
+    def __repr__(cls):
+        return "<Enumeration %s>" % cls.__name__
+
+    def name_of(cls, value, default=None):
+        """The name of value, a raw integer or a ctypes instance, or default."""
+        return cls._names_.get(getattr(value, 'value', value), default)
+
+    def decode(cls, values, default=None):
+        """The names of a sequence or array of raw values, default where unknown.
+
+        A NumPy array (or anything with __array__) is decoded without a Python loop
+        into an object array of names of the same shape; other sequences give a list.
+        """
+        if not hasattr(values, '__array__'):
+            names = cls._names_
+            return [names.get(getattr(value, 'value', value), default) for value in values]
+        import numpy
+        values = numpy.asarray(values)
+        if values.ndim == 0:
+            return cls.name_of(values.item(), default)
+        if cls._table_ is None:
+            cls._table_ = cls._lookup_table(numpy)
+        keys, lowest, names = cls._table_
+        if keys is None:
+            index = values.astype(numpy.int64) - lowest
+            index[(index < 0) | (index >= len(names))] = -1
         else:
-            return cls(param)
+            index = numpy.searchsorted(keys, values)
+            index[index == len(keys)] = -1
+            index[keys[index] != values] = -1
+        decoded = names[index]
+        if default is not None:
+            decoded[decoded == None] = default  # noqa: E711
+        return decoded
+
+    def _lookup_table(cls, numpy):
+        # Names indexed by value - lowest, ending in None for values that are not
+        # members. Enumerations with values far apart, like bit flags, look their
+        # values up in sorted keys instead and index the names by position.
+        lowest = min(cls._names_, default=0)
+        span = max(cls._names_, default=0) - lowest + 1
+        if span <= 4096:
+            names = numpy.full(span + 1, None, dtype=object)
+            for value, name in cls._names_.items():
+                names[value - lowest] = name
+            return None, lowest, names
+        keys = sorted(cls._names_)
+        names = numpy.array([cls._names_[key] for key in keys] + [None], dtype=object)
+        return numpy.array(keys, dtype=numpy.int64), lowest, names
+
+    def _member_map_(cls):
+        # Name to member, for module level names.
+        return {name: getattr(cls, name) for name in cls._members_}
+
+
+class Enumeration(c_int, metaclass=EnumerationType):
+    """A C enum: a ctypes integer type whose members are named instances.
+
+    A subclass gives its C type as _type_ (int unless stated) and its members as
+    integer class attributes, which become instances of the subclass. The class can
+    be used wherever the C type can, in argtypes, restype or _fields_: members and
+    plain integers pass as arguments, functions return plain integers, and fields
+    read back as instances that compare equal to their integer value.
+
+        class MOT_StopModes(Enumeration):
+            _type_ = c_short
+            immediate = 1
+            profiled = 2
+
+        MOT_StopModes.profiled.name              # 'profiled'
+        MOT_StopModes.name_of(2)                 # 'profiled'
+        MOT_StopModes['profiled'] == 2           # True
+        MOT_StopModes.decode(numpy_array)        # array of names
+    """
+
+    @property
+    def name(self):
+        return type(self)._names_.get(self.value)
+
+    def _check_retval_(self):
+        return self.value
+
+    def __eq__(self, other):
+        if isinstance(other, _SimpleCData):
+            other = other.value
+        return self.value == other
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __int__(self):
+        return self.value
+
+    __index__ = __int__
 
     def __repr__(self):
-        return "<member %s=%d of %r>" % (self.name, self.value, self.__class__)
+        name = self.name
+        if name is None:
+            return "<%s %d>" % (type(self).__name__, self.value)
+        return "<%s.%s: %d>" % (type(self).__name__, name, self.value)
+
+
+def simple_type(ctype):
+    """The plain ctypes integer type of an Enumeration, or ctype itself otherwise."""
+    if isinstance(ctype, EnumerationType):
+        return _simple_types[ctype._type_]
+    return ctype
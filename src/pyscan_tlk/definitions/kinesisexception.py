@@ -1,15 +1,42 @@
 class KinesisException(Exception):
+    """Error code returned by a Kinesis function.
 
-    def __init__(self, error):
+    KinesisException(code) creates the subclass registered for code in exceptions,
+    so handlers can catch a specific error (FT_IOError), a layer (FTDIError or
+    DeviceError) or every TransientError worth retrying. Unknown codes give a plain
+    KinesisException. code, function and serial record where the error came from;
+    the subclasses default to their own code, as in raise TL_UNHOMED().
+    """
 
-        super().__init__(self.error_codes[error])
+    code = None
+    retryable = False
+
+    def __new__(cls, error=None, function=None, serial=None):
+        if cls is KinesisException:
+            cls = exceptions.get(error, cls)
+        return super().__new__(cls, error, function, serial)
+
+    def __init__(self, error=None, function=None, serial=None):
+        if error is None:
+            error = self.code
+        self.code = error
+        self.function = function
+        self.serial = serial
+        message = self.error_codes.get(error, 'Unknown Kinesis error code %r.' % (error,))
+        if function is not None:
+            message = '%s%s: %s' % (function, '' if serial is None else ' (%s)' % serial, message)
+        super().__init__(message)
+
+    def __reduce__(self):
+        return KinesisException, (self.code, self.function, self.serial)
 
     error_codes = {
         1: 'FT_InvalidHandle - The FTDI functions have not been initialized.',
         2: '''FT_DeviceNotFound - The Device could not be found\n
         This can be generated if the function TLI_BuildDeviceList() has not been called.''',
-        3: '''FT_DeviceNotFound - Device cannot be found, this error can occur if the function
-        TLI_BuildDeviceList() hasn't been called''',
+        3: '''FT_DeviceNotOpened - The Device must be opened before it can be accessed
+
+        See the appropriate Open function for your device.''',
         4: '''FT_IOError - An I/O Error has occured in the FTDI chip.''',
         5: '''FT_InsufficientResources - There are Insufficient resources to run this application.''',
         6: '''FT_InvalidParameter - An invalid parameter has been supplied to the device.''',
@@ -33,10 +60,160 @@ class KinesisException(Exception):
  must be greater than zero.''',
         40: '''TL_DISCONNECTING - The function could not be completed because the device is disconnected.''',
         41: '''TL_FIRMWARE_BUG - The firmware has thrown an error.''',
-        42: '''TL_INVALID_CHANNEL - An Invalid channel address was supplied.''',
+        42: '''TL_INITIALIZATION_FAILURE - The device has failed to initialize''',
         43: '''TL_INVALID_CHANNEL - An Invalid channel address was supplied.''',
         44: '''TL_CANNOT_HOME_DEVICE - This device does not support Homing. Check the Limit switch parameters are
  correct.''',
         45: '''TL_JOG_CONTINOUS_MODE - An invalid jog mode was supplied for the jog function.''',
         46: '''TL_NO_MOTOR_INFO - There is no Motor Parameters available to convert Real World Units.''',
         47: '''TL_CMD_TEMP_UNAVAILABLE - Command temporarily unavailable, Device may be busy.'''}
+
+
+class FTDIError(KinesisException):
+    """Errors 1 to 21, reported by the FTDI USB layer and the dll loader."""
+
+
+class DeviceError(KinesisException):
+    """Errors 32 and above, reported by the device or its dll."""
+
+
+class TransientError(KinesisException):
+    """Errors that can clear by themselves, so the call is worth retrying."""
+
+    retryable = True
+
+
+class FT_InvalidHandle(FTDIError):
+    code = 1
+
+
+class FT_DeviceNotFound(FTDIError):
+    code = 2
+
+
+class FT_DeviceNotOpened(FTDIError):
+    code = 3
+
+
+class FT_IOError(FTDIError, TransientError):
+    code = 4
+
+
+class FT_InsufficientResources(FTDIError, TransientError):
+    code = 5
+
+
+class FT_InvalidParameter(FTDIError):
+    code = 6
+
+
+class FT_DeviceNotPresent(FTDIError):
+    code = 7
+
+
+class FT_IncorrectDevice(FTDIError):
+    code = 8
+
+
+class FT_NoDLLLoaded(FTDIError):
+    code = 16
+
+
+class FT_NoFunctionsAvailable(FTDIError):
+    code = 17
+
+
+class FT_FunctionNotAvailable(FTDIError):
+    code = 18
+
+
+class FT_BadFunctionPointer(FTDIError):
+    code = 19
+
+
+class FT_GenericFunctionFail(FTDIError):
+    code = 20
+
+
+class FT_SpecificFunctionFail(FTDIError):
+    code = 21
+
+
+class TL_ALREADY_OPEN(DeviceError):
+    code = 32
+
+
+class TL_NO_RESPONSE(DeviceError, TransientError):
+    code = 33
+
+
+class TL_NOT_IMPLEMENTED(DeviceError):
+    code = 34
+
+
+class TL_FAULT_REPORTED(DeviceError):
+    code = 35
+
+
+class TL_INVALID_OPERATION(DeviceError):
+    code = 36
+
+
+class TL_UNHOMED(DeviceError):
+    code = 37
+
+
+class TL_INVALID_POSITION(DeviceError):
+    code = 38
+
+
+class TL_INVALID_VELOCITY_PARAMETER(DeviceError):
+    code = 39
+
+
+class TL_DISCONNECTING(DeviceError):
+    code = 40
+
+
+class TL_FIRMWARE_BUG(DeviceError):
+    code = 41
+
+
+class TL_INITIALIZATION_FAILURE(DeviceError):
+    code = 42
+
+
+class TL_INVALID_CHANNEL(DeviceError):
+    code = 43
+
+
+class TL_CANNOT_HOME_DEVICE(DeviceError):
+    code = 44
+
+
+class TL_JOG_CONTINOUS_MODE(DeviceError):
+    code = 45
+
+
+class TL_NO_MOTOR_INFO(DeviceError):
+    code = 46
+
+
+class TL_CMD_TEMP_UNAVAILABLE(DeviceError, TransientError):
+    code = 47
+
+
+# Exception class for each error code, used by KinesisException(code).
+exceptions = {
+    cls.code: cls
+    for cls in (
+        FT_InvalidHandle, FT_DeviceNotFound, FT_DeviceNotOpened, FT_IOError, FT_InsufficientResources,
+        FT_InvalidParameter, FT_DeviceNotPresent, FT_IncorrectDevice, FT_NoDLLLoaded, FT_NoFunctionsAvailable,
+        FT_FunctionNotAvailable, FT_BadFunctionPointer, FT_GenericFunctionFail, FT_SpecificFunctionFail,
+        TL_ALREADY_OPEN, TL_NO_RESPONSE, TL_NOT_IMPLEMENTED, TL_FAULT_REPORTED, TL_INVALID_OPERATION, TL_UNHOMED,
+        TL_INVALID_POSITION, TL_INVALID_VELOCITY_PARAMETER, TL_DISCONNECTING, TL_FIRMWARE_BUG,
+        TL_INITIALIZATION_FAILURE, TL_INVALID_CHANNEL, TL_CANNOT_HOME_DEVICE, TL_JOG_CONTINOUS_MODE,
+        TL_NO_MOTOR_INFO, TL_CMD_TEMP_UNAVAILABLE)}
+
+# Codes for which a retry can succeed.
+retryable_codes = frozenset(code for code, cls in exceptions.items() if cls.retryable)
@@ -1,13 +1,41 @@
-
+import contextlib
+import ctypes
+import sys
 from ctypes import (
-    Structure, c_ushort, c_ulong, c_void_p, c_int, c_double, byref, WinError,
-    windll, POINTER, oledll, c_long, c_uint, memmove, c_byte, c_short,
-    c_float, c_ubyte)
-from comtypes.typeinfo import SAFEARRAYBOUND
-from comtypes.automation import VARIANT, VARTYPE, BSTR
-from comtypes.automation import (
-    VT_VARIANT, VT_R4, VT_R8, VT_I1, VT_I2, VT_I4, VT_INT, VT_UI1,
-    VT_UI2, VT_UI4, VT_UINT, VT_BSTR)
+    Structure, c_ushort, c_ulong, c_void_p, c_int, c_double, byref,
+    POINTER, c_long, c_uint, memmove, c_byte, c_short, c_float, c_ubyte, c_char, c_longlong,
+    c_ulonglong)
+from ..backend.lazylibrary import LazyLibrary
+
+try:
+    from comtypes.automation import VARIANT, BSTR
+except ImportError:
+    # comtypes only imports on Windows. The SAFEARRAY layout and VARTYPE codes below
+    # do not need it, so the wrappers stay importable elsewhere.
+    VARIANT = BSTR = None
+
+
+VARTYPE = c_ushort
+
+VT_I2 = 2
+VT_I4 = 3
+VT_R4 = 4
+VT_R8 = 5
+VT_BSTR = 8
+VT_VARIANT = 12
+VT_I1 = 16
+VT_UI1 = 17
+VT_UI2 = 18
+VT_UI4 = 19
+VT_I8 = 20
+VT_UI8 = 21
+VT_INT = 22
+VT_UINT = 23
+
+
+class SAFEARRAYBOUND(Structure):
+    _fields_ = [("cElements", c_ulong),
+                ("lLbound", c_long)]
 
 
 class SafeArray(Structure):
@@ -29,18 +57,11 @@ class SafeArray(Structure):
         data = c_double()
         res = SafeArrayGetElement(byref(self), byref(ix), byref(data))
         if res:
-            raise WinError(res)
+            raise ctypes.WinError(res)
         return data.value
 
     def __iter__(self):
-        ix = c_int()
-        data = c_double()
-        get = SafeArrayGetElement
-        while True:
-            if get(byref(self), byref(ix), byref(data)):
-                raise StopIteration
-            yield data.value
-            ix.value += 1
+        return iter(UnpackSafeArray(byref(self)))
 
 # XXX
 # Seems to work, but not tested enough.
@@ -58,70 +79,121 @@ class SafeArray(Structure):
 # BTW: A C program has the same behaviour.
 
 
-SafeArrayCreateVectorEx = windll.oleaut32.SafeArrayCreateVectorEx
+# oleaut32 is loaded the first time one of these functions is called.
+_windll = LazyLibrary("oleaut32", globals(), loader=lambda name: ctypes.WinDLL(name))
+_oledll = LazyLibrary("oleaut32", globals(), loader=lambda name: ctypes.OleDLL(name))
+
+SafeArrayCreateVectorEx = _windll.SafeArrayCreateVectorEx
 SafeArrayCreateVectorEx.restype = POINTER(SafeArray)
 
-SafeArrayPutElement = oledll.oleaut32.SafeArrayPutElement
+SafeArrayPutElement = _oledll.SafeArrayPutElement
 SafeArrayPutElement.argtypes = (c_void_p, POINTER(c_long), c_void_p)
 
-SafeArrayGetElement = oledll.oleaut32.SafeArrayGetElement
+SafeArrayGetElement = _oledll.SafeArrayGetElement
 SafeArrayGetElement.argtypes = (c_void_p, POINTER(c_long), c_void_p)
 
-SafeArrayAccessData = oledll.oleaut32.SafeArrayAccessData
+SafeArrayAccessData = _oledll.SafeArrayAccessData
 SafeArrayAccessData.argtypes = (c_void_p, POINTER(c_void_p))
 
-SafeArrayUnaccessData = oledll.oleaut32.SafeArrayUnaccessData
+SafeArrayUnaccessData = _oledll.SafeArrayUnaccessData
 SafeArrayUnaccessData.argtypes = (c_void_p,)
 
-SafeArrayGetVartype = oledll.oleaut32.SafeArrayGetVartype
+SafeArrayGetVartype = _oledll.SafeArrayGetVartype
 SafeArrayGetVartype.argtypes = (c_void_p, POINTER(VARTYPE))
 
-SafeArrayCreate = windll.oleaut32.SafeArrayCreate
+SafeArrayCreate = _windll.SafeArrayCreate
 SafeArrayCreate.argtypes = (VARTYPE, c_uint, POINTER(SAFEARRAYBOUND))
 SafeArrayCreate.restype = POINTER(SafeArray)
 
-SafeArrayGetUBound = oledll.oleaut32.SafeArrayGetUBound
+SafeArrayGetUBound = _oledll.SafeArrayGetUBound
 SafeArrayGetUBound.argtypes = (c_void_p, c_uint, POINTER(c_long))
 
-SafeArrayGetLBound = oledll.oleaut32.SafeArrayGetLBound
+SafeArrayGetLBound = _oledll.SafeArrayGetLBound
 SafeArrayGetLBound.argtypes = (c_void_p, c_uint, POINTER(c_long))
 
-SafeArrayGetDim = oledll.oleaut32.SafeArrayGetDim
+SafeArrayGetDim = _oledll.SafeArrayGetDim
 SafeArrayGetDim.restype = c_uint
 
+SafeArrayDestroy = _oledll.SafeArrayDestroy
+SafeArrayDestroy.argtypes = (c_void_p,)
+
 ################################################################
 
 
 def SafeArray_FromSequence(seq):
-    """Create a one dimensional safearray of type VT_VARIANT from a
-    sequence of Python objects
+    """Create a one dimensional safearray from a sequence of Python objects
+
+    Numeric buffers (array.array, NumPy arrays, memoryviews) give a safearray of
+    their own type, as from SafeArray_FromArray; anything else one of VT_VARIANT.
     """
+    if _numeric_format(seq) is not None:
+        return SafeArray_FromArray(seq)[1]
     psa = SafeArrayCreateVectorEx(VT_VARIANT, 0, len(seq), None)
     for index, elem in enumerate(seq):
         SafeArrayPutElement(psa, byref(c_long(index)), byref(VARIANT(elem)))
     return psa
 
 
+# VARTYPE of each buffer format code, by (kind, item size); the C int codes keep
+# the VT_INT and VT_UINT they always had.
+_FORMAT_KINDS = dict([(code, 'f') for code in 'fd'] + [(code, 'i') for code in 'bhilq'] + [(code, 'u') for code in 'BHILQ'])
+_KIND2VT = {
+    ('f', 4): VT_R4,
+    ('f', 8): VT_R8,
+    ('i', 1): VT_I1,
+    ('i', 2): VT_I2,
+    ('i', 4): VT_I4,
+    ('i', 8): VT_I8,
+    ('u', 1): VT_UI1,
+    ('u', 2): VT_UI2,
+    ('u', 4): VT_UI4,
+    ('u', 8): VT_UI8}
+_CODE2VT = {'i': VT_INT, 'I': VT_UINT}
+
+
+def _numeric_format(obj):
+    # The (VARTYPE, element count, item size) of a numeric buffer, or None.
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return None
+    with view:
+        code = view.format.lstrip('@=<')
+        kind = _FORMAT_KINDS.get(code)
+        if kind is None or (view.format[0] == '<' and sys.byteorder != 'little'):
+            return None
+        vt = _KIND2VT.get((kind, view.itemsize))
+        if vt is None:
+            return None
+        if view.itemsize == 4:
+            vt = _CODE2VT.get(code, vt)
+        if not view.c_contiguous:
+            raise ValueError("buffer is not C-contiguous")
+        return vt, view.nbytes // view.itemsize, view.itemsize
+
+
 def SafeArray_FromArray(arr):
     """Create a one dimensional safearray of a numeric type from an
-    array instance"""
-    TYPECODE = {
-        "d": VT_R8,
-        "f": VT_R4,
-        "l": VT_I4,
-        "i": VT_INT,
-        "h": VT_I2,
-        "b": VT_I1,
-        "I": VT_UINT,
-        "L": VT_UI4,
-        "H": VT_UI2,
-        "B": VT_UI1}
-    vt = TYPECODE[arr.typecode]
-    psa = SafeArrayCreateVectorEx(vt, 0, len(arr), None)
-    ptr = c_void_p()
-    SafeArrayAccessData(psa, byref(ptr))
-    memmove(ptr, arr.buffer_info()[0], len(arr) * arr.itemsize)
-    SafeArrayUnaccessData(psa)
+    array instance
+
+    arr is any C-contiguous buffer of numbers (array.array, a NumPy array, a
+    memoryview), its elements copied in C order with one memmove. The VARTYPE
+    follows the element type. Read-only buffers are copied once more on the way.
+    """
+    numeric = _numeric_format(arr)
+    if numeric is None:
+        raise TypeError("%s is not a buffer of a safearray number type" % type(arr).__name__)
+    vt, count, itemsize = numeric
+    psa = SafeArrayCreateVectorEx(vt, 0, count, None)
+    if count:
+        with memoryview(arr) as view:
+            source = (c_char * view.nbytes).from_buffer(arr) if not view.readonly else view.tobytes()
+        ptr = c_void_p()
+        SafeArrayAccessData(psa, byref(ptr))
+        try:
+            memmove(ptr, source, count * itemsize)
+        finally:
+            SafeArrayUnaccessData(psa)
     return vt, psa
 
 
@@ -149,21 +221,32 @@ _VT2CTYPE = {
     VT_I1: c_byte,
     VT_I2: c_short,
     VT_I4: c_long,
+    VT_I8: c_longlong,
     VT_INT: c_int,
     VT_R4: c_float,
     VT_R8: c_double,
     VT_UI1: c_ubyte,
     VT_UI2: c_ushort,
     VT_UI4: c_ulong,
+    VT_UI8: c_ulonglong,
     VT_UINT: c_uint,
     VT_VARIANT: VARIANT}
 
 
-def _get_datatype(psa):
-    # Return the ctypes data type corresponding to the SAFEARRAY's typecode.
+# Arrays of these hold pointers, and are unpacked one element at a time.
+_PER_ELEMENT = (VT_BSTR, VT_VARIANT)
+
+
+def _get_vartype(psa):
+    # Return the SAFEARRAY's typecode.
     vt = VARTYPE()
     SafeArrayGetVartype(psa, byref(vt))
-    return _VT2CTYPE[vt.value]
+    return vt.value
+
+
+def _get_datatype(psa):
+    # Return the ctypes data type corresponding to the SAFEARRAY's typecode.
+    return _VT2CTYPE[_get_vartype(psa)]
 
 
 def _get_ubound(psa, dim):
@@ -180,8 +263,60 @@ def _get_lbound(psa, dim):
     return lb.value
 
 
+def _get_shape(psa):
+    # Return the number of elements along each dimension of a safearray
+    return tuple(_get_ubound(psa, d) - _get_lbound(psa, d) + 1 for d in range(SafeArrayGetDim(psa)))
+
+
+def _nest(flat, shape):
+    # Nested tuples, indexed like the safearray, of elements stored first index fastest.
+    if len(shape) == 1:
+        return tuple(flat)
+    return tuple(_nest(flat[i::shape[0]], shape[1:]) for i in range(shape[0]))
+
+
+@contextlib.contextmanager
+def SafeArray_Data(psa):
+    """Lock a numeric SAFEARRAY and give its elements as a flat memoryview, without copying.
+
+    Elements are in storage order, first index fastest, with the format of the
+    array's ctypes type; the view is released when the with block ends.
+    """
+    vt = _get_vartype(psa)
+    if vt in _PER_ELEMENT:
+        raise TypeError("safearray of VARTYPE %d holds pointers, not data" % vt)
+    ctype = _VT2CTYPE[vt]
+    count = 1
+    for size in _get_shape(psa):
+        count *= size
+    ptr = c_void_p()
+    SafeArrayAccessData(psa, byref(ptr))
+    try:
+        data = (ctype * count).from_address(ptr.value) if count else (ctype * 0)()
+        view = memoryview(data).cast('B').cast(ctype._type_)
+        try:
+            yield view
+        finally:
+            view.release()
+    finally:
+        SafeArrayUnaccessData(psa)
+
+
+def SafeArray_ToNumPy(psa):
+    """Copy a numeric SAFEARRAY into a NumPy array of its shape and element type."""
+    import numpy
+    shape = _get_shape(psa)
+    with SafeArray_Data(psa) as data:
+        return numpy.array(data).reshape(shape, order='F')
+
+
 def UnpackSafeArray(psa):
     """Unpack a SAFEARRAY into a Python tuple."""
+    if _get_vartype(psa) not in _PER_ELEMENT:
+        # One lock and one pass over the data instead of a call per element.
+        with SafeArray_Data(psa) as data:
+            flat = data.tolist()
+        return _nest(flat, _get_shape(psa))
     dim = SafeArrayGetDim(psa)
     lowerbounds = [_get_lbound(psa, d) for d in range(dim)]
     indexes = (c_long * dim)(*lowerbounds)
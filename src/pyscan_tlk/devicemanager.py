@@ -0,0 +1,117 @@
+import threading
+from ctypes import (
+    POINTER,
+    byref,
+    c_char,
+    c_int,
+    c_short,
+    c_ulong,
+    c_void_p)
+from .backend.lazylibrary import LazyLibrary
+from .definitions.kinesisexception import FT_DeviceNotFound, KinesisException
+from .definitions.safearray import SafeArray, SafeArrayDestroy, UnpackSafeArray
+from .definitions.structures import TLI_DeviceInfo
+from .serialnumber import SerialNumber
+
+
+# The TLI_* device list functions are shared by every device dll. They are bound once,
+# here, against the DeviceManager dll and every wrapper module imports them from this
+# module so there is a single device list per process.
+
+lib = LazyLibrary("Thorlabs.MotionControl.DeviceManager.dll", globals())
+
+
+lib.declare([
+    # Build the DeviceList.
+    ("TLI_BuildDeviceList", c_short, []),
+    # Creates a manual device configuration entry.
+    ("TLI_CreateManualDeviceEntry", c_short, [POINTER(c_char)]),
+    # Deletes a manual device configuration entry.
+    ("TLI_DeleteManualDeviceEntry", c_short, [POINTER(c_char)]),
+    # Get the device information from the USB port.
+    ("TLI_GetDeviceInfo", c_short, [POINTER(c_char), POINTER(TLI_DeviceInfo)]),
+    # Get the entire contents of the device list.
+    ("TLI_GetDeviceList", c_short, [POINTER(POINTER(SafeArray))]),
+    # Get the contents of the device list which match the supplied typeID.
+    ("TLI_GetDeviceListByType", c_short, [POINTER(POINTER(SafeArray)), c_int]),
+    # Get the contents of the device list which match the supplied typeID.
+    ("TLI_GetDeviceListByTypeExt", c_short, [POINTER(c_char), c_ulong, c_int]),
+    # Get the contents of the device list which match the supplied typeIDs.
+    ("TLI_GetDeviceListByTypes", c_short, [POINTER(POINTER(SafeArray)), POINTER(c_int), c_int]),
+    # Get the contents of the device list which match the supplied typeIDs.
+    ("TLI_GetDeviceListByTypesExt", c_short, [POINTER(c_char), c_ulong, c_int, c_int]),
+    # Get the entire contents of the device list.
+    ("TLI_GetDeviceListExt", c_short, [POINTER(c_char), c_ulong]),
+    # Gets the device list size.
+    ("TLI_GetDeviceListSize", c_short, []),
+    # Initialize a connection to the Simulation Manager, which must already be running.
+    ("TLI_InitializeSimulations", c_void_p, []),
+    # Scans a range of addresses and returns a list of the ip addresses of Thorlabs devices found.
+    ("TLI_ScanEthernetRange", c_short, [POINTER(c_char), POINTER(c_char), c_int, c_int, POINTER(c_char), c_ulong]),
+    # Uninitialize a connection to the Simulation Manager, which must already be running.
+    ("TLI_UninitializeSimulations", c_void_p, [])
+])
+
+
+# TLI_BuildDeviceList below replaces the raw dll function and serializes calls to it.
+_BuildDeviceList = lib.TLI_BuildDeviceList
+
+_device_list_lock = threading.Lock()
+_device_list_builds = 0
+_device_list_result = None
+
+
+def TLI_BuildDeviceList():
+    """Build the DeviceList.
+
+    Callers that arrive while a build is already running wait for it and return its
+    result rather than starting a second scan of the bus.
+    """
+    global _device_list_builds, _device_list_result
+    requested = _device_list_builds
+    with _device_list_lock:
+        if _device_list_builds == requested:
+            _device_list_result = _BuildDeviceList()
+            _device_list_builds += 1
+        return _device_list_result
+
+
+def device_list_builds():
+    """Return how many times the device list has been built in this process."""
+    return _device_list_builds
+
+
+def device_list(*type_ids):
+    """Serial numbers in the device list, of the given device types only if any.
+
+    Uses the SAFEARRAY form of TLI_GetDeviceList, which needs no buffer size.
+    """
+    psa = POINTER(SafeArray)()
+    if not type_ids:
+        name, args = 'TLI_GetDeviceList', ()
+    elif len(type_ids) == 1:
+        name, args = 'TLI_GetDeviceListByType', type_ids
+    else:
+        name, args = 'TLI_GetDeviceListByTypes', ((c_int * len(type_ids))(*type_ids), len(type_ids))
+    result = getattr(lib, name)(byref(psa), *args)
+    if result:
+        raise KinesisException(result, name)
+    if not psa:
+        return []
+    try:
+        return list(UnpackSafeArray(psa))
+    finally:
+        SafeArrayDestroy(psa)
+
+
+def device_info(serial):
+    """TLI_DeviceInfo of serial, a device in the device list.
+
+    TLI_GetDeviceInfo returns 1 when it fills the structure and 0 when the device is
+    not in the list, rather than an error code; the failure raises FT_DeviceNotFound.
+    """
+    serial = SerialNumber(serial)
+    info = TLI_DeviceInfo()
+    if not lib.TLI_GetDeviceInfo(serial, byref(info)):
+        raise FT_DeviceNotFound(function='TLI_GetDeviceInfo', serial=str(serial))
+    return info
@@ -0,0 +1,181 @@
+"""Cached device discovery with hot-plug notifications.
+
+TLI_BuildDeviceList scans the USB bus, which takes hundreds of milliseconds. A
+DeviceDiscovery keeps the last scan: the serial numbers and the TLI_DeviceInfo of
+each, fetched once per device. It scans again only once the cached list is older
+than ttl seconds, or on every interval from a background thread, and tells
+subscribers which devices were plugged in or unplugged:
+
+    discovery = DeviceDiscovery(ttl=5.0)
+    discovery.serials(type_id=27)                # cached unless stale
+    discovery.info('27000001').description
+
+    def changed(change):
+        print('added', change.added, 'removed', change.removed)
+
+    discovery.subscribe(changed)
+    with discovery:                              # rescan every interval seconds
+        ...
+"""
+import logging
+import threading
+import time
+from collections import namedtuple
+from ctypes import create_string_buffer
+
+from . import devicemanager
+from .definitions.kinesisexception import KinesisException
+
+Change = namedtuple('Change', 'added removed')
+
+log = logging.getLogger(__name__)
+
+
+def _scan():
+    # Serial numbers in a freshly built device list.
+    result = devicemanager.TLI_BuildDeviceList()
+    if result:
+        raise KinesisException(result, 'TLI_BuildDeviceList')
+    size = devicemanager.TLI_GetDeviceListSize()
+    if not size:
+        return []
+    # Serial numbers are 8 digits; leave room for longer ones and the separators.
+    buffer = create_string_buffer(size * 16 + 1)
+    result = devicemanager.TLI_GetDeviceListExt(buffer, len(buffer))
+    if result:
+        raise KinesisException(result, 'TLI_GetDeviceListExt')
+    return [serial for serial in buffer.value.decode().split(',') if serial]
+
+
+class DeviceDiscovery(object):
+    """The device list and TLI_DeviceInfo of every device, rescanned when stale.
+
+    Lookups rescan first if the last scan is more than ttl seconds old by clock, or
+    never when ttl is None. The background thread started by start() rescans every
+    interval seconds (ttl by default). Subscribers are called with a Change of the
+    serials added and removed, from whichever thread scanned.
+
+    A device whose TLI_DeviceInfo cannot be read is left out of that scan, and a
+    lookup whose rescan fails answers from the last good list; error holds the
+    exception in both cases.
+    """
+
+    def __init__(self, ttl=5.0, interval=None, clock=time.monotonic):
+        self.ttl = ttl
+        self.interval = interval if interval is not None else (ttl or 5.0)
+        self.clock = clock
+        self.scans = 0
+        self.scanned = None
+        self.error = None
+        # Serial -> TLI_DeviceInfo, in device list order.
+        self._devices = {}
+        self._subscribers = []
+        # Held while scanning; lookups of a fresh cache never wait for it.
+        self._scan_lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __repr__(self):
+        return "<DeviceDiscovery %d devices, ttl %ss>" % (len(self._devices), self.ttl)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def refresh(self):
+        """Scan the bus now, and return and announce the Change since the last scan."""
+        with self._scan_lock:
+            serials = _scan()
+            previous = self._devices
+            devices = {}
+            error = None
+            for serial in serials:
+                info = previous.get(serial)
+                if info is None:
+                    try:
+                        info = devicemanager.device_info(serial)
+                    except KinesisException as exception:
+                        # One unreadable device should not hide the rest; a later scan tries it again.
+                        log.warning("Skipping %s: %s", serial, exception)
+                        error = exception
+                        continue
+                devices[serial] = info
+            change = Change([serial for serial in devices if serial not in previous],
+                            [serial for serial in previous if serial not in devices])
+            self._devices = devices
+            self.scanned = self.clock()
+            self.scans += 1
+            self.error = error
+            with self._lock:
+                subscribers = list(self._subscribers)
+        if change.added or change.removed:
+            for callback in subscribers:
+                callback(change)
+        return change
+
+    def _stale(self):
+        scanned = self.scanned
+        return scanned is None or (self.ttl is not None and self.clock() - scanned > self.ttl)
+
+    def _current(self):
+        if self._stale():
+            with self._scan_lock:
+                # Another thread may have scanned while this one waited.
+                if self._stale():
+                    try:
+                        self.refresh()
+                    except KinesisException as error:
+                        if self.scanned is None:
+                            raise
+                        log.warning("Device list not rescanned: %s", error)
+                        self.error = error
+        return self._devices
+
+    def devices(self):
+        """Serial -> TLI_DeviceInfo of every device, from the cache unless stale."""
+        return dict(self._current())
+
+    def serials(self, type_id=None):
+        """Serial numbers of the devices, of type_id only if given."""
+        devices = self._current()
+        if type_id is None:
+            return list(devices)
+        return [serial for serial, info in devices.items() if info.typeID == type_id]
+
+    def info(self, serial):
+        """TLI_DeviceInfo of serial; KeyError if it is not in the device list."""
+        return self._current()[str(serial)]
+
+    def subscribe(self, callback):
+        """Call callback(change) whenever a scan finds devices added or removed."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            self._subscribers.remove(callback)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="DeviceDiscovery", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except KinesisException as error:
+                # Keep the last good list; the next interval tries again.
+                self.error = error
@@ -0,0 +1,66 @@
+from ctypes import Array, _SimpleCData, c_char_p, c_short, c_void_p, c_wchar_p
+
+from .backend.lazylibrary import set_errcheck
+from .definitions.kinesisexception import KinesisException
+
+
+def _is_selector(argtype):
+    # A channel or similar by-value selector, as opposed to an out-parameter or a structure.
+    return issubclass(argtype, _SimpleCData) and not issubclass(argtype, (c_char_p, c_void_p, c_wchar_p))
+
+
+# c_short functions whose result is a success flag, nonzero when they succeed.
+_success_flags = frozenset(['TLI_GetDeviceInfo'])
+
+
+def returns_error_code(function):
+    """Whether the declared function returns a Kinesis error code, 0 for success.
+
+    Getters that return their value as a c_short (or an enumeration declared as one)
+    take nothing but the serial and perhaps a channel; getters with out-parameters
+    return an error code like every other c_short function, except the few that
+    return a success flag instead.
+    """
+    if function.restype is not c_short or function.name in _success_flags:
+        return False
+    prefix, _, member = function.name.partition('_')
+    arguments = function.argtypes or []
+    if prefix != 'TLI':
+        arguments = arguments[1:]
+    if member.startswith('Get') and len(arguments) <= 1:
+        return not all(_is_selector(argtype) for argtype in arguments)
+    return True
+
+
+def _serial(argument):
+    if isinstance(argument, (c_char_p, Array)):
+        argument = argument.value
+    if isinstance(argument, bytes):
+        return argument.decode(errors='replace')
+    return argument
+
+
+def check_error_code(result, function, arguments):
+    """ctypes errcheck raising KinesisException for a nonzero error code."""
+    if result:
+        name = getattr(function, '__name__', None)
+        serial = None
+        if arguments and not (name or '').startswith('TLI_'):
+            serial = _serial(arguments[0])
+        raise KinesisException(result, name, serial)
+    return result
+
+
+def _errcheck_for(function):
+    return check_error_code if returns_error_code(function) else None
+
+
+def check_errors(enabled=True):
+    """Raise KinesisException whenever a function returns a nonzero error code.
+
+    The check is attached as the ctypes errcheck of every function that returns an
+    error code, so ctypes runs it as part of the call with no wrapper in between.
+    Functions returning values, including getters that return a c_short value, are
+    left unchecked. check_errors(False) restores plain return codes.
+    """
+    set_errcheck(_errcheck_for if enabled else None)
@@ -0,0 +1,73 @@
+"""Calling the exports of any device family by name.
+
+The wrapper modules declare one family each (KVS_, BMC_, ...), and most families
+select a device by its serial number alone while benchtop and multi-axis ones also
+take a channel. These helpers let code work across them: find a module's prefix,
+resolve its exports by name, put the channel after the serial only where the
+export takes one, and raise KinesisException for error codes that the opt-in
+errcheck has not raised already:
+
+    prefix = family_prefix(benchtopbrushlessmotor)                  # 'BMC'
+    home = family_function(benchtopbrushlessmotor, prefix, 'Home')
+    check_result(benchtopbrushlessmotor, 'BMC_Home', home(*with_channel(home, 2, (serial,))), serial)
+"""
+from .backend.lazylibrary import LazyFunction
+from .definitions.kinesisexception import KinesisException
+from .errorcheck import returns_error_code
+
+
+def resolve(function):
+    """The typed ctypes function behind function, loading its dll if needed."""
+    if isinstance(function, LazyFunction):
+        function = function.resolve()
+    return function
+
+
+def family_prefix(module):
+    """Function prefix of a wrapper module, as in 'KVS'.
+
+    Modules declaring several families (benchtopprecisionpiezo has PPC_ and PPC2_)
+    raise ValueError; their callers must give the prefix.
+    """
+    prefixes = sorted(name[:-len('_GetStatusBits')] for name in module.lib.functions if name.endswith('_GetStatusBits'))
+    if len(prefixes) != 1:
+        raise ValueError("%s has functions prefixed %s; give prefix" % (module.__name__, ' and '.join(prefixes)))
+    return prefixes[0]
+
+
+def family_function(module, prefix, name):
+    """The resolved export of module named prefix_name."""
+    return resolve(getattr(module, '%s_%s' % (prefix, name)))
+
+
+def takes_channel(function, arguments=1):
+    """Whether function takes a channel besides its first arguments arguments."""
+    return len(function.argtypes or ()) > arguments
+
+
+def default_channel(function, channel, arguments=1):
+    """channel, or 1 if it is None and function takes a channel besides its arguments."""
+    if channel is None and takes_channel(function, arguments):
+        return 1
+    return channel
+
+
+def with_channel(function, channel, arguments):
+    """arguments for function, with channel after the serial if function takes one."""
+    if channel is not None and takes_channel(function, len(arguments)):
+        return (arguments[0], channel) + arguments[1:]
+    return arguments
+
+
+def unchecked_error_code(module, name):
+    """Whether module's export name returns an error code that no errcheck raises for."""
+    if getattr(getattr(module, name, None), 'errcheck', None) is not None:
+        return False
+    return returns_error_code(getattr(module.lib, name))
+
+
+def check_result(module, name, result, serial=None):
+    """Return result, raising KinesisException if it is an unchecked error code of name."""
+    if result and unchecked_error_code(module, name):
+        raise KinesisException(result, name, None if serial is None else str(serial))
+    return result
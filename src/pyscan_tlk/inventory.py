@@ -0,0 +1,192 @@
+"""Device facts kept on disk between runs.
+
+Bringing a rig up means reading the hardware information, firmware and software
+versions, TLI_DeviceInfo and stage parameters of every device, several dll calls
+each. None of it changes while the firmware stays the same, so an Inventory keeps it
+in a JSON file keyed by serial number. A warm start reads one firmware version per
+device to check the entry, and the rest comes from the file:
+
+    inventory = Inventory('rig-inventory.json')
+    for serial_number in serial_numbers:
+        kcubedcservo.KVS_Open(serial_number)
+        facts = inventory.facts(kcubedcservo, serial_number)
+        print(facts.hardware_info.modelNumber, facts.motor_params)
+    inventory.save()
+
+Entries whose firmware version no longer matches, and files written in another
+format, are read from the devices again.
+"""
+import json
+import os
+from collections import namedtuple
+from ctypes import Array, Structure, byref, c_char
+
+from . import devicemanager
+from .definitions.structures import TLI_DeviceInfo, TLI_HardwareInformation
+from .family import check_result, default_channel, family_function, family_prefix, with_channel
+from .paramcache import ParameterCache
+from .serialnumber import SerialNumber
+
+# Version of the file layout; files of any other version are ignored.
+FORMAT = 1
+
+Facts = namedtuple('Facts', 'serial prefix firmware_version software_version device_info hardware_info motor_params')
+
+
+def _to_json(value):
+    # JSON form of a ctypes structure field, or of the structure itself.
+    if isinstance(value, Structure):
+        return dict((field[0], _to_json(getattr(value, field[0]))) for field in value._fields_)
+    if isinstance(value, Array):
+        return [_to_json(item) for item in value]
+    if isinstance(value, bytes):
+        return value.decode('latin-1')
+    return getattr(value, 'value', value)
+
+
+def _from_json(structure, data):
+    # Structure of type structure with the fields given in data.
+    value = structure()
+    for field in structure._fields_:
+        name, ctype = field[:2]
+        if data.get(name) is None:
+            continue
+        item = data[name]
+        if issubclass(ctype, Structure):
+            item = _from_json(ctype, item)
+        elif issubclass(ctype, Array):
+            item = item.encode('latin-1') if ctype._type_ is c_char else ctype(*item)
+        setattr(value, name, item)
+    return value
+
+
+class Inventory(object):
+    """Facts of each device, read from the device once per firmware version.
+
+    path is the JSON file, read now if it exists and written by save(). hits and
+    misses count the facts() calls answered from the file and from the devices.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._facts = {}
+        self._dirty = False
+        self.load()
+
+    def __repr__(self):
+        return "<Inventory %s, %d devices>" % (self.path, len(self._entries))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, serial):
+        return str(SerialNumber(serial)) in self._entries
+
+    def load(self):
+        """Read the file, keeping nothing if it is missing, unreadable or another format."""
+        self._entries = {}
+        self._facts = {}
+        self._dirty = False
+        try:
+            with open(self.path) as file:
+                contents = json.load(file)
+        except (OSError, ValueError):
+            return
+        if isinstance(contents, dict) and contents.get('format') == FORMAT:
+            self._entries = dict(contents.get('devices', {}))
+
+    def save(self):
+        """Write the file if anything changed, replacing it in one step."""
+        if not self._dirty:
+            return
+        # Not mkstemp, which makes the file readable by its owner only: created with mode
+        # 0666, the umask applies as it would for open(). O_EXCL never reuses a file.
+        temporary = '%s.%s.tmp' % (os.path.abspath(self.path), os.urandom(4).hex())
+        descriptor = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(descriptor, 'w') as file:
+                json.dump({'format': FORMAT, 'devices': self._entries}, file, indent=1, sort_keys=True)
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self._dirty = False
+
+    def forget(self, serial=None):
+        """Drop the entry of serial, or of every device, so it is read again."""
+        if serial is None:
+            self._entries.clear()
+            self._facts.clear()
+        else:
+            self._entries.pop(str(SerialNumber(serial)), None)
+            self._facts.pop(str(SerialNumber(serial)), None)
+        self._dirty = True
+
+    def facts(self, module, serial, channel=None, prefix=None):
+        """Facts of serial, an open device of the family module.
+
+        Families whose functions take a channel use channel, 1 by default, for the
+        firmware version and stage parameters.
+        """
+        serial = SerialNumber(serial)
+        if prefix is None:
+            prefix = family_prefix(module)
+        key = str(serial)
+        hardware_info = None
+        if hasattr(module, prefix + '_GetFirmwareVersion'):
+            firmware_version = self._call(module, prefix, 'GetFirmwareVersion', serial, channel)
+        else:
+            hardware_info = self._hardware_info(module, prefix, serial)
+            firmware_version = hardware_info.firmwareVersion
+        entry = self._entries.get(key)
+        if entry is not None and entry['prefix'] == prefix and entry['firmware_version'] == firmware_version:
+            self.hits += 1
+            facts = self._facts.get(key)
+            if facts is None:
+                facts = self._facts[key] = self._decode(key, entry)
+            return facts
+        self.misses += 1
+        if hardware_info is None and hasattr(module, prefix + '_GetHardwareInfoBlock'):
+            hardware_info = self._hardware_info(module, prefix, serial)
+        software_version = None
+        if hasattr(module, prefix + '_GetSoftwareVersion'):
+            software_version = self._call(module, prefix, 'GetSoftwareVersion', serial, channel)
+        motor_params = None
+        if hasattr(module, prefix + '_GetMotorParamsExt'):
+            motor_params = ParameterCache(module, serial, channel, prefix).get('MotorParamsExt')
+        facts = Facts(key, prefix, firmware_version, software_version, devicemanager.device_info(serial),
+                      hardware_info, motor_params)
+        self._entries[key] = {
+            'prefix': prefix,
+            'firmware_version': firmware_version,
+            'software_version': software_version,
+            'device_info': _to_json(facts.device_info),
+            'hardware_info': None if hardware_info is None else _to_json(hardware_info),
+            'motor_params': None if motor_params is None else list(motor_params)}
+        self._facts[key] = facts
+        self._dirty = True
+        return facts
+
+    @staticmethod
+    def _decode(key, entry):
+        hardware_info = entry.get('hardware_info')
+        motor_params = entry.get('motor_params')
+        return Facts(key, entry['prefix'], entry['firmware_version'], entry.get('software_version'),
+                     _from_json(TLI_DeviceInfo, entry['device_info']),
+                     None if hardware_info is None else _from_json(TLI_HardwareInformation, hardware_info),
+                     None if motor_params is None else tuple(motor_params))
+
+    @staticmethod
+    def _call(module, prefix, name, serial, channel):
+        function = family_function(module, prefix, name)
+        return function(*with_channel(function, default_channel(function, channel), (serial,)))
+
+    @staticmethod
+    def _hardware_info(module, prefix, serial):
+        info = TLI_HardwareInformation()
+        function = family_function(module, prefix, 'GetHardwareInfoBlock')
+        check_result(module, prefix + '_GetHardwareInfoBlock', function(serial, byref(info)), serial)
+        return info
@@ -0,0 +1,151 @@
+"""Device messages logged in bulk into a NumPy structured array.
+
+A MessageQueue builds a tuple for every message. For logging every message of a
+busy rig, a MessageLog instead drains each device's dll queue with GetNextMessage
+straight into a preallocated RingBuffer of (time, serial, type, id, data) records:
+the out-parameters point into staging arrays allocated once per device, and each
+batch is copied into the log with one vectorized write per field:
+
+    log = MessageLog()
+    log.add(kcubedcservo, serial_number)
+    log.add(kcubepiezo, piezo_serial, callback=True)     # drained as messages arrive
+    ...
+    log.drain()                                            # drain the other devices
+    records = log.latest()
+    homed = records[log.decode(records) == 'GenericMotor.Homed']['serial']
+
+decode names every record at once through a lookup table built from message_types.
+"""
+import threading
+import time
+from ctypes import POINTER, addressof, c_ulong, c_ushort, cast, sizeof
+
+import numpy
+
+from .definitions.callbacks import MessageCallback
+from .family import family_function, family_prefix, with_channel
+from .messages import message_name, message_table
+from .ringbuffer import RingBuffer
+from .serialnumber import SerialNumber
+
+# Fields of a logged message after its time; serial numbers are stored as integers.
+fields = [('serial', numpy.uint32), ('type', numpy.uint16), ('id', numpy.uint16), ('data', numpy.uint32)]
+
+
+class _Source(object):
+    """GetNextMessage of one device (or channel), writing into staging arrays.
+
+    Each call's out-parameters point at the next slot of the staging arrays, so a
+    batch of messages is read with no Python object per message and copied into the
+    log in one go.
+    """
+
+    def __init__(self, module, serial, channel, prefix, batch):
+        self.serial = serial
+        self.channel = channel
+        self.prefix = prefix or family_prefix(module)
+        self.module = module
+        self.number = int(serial)
+        get_next = self.get_next = family_function(module, self.prefix, 'GetNextMessage')
+        self.staging = [(c_ushort * batch)(), (c_ushort * batch)(), (c_ulong * batch)()]
+        pointers = [[cast(addressof(array) + n * sizeof(array._type_), POINTER(array._type_)) for n in range(batch)]
+                    for array in self.staging]
+        self.slots = [with_channel(get_next, channel, (serial,) + slot) for slot in zip(*pointers)]
+        self.columns = [numpy.ctypeslib.as_array(array) for array in self.staging]
+        self.callback = None
+
+
+class MessageLog(object):
+    """Messages of the added devices in a RingBuffer of capacity records.
+
+    Times come from clock, read once per drained batch. Devices added with
+    callback=True are drained from the dll's thread whenever they queue a message;
+    the others when drain() is called. Appends are serialized, so both kinds can be
+    mixed.
+    """
+
+    def __init__(self, capacity=100000, clock=time.perf_counter, batch=256):
+        self.buffer = RingBuffer(capacity, fields)
+        self.clock = clock
+        self.batch = batch
+        self.sources = {}
+        self._lock = threading.Lock()
+        # Callbacks of removed devices; the dll may still be running one.
+        self._retired = []
+        self._names = None
+
+    def __repr__(self):
+        return "<MessageLog %d devices, %d messages>" % (len(self.sources), self.buffer.count)
+
+    def __len__(self):
+        return len(self.buffer)
+
+    def add(self, module, serial, channel=None, prefix=None, callback=False):
+        """Log the messages of serial (and channel) through the family module."""
+        source = _Source(module, SerialNumber(serial), channel, prefix, self.batch)
+        self.sources[(source.serial, channel)] = source
+        if callback:
+            register = family_function(module, source.prefix, 'RegisterMessageCallback')
+            source.callback = MessageCallback(lambda: self._drain(source))
+            register(*with_channel(register, channel, (source.serial, source.callback)))
+        self._drain(source)
+        return source
+
+    def remove(self, serial, channel=None):
+        source = self.sources.pop((SerialNumber(serial), channel))
+        if source.callback is not None:
+            register = family_function(source.module, source.prefix, 'RegisterMessageCallback')
+            register(*with_channel(register, channel, (source.serial, MessageCallback())))
+            self._retired.append(source.callback)
+
+    def _drain(self, source):
+        get_next, slots, batch = source.get_next, source.slots, self.batch
+        message_types, message_ids, message_data = source.columns
+        total = 0
+        with self._lock:
+            now = self.clock()
+            while True:
+                count = 0
+                while count < batch and get_next(*slots[count]):
+                    count += 1
+                self.buffer.extend(count, now, (
+                    source.number, message_types[:count], message_ids[:count], message_data[:count]))
+                total += count
+                if count < batch:
+                    return total
+
+    def drain(self, serial=None, channel=None):
+        """Drain the messages of one device, or of every device, and return how many."""
+        if serial is not None:
+            return self._drain(self.sources[(SerialNumber(serial), channel)])
+        return sum(self._drain(source) for source in list(self.sources.values()))
+
+    def latest(self, n=None):
+        """View of the latest n records, oldest first; see RingBuffer.latest."""
+        return self.buffer.latest(n)
+
+    def decode(self, records):
+        """Array of the 'Type.Id' names of records, indexed like them.
+
+        records is a structured array with type and id fields, such as latest().
+        """
+        if self._names is None:
+            table = message_table()
+            types = max(type_ for type_, _ in table) + 1
+            ids = max(id_ for _, id_ in table) + 1
+            names = numpy.empty((types + 1, ids + 1), dtype=object)
+            for type_ in range(types + 1):
+                for id_ in range(ids + 1):
+                    names[type_, id_] = table.get((type_, id_))
+            self._names = names
+        names = self._names
+        message_types = numpy.asarray(records['type'], dtype=numpy.intp)
+        message_ids = numpy.asarray(records['id'], dtype=numpy.intp)
+        # Anything outside the table lands on its last row or column, which is empty.
+        rows = numpy.minimum(message_types, names.shape[0] - 1)
+        columns = numpy.minimum(message_ids, names.shape[1] - 1)
+        decoded = names[rows, columns]
+        unknown = numpy.flatnonzero(decoded == None)  # noqa: E711
+        for index in unknown:
+            decoded.flat[index] = message_name(int(message_types.flat[index]), int(message_ids.flat[index]))
+        return decoded
@@ -0,0 +1,213 @@
+"""Device messages delivered by callback instead of polling.
+
+The dlls queue a message for each device event (a move completing, homing finishing,
+settings changing) and call the function registered with RegisterMessageCallback. A
+MessageQueue registers one callback per device; each drains that device's dll queue
+with GetNextMessage, in bulk, into one shared queue and wakes whatever is waiting on
+it, threads and asyncio tasks alike, so nothing has to spin on MessageQueueSize:
+
+    messages = MessageQueue()
+    messages.register(kcubedcservo, serial_number)
+    kcubedcservo.KVS_MoveToPosition(serial_number, position)
+    for message in messages.get(timeout=10):
+        print(message.serial, message.type, message.id)
+
+    batch = await messages.wait()             # in a coroutine
+
+Messages are (time, serial, type, id, data) tuples, time from the queue's clock when
+the message was drained. message_name gives the name of a type and id, as in
+'GenericMotor.MoveCompleted'.
+"""
+import asyncio
+import threading
+import time
+from collections import deque, namedtuple
+from ctypes import byref, c_ulong, c_ushort
+
+from .definitions.callbacks import MessageCallback
+from .family import family_function, family_prefix, with_channel
+from .serialnumber import SerialNumber
+from .statusbits import status_bits
+
+Message = namedtuple('Message', 'time serial type id data')
+
+# Message types, and the names of their ids, as listed in the Kinesis documentation.
+message_types = {
+    0: ('GenericDevice', {0: 'SettingsInitialized', 1: 'SettingsUpdated', 2: 'Error', 3: 'Close'}),
+    1: ('GenericPiezo', {0: 'MaxVoltageChanged', 1: 'ControlModeChanged', 2: 'StatusChanged', 3: 'MaxTravelChanged',
+                         4: 'TSG_Status', 5: 'TSG_DisplayModeChanged'}),
+    2: ('GenericMotor', {0: 'Homed', 1: 'MoveCompleted', 2: 'MoveStopped', 3: 'LimitUpdated'}),
+    3: ('GenericDCMotor', {0: 'Error', 1: 'Status'}),
+    4: ('GenericSimpleMotor', {}),
+    5: ('RackDevice', {0: 'RackCountEstablished', 1: 'RackBayState'}),
+    6: ('Laser', {0: 'StatusChanged'}),
+    7: ('TECCtlr', {0: 'StatusChanged'}),
+    8: ('Quad', {0: 'StatusChanged'}),
+    9: ('NanoTrak', {0: 'StatusChanged'}),
+    10: ('Specialized', {}),
+    11: ('Solenoid', {0: 'StatusChanged'})}
+
+# Message types each kind of controller sends, besides GenericDevice, keyed by the
+# name of its status bit layout. Benchtop controllers are racks of channels.
+family_types = {
+    'motor': (2, 3, 5),
+    'piezo': (1,),
+    'strain gauge': (1,),
+    'nanotrak': (9,),
+    'laser': (6,),
+    'tec': (7,),
+    'generic': (8, 11)}
+
+
+def message_table(family=None):
+    """Name of every (type, id) a family's devices send, or of every known one.
+
+    family is a wrapper module or its name; names are 'Type.Id', as in
+    'GenericMotor.Homed'.
+    """
+    types = message_types if family is None else (0,) + family_types[status_bits(family).name]
+    return {(type_, id_): '%s.%s' % (message_types[type_][0], name)
+            for type_ in types for id_, name in message_types[type_][1].items()}
+
+
+def message_name(message_type, message_id):
+    """'Type.Id' name of a message, with numbers for what is not in message_types."""
+    type_name, names = message_types.get(message_type, (str(message_type), {}))
+    return '%s.%s' % (type_name, names.get(message_id, message_id))
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
+
+
+class _Registration(object):
+    """The callback of one device (or channel) and the buffers it drains through."""
+
+    def __init__(self, queue, module, serial, channel, prefix):
+        self.serial = serial
+        self.channel = channel
+        prefix = prefix or family_prefix(module)
+        self._register = family_function(module, prefix, 'RegisterMessageCallback')
+        get_next = family_function(module, prefix, 'GetNextMessage')
+        self._type, self._id, self._data = c_ushort(), c_ushort(), c_ulong()
+        self._arguments = with_channel(
+            get_next, channel, (serial, byref(self._type), byref(self._id), byref(self._data)))
+        self._get_next = get_next
+        self._queue = queue
+        self._lock = threading.Lock()
+        # The trampoline the dll calls; it must stay referenced while registered.
+        self.callback = MessageCallback(self.drain)
+
+    def register(self, callback):
+        self._register(*with_channel(self._register, self.channel, (self.serial, callback)))
+
+    def drain(self):
+        """Move every message the dll has queued for the device to the shared queue."""
+        queue = self._queue
+        get_next, arguments = self._get_next, self._arguments
+        serial = str(self.serial)
+        drained = 0
+        with self._lock:
+            now = queue.clock()
+            while get_next(*arguments):
+                queue.put(Message(now, serial, self._type.value, self._id.value, self._data.value))
+                drained += 1
+        if drained:
+            queue.wake()
+        return drained
+
+
+class MessageQueue(object):
+    """Messages of registered devices, in arrival order, from every registered callback.
+
+    The queue is a deque, whose appends and pops are atomic, so the dlls' threads
+    put messages without taking a lock. Readers drain it in bulk: get() blocks a
+    thread and wait() suspends a coroutine until there is at least one message, and
+    both then return everything queued.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self._messages = deque()
+        self._ready = threading.Event()
+        self._waiters = set()
+        self._registrations = {}
+        # Trampolines replaced or unregistered; the dll may still be running one.
+        self._retired = []
+
+    def __repr__(self):
+        return "<MessageQueue %d devices, %d messages>" % (len(self._registrations), len(self))
+
+    def __len__(self):
+        return len(self._messages)
+
+    def register(self, module, serial, channel=None, prefix=None):
+        """Deliver the messages of serial (and channel) through the family module.
+
+        Messages the device queued before registering are drained straight away.
+        """
+        serial = SerialNumber(serial)
+        registration = _Registration(self, module, serial, channel, prefix)
+        previous = self._registrations.get((serial, channel))
+        if previous is not None:
+            self._retired.append(previous)
+        self._registrations[(serial, channel)] = registration
+        registration.register(registration.callback)
+        registration.drain()
+        return registration
+
+    def unregister(self, serial, channel=None):
+        registration = self._registrations.pop((SerialNumber(serial), channel))
+        registration.register(MessageCallback())
+        self._retired.append(registration)
+
+    def put(self, message):
+        self._messages.append(message)
+
+    def wake(self):
+        """Wake the threads and coroutines waiting for messages."""
+        self._ready.set()
+        for loop, future in list(self._waiters):
+            loop.call_soon_threadsafe(_resolve, future)
+
+    def drain(self, limit=None):
+        """Remove and return the queued messages, at most limit of them, without waiting."""
+        messages = self._messages
+        count = len(messages) if limit is None else min(limit, len(messages))
+        pop = messages.popleft
+        return [pop() for _ in range(count)]
+
+    def get(self, timeout=None, limit=None):
+        """Wait up to timeout seconds for messages and return them, [] on time out."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._ready.clear()
+            messages = self.drain(limit)
+            if messages:
+                return messages
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return messages
+            self._ready.wait(remaining)
+
+    async def wait(self, timeout=None, limit=None):
+        """Coroutine version of get(), suspending the task instead of blocking."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            waiter = (loop, loop.create_future())
+            self._waiters.add(waiter)
+            try:
+                messages = self.drain(limit)
+                if messages:
+                    return messages
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return messages
+                try:
+                    await asyncio.wait_for(waiter[1], remaining)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                self._waiters.discard(waiter)
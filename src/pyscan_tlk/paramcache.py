@@ -0,0 +1,131 @@
+"""Read-through cache of motor parameter getters.
+
+Motion code reads the velocity, jog, homing, limit switch and stage parameters before
+nearly every move, and each read is a dll call. A ParameterCache keeps what one device
+(or channel) last returned and only calls the getter again once a setter, a
+RequestSettings or the like has made it stale, or once it is older than max_age:
+
+    params = ParameterCache(kcubedcservo, serial_number, max_age=60)
+    velocity = params.get('VelParamsBlock')        # MOT_VelocityParameters, read once
+    steps, gearbox, pitch = params.get('MotorParamsExt')
+    params.set('VelParams', acceleration, max_velocity)     # writes through, invalidates
+    params.call('RequestSettings')                          # invalidates everything
+
+Getters with a structure out-parameter give the cached structure itself, which must
+be treated as read-only; getters with scalar out-parameters give a tuple. Calls made
+directly through the module rather than through call() or set() do not invalidate
+the cache; max_age bounds how stale it can get.
+"""
+import time
+
+from .family import check_result, default_channel, family_function, family_prefix
+from .serialnumber import SerialNumber
+
+# The calls (without prefix) that leave each cached getter's value stale.
+_velocity = ('SetVelParams', 'SetVelParamsBlock', 'RequestVelParams')
+_jog = ('SetJogParamsBlock', 'SetJogVelParams', 'SetJogMode', 'SetJogStepSize', 'RequestJogParams')
+_motor = ('SetMotorParams', 'SetMotorParamsExt')
+invalidated_by = {
+    'VelParams': _velocity,
+    'VelParamsBlock': _velocity,
+    'JogParamsBlock': _jog,
+    'JogVelParams': _jog,
+    'MotorParams': _motor,
+    'MotorParamsExt': _motor,
+    'HomingParamsBlock': ('SetHomingParamsBlock', 'SetHomingVelocity', 'RequestHomingParams'),
+    'LimitSwitchParamsBlock': ('SetLimitSwitchParams', 'SetLimitSwitchParamsBlock', 'RequestLimitSwitchParams')}
+
+# Calls that leave every cached value stale.
+invalidates_all = ('RequestSettings', 'LoadSettings', 'LoadNamedSettings', 'ResetStageToDefaults')
+
+
+def _stale_after():
+    # Getters made stale by each call.
+    stale = {}
+    for getter, calls in invalidated_by.items():
+        for name in calls:
+            stale.setdefault(name, []).append(getter)
+    return stale
+
+
+class ParameterCache(object):
+    """Cached parameter getters of one device (or channel) of a motor family.
+
+    module is the family's wrapper module and prefix its function prefix, found from
+    the module if it has only one. Families whose functions take a channel use
+    channel, 1 by default. Values older than max_age seconds of clock are read again.
+    """
+
+    _stale = _stale_after()
+
+    def __init__(self, module, serial, channel=None, prefix=None, max_age=None, clock=time.monotonic):
+        self.module = module
+        self.serial = SerialNumber(serial)
+        if prefix is None:
+            prefix = family_prefix(module)
+        self.prefix = prefix
+        self.channel = channel = default_channel(self._function('GetStatusBits'), channel)
+        self._selector = (self.serial,) if channel is None else (self.serial, channel)
+        self.max_age = max_age
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # Getter name -> (value, time read).
+        self._values = {}
+        self._getters = {}
+
+    def __repr__(self):
+        return "<ParameterCache %s_ %s, %d cached>" % (self.prefix, self.serial, len(self._values))
+
+    def _function(self, name):
+        return family_function(self.module, self.prefix, name)
+
+    def _read(self, name):
+        getter = self._getters.get(name)
+        if getter is None:
+            function = self._function('Get' + name)
+            out_types = [argtype._type_ for argtype in function.argtypes[len(self._selector):]]
+            getter = self._getters[name] = (function, out_types)
+        function, out_types = getter
+        outs = [out_type() for out_type in out_types]
+        check_result(self.module, '%s_Get%s' % (self.prefix, name), function(*(self._selector + tuple(outs))), self.serial)
+        if len(outs) == 1 and not hasattr(outs[0], 'value'):
+            return outs[0]
+        return tuple(out.value for out in outs)
+
+    def get(self, name):
+        """Value of the Get<name> getter, from the cache unless stale."""
+        if name not in invalidated_by:
+            raise KeyError("%s is not a cached parameter getter" % name)
+        entry = self._values.get(name)
+        if entry is not None and (self.max_age is None or self.clock() - entry[1] <= self.max_age):
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        now = self.clock()
+        value = self._read(name)
+        self._values[name] = (value, now)
+        return value
+
+    def invalidate(self, name=None):
+        """Forget the cached value of getter name, or of every getter."""
+        if name is None:
+            self._values.clear()
+        else:
+            self._values.pop(name, None)
+
+    def call(self, name, *args):
+        """Call the family's function name for the device and invalidate what it changes."""
+        function = self._function(name)
+        try:
+            result = function(*(self._selector + args))
+        finally:
+            if name in invalidates_all:
+                self._values.clear()
+            for getter in self._stale.get(name, ()):
+                self._values.pop(getter, None)
+        return result
+
+    def set(self, name, *values):
+        """Call Set<name> with values, invalidating the cached Get<name> and its kin."""
+        return self.call('Set' + name, *values)
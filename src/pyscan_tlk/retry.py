@@ -0,0 +1,64 @@
+import functools
+import time
+
+from .definitions.kinesisexception import KinesisException
+
+
+class RetryPolicy(object):
+    """Retry calls that fail with a retryable KinesisException.
+
+    The first retry waits delay seconds and each later one backoff times longer, up to
+    max_delay, for at most attempts calls in all; fatal errors, and the last
+    retryable one, are raised. Failures are only seen as exceptions, so use it with
+    pyscan_tlk.check_errors() or with functions that raise KinesisException
+    themselves. sleep can be replaced, by a simulated clock's sleep for example.
+
+        retry = RetryPolicy(attempts=6)
+        position = retry.call(KVS_RequestPosition, serial_number)
+
+        @retry
+        def step(x):
+            ...
+    """
+
+    def __init__(self, attempts=5, delay=0.05, backoff=2.0, max_delay=2.0, sleep=time.sleep):
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self.attempts = attempts
+        self.delay = delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.retries = 0
+
+    def __repr__(self):
+        return "<RetryPolicy %d attempts, %gs x%g up to %gs>" % (
+            self.attempts, self.delay, self.backoff, self.max_delay)
+
+    def delays(self):
+        """The waits before each retry, attempts - 1 of them."""
+        delay = self.delay
+        for _ in range(self.attempts - 1):
+            yield min(delay, self.max_delay)
+            delay *= self.backoff
+
+    def call(self, function, *args, **kwargs):
+        """Call function, retrying it while it raises a retryable KinesisException."""
+        delays = self.delays()
+        while True:
+            try:
+                return function(*args, **kwargs)
+            except KinesisException as error:
+                if not error.retryable:
+                    raise
+                delay = next(delays, None)
+                if delay is None:
+                    raise
+            self.retries += 1
+            self.sleep(delay)
+
+    def __call__(self, function):
+        @functools.wraps(function)
+        def retried(*args, **kwargs):
+            return self.call(function, *args, **kwargs)
+        return retried
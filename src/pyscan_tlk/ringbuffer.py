@@ -0,0 +1,74 @@
+import numpy
+
+
+class RingBuffer(object):
+    """Fixed-size buffer of timestamped samples, preallocated as a NumPy structured array.
+
+    fields is a list of (name, dtype) pairs; every record also has a float64 'time'
+    field first. Each sample is written twice, at its slot and at the same slot in a
+    mirror half, so the latest n samples are always one contiguous slice and latest(n)
+    returns a view of the buffer instead of a copy. A view stays valid until
+    capacity - n more samples have been appended; copy it to keep it longer.
+
+    A single writer may append while other threads read: a sample is only counted once
+    all of its fields are written.
+    """
+
+    def __init__(self, capacity, fields):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.dtype = numpy.dtype([('time', numpy.float64)] + [(name, dtype) for name, dtype in fields])
+        self.data = numpy.zeros(2 * capacity, dtype=self.dtype)
+        # Field views, so appends assign scalars without building records.
+        self.columns = [self.data[name] for name in self.dtype.names]
+        self.count = 0
+
+    def __repr__(self):
+        return "<RingBuffer %d/%d of %s>" % (len(self), self.capacity, ', '.join(self.dtype.names[1:]))
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, time, values):
+        """Append one sample: its time and a sequence of values, one per field."""
+        index = self.count % self.capacity
+        mirror = index + self.capacity
+        column = self.columns[0]
+        column[index] = column[mirror] = time
+        for column, value in zip(self.columns[1:], values):
+            column[index] = column[mirror] = value
+        self.count += 1
+
+    def extend(self, count, time, values):
+        """Append count samples at once.
+
+        time and each of values, one per field, are arrays of count values or scalars
+        shared by every sample. Only the last capacity samples are kept if count is
+        larger.
+        """
+        if count <= 0:
+            return
+        capacity = self.capacity
+        skip = max(count - capacity, 0)
+        n = count - skip
+        start = (self.count + skip) % capacity
+        first = min(capacity - start, n)
+        rest = n - first
+        for column, value in zip(self.columns, [time] + list(values)):
+            value = numpy.broadcast_to(value, (count,))[skip:]
+            column[start:start + first] = column[start + capacity:start + capacity + first] = value[:first]
+            if rest:
+                column[:rest] = column[capacity:capacity + rest] = value[first:]
+        self.count += count
+
+    def latest(self, n=None):
+        """View of the latest n samples (all of them by default), oldest first."""
+        count = self.count
+        length = min(count, self.capacity)
+        n = length if n is None else min(n, length)
+        start = (count - n) % self.capacity
+        return self.data[start:start + n]
+
+    def clear(self):
+        self.count = 0
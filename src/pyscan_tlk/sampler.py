@@ -0,0 +1,146 @@
+"""Background sampling of device getters into ring buffers.
+
+A Sampler calls a set of getters for one device at a fixed rate from its own thread
+and appends each round, timestamped, to a RingBuffer:
+
+    sampler = Sampler(serial_number, {
+        'position': kcubedcservo.KVS_GetPosition,
+        'status': kcubedcservo.KVS_GetStatusBits}, rate=1000)
+    kcubedcservo.KVS_StartPolling(serial_number, 1)
+    with sampler:
+        ...
+        recent = sampler.latest(500)          # view, no copy
+        plot(recent['time'], recent['position'])
+
+The getters read the values the dll caches while device polling runs, so start it
+(StartPolling) at a period no longer than the sampling period. ctypes releases the
+GIL for each call, so a sampler costs its thread little beyond the calls themselves.
+"""
+import threading
+import time
+from ctypes import _SimpleCData
+
+import numpy
+
+from .definitions.enumeration import simple_type
+from .definitions.kinesisexception import KinesisException
+from .family import resolve
+from .ringbuffer import RingBuffer
+from .serialnumber import SerialNumber
+
+
+def _dtype(function):
+    # The NumPy type of what the getter returns, float64 if it is not a plain number.
+    restype = simple_type(getattr(function, 'restype', None))
+    if isinstance(restype, type) and issubclass(restype, _SimpleCData):
+        try:
+            dtype = numpy.dtype(restype)
+        except TypeError:
+            return numpy.float64
+        if dtype.kind in 'biuf':
+            return dtype
+    return numpy.float64
+
+
+def _getter(spec):
+    # A getter is a function of the serial number or a (function, *arguments) tuple.
+    if isinstance(spec, tuple):
+        function, arguments = spec[0], spec[1:]
+    else:
+        function, arguments = spec, ()
+    return resolve(function), arguments
+
+
+class Sampler(object):
+    """Read getters of one device at rate samples per second into a RingBuffer.
+
+    getters maps each field name to a function taking the serial number, or to a
+    (function, *arguments) tuple for getters taking more, such as a channel. Times
+    come from clock (time.perf_counter by default). If a round falls more than a
+    period behind, the rounds it cannot catch up are counted in missed rather than
+    run back to back. A getter raising KinesisException skips that round; the
+    exception is kept in last_error and counted in errors.
+    """
+
+    def __init__(self, serial, getters, rate, capacity=100000, clock=time.perf_counter):
+        self.serial = SerialNumber(serial)
+        self.names = list(getters)
+        self._getters = [_getter(getters[name]) for name in self.names]
+        fields = [(name, _dtype(function)) for name, (function, _) in zip(self.names, self._getters)]
+        self.buffer = RingBuffer(capacity, fields)
+        # Values of the round being read, reused for every round.
+        self._round = [None] * len(self._getters)
+        self.rate = rate
+        self.clock = clock
+        self.missed = 0
+        self.errors = 0
+        self.last_error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __repr__(self):
+        state = 'running' if self.running else 'stopped'
+        return "<Sampler %s %s at %g Hz, %d samples>" % (self.serial, state, self.rate, self.samples)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def samples(self):
+        """Rounds recorded since the sampler was created or its buffer cleared."""
+        return self.buffer.count
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="Sampler-%s" % self.serial, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def latest(self, n=None):
+        """View of the latest n samples, oldest first; see RingBuffer.latest."""
+        return self.buffer.latest(n)
+
+    def sample(self):
+        """Read every getter once and append the result."""
+        serial = self.serial
+        values = self._round
+        time = self.clock()
+        try:
+            for index, (function, arguments) in enumerate(self._getters):
+                values[index] = function(serial, *arguments)
+        except KinesisException as error:
+            self.errors += 1
+            self.last_error = error
+            return
+        self.buffer.append(time, values)
+
+    def _run(self):
+        period = 1.0 / self.rate
+        wait = self._stop.wait
+        now = time.perf_counter
+        deadline = now()
+        while not self._stop.is_set():
+            self.sample()
+            deadline += period
+            late = now() - deadline
+            if late > 0:
+                skipped = int(late / period)
+                self.missed += skipped
+                deadline += skipped * period
+            else:
+                wait(-late)
@@ -0,0 +1,215 @@
+"""Earliest-deadline-first polling of many devices from a few threads.
+
+A Sampler on its own runs one thread per device. A PollScheduler runs any number of
+samplers, from any families, on a small pool of worker threads instead: each
+sampler keeps its own rate, the worker that comes free next always runs the round
+with the earliest deadline, and priority breaks ties between equal deadlines.
+
+    scheduler = PollScheduler(workers=2)
+    for serial in servos:
+        scheduler.add(Sampler(serial, {'position': kcubedcservo.KVS_GetPosition}, rate=200), priority=1)
+    scheduler.add(Sampler(tec, {'temperature': tcubetec.TC_GetTemperatureReading}, rate=5))
+    with scheduler:
+        ...
+        print(scheduler.statistics())
+"""
+import heapq
+import itertools
+import math
+import threading
+import time
+
+
+class Timing(object):
+    """How late the rounds of one sampler started, in seconds past their deadlines."""
+
+    __slots__ = ('rounds', 'missed', 'mean', 'maximum', '_squares')
+
+    def __init__(self):
+        self.rounds = 0
+        self.missed = 0
+        self.mean = 0.0
+        self.maximum = 0.0
+        self._squares = 0.0
+
+    def record(self, lateness):
+        # Welford's running mean and variance.
+        self.rounds += 1
+        delta = lateness - self.mean
+        self.mean += delta / self.rounds
+        self._squares += delta * (lateness - self.mean)
+        if lateness > self.maximum:
+            self.maximum = lateness
+
+    @property
+    def jitter(self):
+        """Standard deviation of the lateness."""
+        return math.sqrt(self._squares / self.rounds) if self.rounds > 1 else 0.0
+
+
+class _Entry(object):
+
+    __slots__ = ('sampler', 'priority', 'period', 'deadline', 'timing', 'removed')
+
+    def __init__(self, sampler, priority, deadline):
+        self.sampler = sampler
+        self.priority = priority
+        self.period = 1.0 / sampler.rate
+        self.deadline = deadline
+        self.timing = Timing()
+        self.removed = False
+
+
+class PollScheduler(object):
+    """Run the rounds of many Samplers on workers threads, earliest deadline first.
+
+    A round whose deadline has passed by more than its period is not run late: the
+    deadlines it cannot meet are counted as missed and the sampler moves on to the
+    next one, so an overloaded scheduler degrades every device's rate a little rather
+    than starving some. statistics() reports the lateness and misses of every sampler
+    and the share of the workers' time spent running rounds.
+    """
+
+    def __init__(self, workers=1):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self._heap = []
+        self._entries = {}
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+        self._running = False
+        self._threads = []
+        self._busy = 0.0
+        self._started = None
+
+    def __repr__(self):
+        return "<PollScheduler %d samplers on %d workers>" % (len(self._entries), self.workers)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def samplers(self):
+        return [entry.sampler for entry in self._entries.values()]
+
+    def add(self, sampler, priority=0):
+        """Schedule sampler's rounds; higher priority runs first at equal deadlines."""
+        if sampler.running:
+            raise ValueError("%r is already running on its own thread" % sampler)
+        with self._condition:
+            if id(sampler) in self._entries:
+                raise ValueError("%r is already scheduled" % sampler)
+            entry = self._entries[id(sampler)] = _Entry(sampler, priority, time.perf_counter())
+            self._push(entry)
+            self._condition.notify()
+        return sampler
+
+    def remove(self, sampler):
+        with self._condition:
+            self._entries.pop(id(sampler)).removed = True
+
+    def _push(self, entry):
+        heapq.heappush(self._heap, (entry.deadline, -entry.priority, next(self._order), entry))
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._started = now = time.perf_counter()
+            self._busy = 0.0
+            # Rounds not run while stopped are not missed: every deadline starts afresh.
+            self._heap = []
+            for entry in self._entries.values():
+                entry.deadline = now + entry.period
+                self._push(entry)
+        self._threads = [
+            threading.Thread(target=self._work, name="PollScheduler-%d" % n, daemon=True)
+            for n in range(self.workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout=None):
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _next(self):
+        # The entry whose deadline has come, taken off the heap, or None once stopped.
+        now = time.perf_counter
+        with self._condition:
+            while self._running:
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                deadline, _, _, entry = self._heap[0]
+                if entry.removed:
+                    heapq.heappop(self._heap)
+                    continue
+                wait = deadline - now()
+                if wait > 0:
+                    self._condition.wait(wait)
+                    continue
+                heapq.heappop(self._heap)
+                return entry
+        return None
+
+    def _work(self):
+        now = time.perf_counter
+        while True:
+            entry = self._next()
+            if entry is None:
+                return
+            start = now()
+            try:
+                entry.sampler.sample()
+            except Exception as error:
+                # Sampler handles KinesisException itself; anything else, such as a
+                # ctypes ArgumentError, must not end the worker or drop the sampler.
+                entry.sampler.errors += 1
+                entry.sampler.last_error = error
+            finish = now()
+            timing = entry.timing
+            timing.record(start - entry.deadline)
+            entry.deadline += entry.period
+            late = finish - entry.deadline
+            if late > 0:
+                skipped = int(late / entry.period)
+                timing.missed += skipped
+                entry.sampler.missed += skipped
+                entry.deadline += skipped * entry.period
+            with self._condition:
+                self._busy += finish - start
+                if not entry.removed:
+                    self._push(entry)
+                    self._condition.notify()
+
+    def load(self):
+        """Fraction of the workers' time spent running rounds since start()."""
+        if self._started is None:
+            return 0.0
+        elapsed = (time.perf_counter() - self._started) * self.workers
+        return self._busy / elapsed if elapsed > 0 else 0.0
+
+    def statistics(self):
+        """Timing of every sampler, as a list of dicts, one per sampler."""
+        with self._condition:
+            entries = list(self._entries.values())
+        return [{
+            'serial': str(entry.sampler.serial),
+            'rate': entry.sampler.rate,
+            'priority': entry.priority,
+            'samples': entry.sampler.samples,
+            'missed': entry.timing.missed,
+            'errors': entry.sampler.errors,
+            'mean_lateness': entry.timing.mean,
+            'max_lateness': entry.timing.maximum,
+            'jitter': entry.timing.jitter} for entry in entries]
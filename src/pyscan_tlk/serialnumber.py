@@ -0,0 +1,46 @@
+from ctypes import Array, c_char_p
+
+
+class SerialNumber(bytes):
+    """A device serial number encoded once for every call that takes it.
+
+    Every family function takes the serial as POINTER(c_char). ctypes passes a bytes
+    object as a pointer to its own storage, which Python always keeps NUL-terminated,
+    so a SerialNumber goes to the dll with no encoding, copying or c_char_p wrapper on
+    each call. Building c_char_p(bytes(str(serial), "utf-8")) inside a polling loop
+    costs more than the call itself.
+
+        sn = SerialNumber(27000001)
+        while polling:
+            position = KVS_GetPosition(sn)
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, serial):
+        if type(serial) is cls:
+            return serial
+        if isinstance(serial, (c_char_p, Array)):
+            serial = serial.value
+        elif isinstance(serial, int):
+            serial = str(serial).encode()
+        elif isinstance(serial, str):
+            serial = serial.encode('ascii')
+        serial = bytes(serial)
+        if not serial or b'\0' in serial:
+            raise ValueError("invalid serial number %r" % serial)
+        return super().__new__(cls, serial)
+
+    def __repr__(self):
+        return "SerialNumber(%r)" % str(self)
+
+    def __str__(self):
+        return self.decode()
+
+    def __int__(self):
+        return int(self.decode())
+
+    @property
+    def type_id(self):
+        """The device type, given by the first two digits of the serial number."""
+        return int(self[:2])
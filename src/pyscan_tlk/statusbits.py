@@ -0,0 +1,234 @@
+"""Bit layouts of the status words returned by each family's GetStatusBits.
+
+Every family packs its state into a DWORD, with a meaning that depends on the kind of
+controller. Each layout names the bits of one kind, and status_bits(family) gives the
+layout of a wrapper module:
+
+    layout = status_bits('kcubedcservo')
+    layout.decode(KVS_GetStatusBits(serial_number))['moving_forward']
+
+    logged = numpy.fromfile('status.u32', dtype=numpy.uint32)
+    columns = layout.columns(logged)
+    moving = columns['moving_forward'] | columns['moving_reverse']
+
+Bits a layout does not name are left out of decode and columns but still count in
+the raw status word.
+"""
+import operator
+
+
+class StatusBits(object):
+    """Named bits of one kind of status word, given as name=mask keyword arguments."""
+
+    def __init__(self, name, **bits):
+        self.name = name
+        self.bits = dict(sorted(bits.items(), key=operator.itemgetter(1)))
+        self._dtype = None
+        for flag, mask in self.bits.items():
+            if mask <= 0 or mask & (mask - 1) or mask >> 32:
+                raise ValueError("%s is not a single bit of a 32 bit word" % flag)
+
+    def __repr__(self):
+        return "<StatusBits %s: %s>" % (self.name, ', '.join(self.bits))
+
+    def __getitem__(self, flag):
+        return self.bits[flag]
+
+    def __contains__(self, flag):
+        return flag in self.bits
+
+    def __iter__(self):
+        return iter(self.bits)
+
+    def __len__(self):
+        return len(self.bits)
+
+    def decode(self, status):
+        """Each named bit of one status word, as a dict of flag to bool."""
+        return dict((flag, bool(status & mask)) for flag, mask in self.bits.items())
+
+    def flags(self, status):
+        """The names of the bits set in one status word."""
+        return [flag for flag, mask in self.bits.items() if status & mask]
+
+    def encode(self, *flags):
+        """The status word with the named bits set."""
+        status = 0
+        for flag in flags:
+            status |= self.bits[flag]
+        return status
+
+    def dtype(self):
+        """NumPy structured dtype of one unpacked word: a bool field per named bit.
+
+        Each field sits at its bit position in a 32 byte record, one byte per bit
+        with bit 0 first, which is the layout numpy.unpackbits produces.
+        """
+        if self._dtype is None:
+            import numpy
+            self._dtype = numpy.dtype({
+                'names': list(self.bits),
+                'formats': [numpy.bool_] * len(self.bits),
+                'offsets': [mask.bit_length() - 1 for mask in self.bits.values()],
+                'itemsize': 32})
+        return self._dtype
+
+    def columns(self, statuses):
+        """A boolean column for every named bit of an array of status words.
+
+        The words are unpacked in one vectorized pass into a structured array of the
+        same shape, with a field per named bit; columns['homed'] is a bool view of the
+        homed bit of every word, and the whole array converts directly to a table
+        (pandas.DataFrame(columns), for example).
+        """
+        import numpy
+        words = numpy.ascontiguousarray(statuses).astype('<u4', copy=False)
+        unpacked = numpy.unpackbits(words.view(numpy.uint8), bitorder='little')
+        return unpacked.view(self.dtype()).reshape(words.shape)
+
+
+# Common to the motor controllers: DC servo, stepper, brushless, voice coil and
+# inertial motors, the filter flipper and the polarizer paddles.
+MOTOR = StatusBits(
+    'motor',
+    forward_hardware_limit=0x00000001,
+    reverse_hardware_limit=0x00000002,
+    forward_software_limit=0x00000004,
+    reverse_software_limit=0x00000008,
+    moving_forward=0x00000010,
+    moving_reverse=0x00000020,
+    jogging_forward=0x00000040,
+    jogging_reverse=0x00000080,
+    connected=0x00000100,
+    homing=0x00000200,
+    homed=0x00000400,
+    initializing=0x00000800,
+    tracking=0x00001000,
+    settled=0x00002000,
+    position_error=0x00004000,
+    instrument_error=0x00008000,
+    interlock=0x00010000,
+    over_temperature=0x00020000,
+    bus_voltage_fault=0x00040000,
+    commutation_error=0x00080000,
+    digital_input_1=0x00100000,
+    digital_input_2=0x00200000,
+    digital_input_3=0x00400000,
+    digital_input_4=0x00800000,
+    overload=0x01000000,
+    encoder_fault=0x02000000,
+    over_current=0x04000000,
+    bus_current_fault=0x08000000,
+    power_ok=0x10000000,
+    active=0x20000000,
+    error=0x40000000,
+    enabled=0x80000000)
+
+# Piezo drivers, with or without strain gauge or other position feedback.
+PIEZO = StatusBits(
+    'piezo',
+    actuator_connected=0x00000001,
+    zeroed=0x00000010,
+    zeroing=0x00000020,
+    feedback_connected=0x00000100,
+    closed_loop=0x00000400,
+    active=0x20000000,
+    enabled=0x80000000)
+
+NANOTRAK = StatusBits(
+    'nanotrak',
+    tracking=0x00000001,
+    tracking_with_signal=0x00000002,
+    tracking_channel_a=0x00000004,
+    tracking_channel_b=0x00000008,
+    auto_ranging=0x00000010,
+    under_read=0x00000020,
+    over_read=0x00000040,
+    channel_a_connected=0x00010000,
+    channel_b_connected=0x00020000,
+    channel_a_enabled=0x00040000,
+    channel_b_enabled=0x00080000,
+    channel_a_closed_loop=0x00100000,
+    channel_b_closed_loop=0x00200000)
+
+# Laser diode drivers and laser sources.
+LASER = StatusBits(
+    'laser',
+    output_enabled=0x00000001,
+    key_switch_enabled=0x00000002,
+    power_control=0x00000004,
+    interlock_enabled=0x00000008,
+    units_milliamps=0x00000010,
+    units_milliwatts=0x00000020,
+    units_dbm=0x00000040,
+    active=0x20000000,
+    enabled=0x80000000)
+
+TEC = StatusBits(
+    'tec',
+    output_enabled=0x00000001,
+    active=0x20000000,
+    enabled=0x80000000)
+
+STRAIN_GAUGE = StatusBits(
+    'strain gauge',
+    connected=0x00000001,
+    zeroed=0x00000010,
+    zeroing=0x00000020,
+    active=0x20000000,
+    enabled=0x80000000)
+
+# Only the bits every controller reports, for the solenoid and position aligner.
+GENERIC = StatusBits(
+    'generic',
+    active=0x20000000,
+    enabled=0x80000000)
+
+# Layout of each wrapper module's GetStatusBits.
+layouts = {
+    'benchtopbrushlessmotor': MOTOR,
+    'benchtopdcservo': MOTOR,
+    'benchtopnanotrack': NANOTRAK,
+    'benchtoppiezo': PIEZO,
+    'benchtoppiezopdxc2': PIEZO,
+    'benchtopprecisionpiezo': PIEZO,
+    'benchtopsteppermotor': MOTOR,
+    'benchtopvoicecoil': MOTOR,
+    'filterflipper': MOTOR,
+    'integratedprecisionpiezo': PIEZO,
+    'integratedsteppermotor': MOTOR,
+    'kcubebrushlessmotor': MOTOR,
+    'kcubedcservo': MOTOR,
+    'kcubeinertialmotor': MOTOR,
+    'kcubelaserdiode': LASER,
+    'kcubelasersource': LASER,
+    'kcubenanotrack': NANOTRAK,
+    'kcubepiezo': PIEZO,
+    'kcubepiezostraingauge': PIEZO,
+    'kcubepositionaligner': GENERIC,
+    'kcubesolenoid': GENERIC,
+    'kcubesteppermotor': MOTOR,
+    'modularnanotrack': NANOTRAK,
+    'modularsteppermotor': MOTOR,
+    'polarizer': MOTOR,
+    'tcubebrushlessmotor': MOTOR,
+    'tcubeinertialmotor': MOTOR,
+    'tcubelaserdiode': LASER,
+    'tcubelasersource': LASER,
+    'tcubenanotrack': NANOTRAK,
+    'tcubepiezo': PIEZO,
+    'tcubequad': GENERIC,
+    'tcubeservo': MOTOR,
+    'tcubesolenoid': GENERIC,
+    'tcubesteppermotor': MOTOR,
+    'tcubestraingauge': STRAIN_GAUGE,
+    'tcubetec': TEC}
+
+
+def status_bits(family):
+    """The StatusBits layout of a wrapper module, given as the module or its name."""
+    name = getattr(family, '__name__', family).rpartition('.')[2]
+    try:
+        return layouts[name]
+    except KeyError:
+        raise KeyError("no status bit layout for %r" % family) from None
@@ -0,0 +1,72 @@
+"""Reusable out-parameters for getters called in tight loops.
+
+Getters fill structures (and scalars) the caller passes by reference. Making them,
+and the byref() of each, afresh for every call costs as much as a fast call itself.
+A StructPool keeps one set of out-parameters per getter of one device (or channel),
+with the argument tuple already built, and passes the same ones every time:
+
+    pool = StructPool(kcubepositionaligner, serial_number)
+    while scanning:
+        reading = pool.get('GetReading')        # the pool's QD_Readings, refilled
+        record(reading.posDifference.x, reading.sum)
+
+get() gives the pool's own structure, which the next get() of the same getter
+overwrites; copy what must outlive it. Getters with scalar or several out-parameters
+give the tuple of the pool's ctypes objects. A pool belongs to one thread.
+"""
+import functools
+from ctypes import Structure, _Pointer, byref
+
+from .definitions.kinesisexception import KinesisException
+from .family import default_channel, family_function, family_prefix, unchecked_error_code
+from .serialnumber import SerialNumber
+
+
+class StructPool(object):
+    """Preallocated out-parameters of the getters of one device (or channel) of a family.
+
+    module is the family's wrapper module and prefix its function prefix, found from
+    the module if it has only one. Families whose functions take a channel use
+    channel, 1 by default. Getters are named without prefix, as in 'GetReading'; any
+    function whose arguments after the serial (and channel) are all by reference
+    will do.
+    """
+
+    def __init__(self, module, serial, channel=None, prefix=None):
+        self.module = module
+        self.serial = SerialNumber(serial)
+        if prefix is None:
+            prefix = family_prefix(module)
+        self.prefix = prefix
+        self.channel = channel = default_channel(family_function(module, prefix, 'GetStatusBits'), channel)
+        self._selector = (self.serial,) if channel is None else (self.serial, channel)
+        # Getter name -> (call with the pooled arguments, result, checks errors, out-parameters).
+        self._getters = {}
+
+    def __repr__(self):
+        return "<StructPool %s_ %s, %d getters>" % (self.prefix, self.serial, len(self._getters))
+
+    def _getter(self, name):
+        function = family_function(self.module, self.prefix, name)
+        argtypes = function.argtypes[len(self._selector):]
+        if not argtypes or not all(issubclass(argtype, _Pointer) for argtype in argtypes):
+            raise ValueError("%s_%s does not take only out-parameters" % (self.prefix, name))
+        outs = tuple(argtype._type_() for argtype in argtypes)
+        arguments = self._selector + tuple(byref(out) for out in outs)
+        result = outs[0] if len(outs) == 1 and isinstance(outs[0], Structure) else outs
+        checks = unchecked_error_code(self.module, '%s_%s' % (self.prefix, name))
+        getter = self._getters[name] = (functools.partial(function, *arguments), result, checks, outs)
+        return getter
+
+    def outs(self, name):
+        """The pool's out-parameters of getter name, without calling it."""
+        getter = self._getters.get(name) or self._getter(name)
+        return getter[3]
+
+    def get(self, name):
+        """Call getter name and give its refilled out-parameters."""
+        call, result, checks, _ = self._getters.get(name) or self._getter(name)
+        code = call()
+        if code and checks:
+            raise KinesisException(code, '%s_%s' % (self.prefix, name), str(self.serial))
+        return result
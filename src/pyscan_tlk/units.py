@@ -0,0 +1,144 @@
+"""Conversion between real units and device units for whole arrays at once.
+
+GetDeviceUnitFromRealValue and GetRealValueFromDeviceUnit convert one value per dll
+call. The conversion is a fixed scale per unit type, set by the stage (its
+MotorParamsExt) and the controller (its sampling and velocity resolution), so a
+UnitConverter reads the stage parameters once and converts NumPy arrays of any size
+with the same arithmetic as the dll:
+
+    units = UnitConverter(kcubedcservo, serial_number)
+    trajectory = units.to_device(numpy.linspace(0.0, 25.0, 100000))      # mm -> counts
+    velocities = units.to_device(speeds, 'velocity')                       # mm/s
+    positions = units.to_real(logged['position'])                          # counts -> mm
+    units.check()        # compare a spread of values against the dll itself
+
+Device units are rounded to the nearest integer, halves away from zero.
+"""
+import numpy
+
+from .family import check_result, family_function
+from .paramcache import ParameterCache
+
+# The dll's unitType argument for each kind of quantity.
+unit_types = {'position': 0, 'velocity': 1, 'acceleration': 2}
+
+# Per family prefix: device units of velocity per count/s and of acceleration per
+# count/s^2, and the microsteps per step of the stage's steps per revolution, or None
+# for families whose MotorParamsExt gives counts per real unit directly.
+#
+# The scales are the conversion factors of the Thorlabs APT Communications Protocol
+# ("Conversion between position, velocity and acceleration values in standard
+# physical units"), rounded as it gives them. DC servo controllers (KDC101, TDC001)
+# sample every T = 2048 / 6e6 s and brushless ones (KBD101, BBD20x) every
+# T = 102.4e-6 s, so a velocity is counts/s * T * 65536 and an acceleration
+# counts/s^2 * T^2 * 65536. Stepper controllers (KST101, BSC20x) state their factors
+# per microstep directly, with 2048 microsteps to a full step.
+_dc_servo = (22.369621, 0.0076355, 1)
+_stepper = (53.687091, 0.0109951, 2048)
+_brushless = (6.7108864, 0.00068719, None)
+controllers = {
+    'KVS': _dc_servo,
+    'CC': _dc_servo,
+    'BDC': _dc_servo,
+    'SCC': _stepper,
+    'ISC': _stepper,
+    'SBC': _stepper,
+    'BMC': _brushless}
+
+
+def counts_per_unit(motor_params, microsteps):
+    """Device position units per real unit, from MotorParamsExt values."""
+    if microsteps is None:
+        return motor_params[0]
+    steps_per_rev, gearbox_ratio, pitch = motor_params
+    return steps_per_rev * microsteps * gearbox_ratio / pitch
+
+
+_int32_max = numpy.iinfo(numpy.int32).max
+
+
+def _round(values):
+    # Nearest integer, halves away from zero.
+    return numpy.trunc(values + numpy.copysign(0.5, values))
+
+
+class UnitConverter(object):
+    """Real unit <-> device unit conversion of one device (or channel) of a motor family.
+
+    The stage parameters come from params, a ParameterCache of the device, or one made
+    for it; refresh() reads them again after the stage changes. Families not listed in
+    controllers need controller, a (velocity scale, acceleration scale, microsteps)
+    tuple like theirs.
+    """
+
+    def __init__(self, module, serial, channel=None, prefix=None, params=None, controller=None):
+        if params is None:
+            params = ParameterCache(module, serial, channel, prefix)
+        self.params = params
+        if controller is None:
+            try:
+                controller = controllers[params.prefix]
+            except KeyError:
+                raise ValueError("no unit scales for %s_ devices; give controller" % params.prefix) from None
+        self.controller = controller
+        self.scales = {}
+        self.refresh()
+
+    def __repr__(self):
+        return "<UnitConverter %s_ %s, %g counts per unit>" % (
+            self.params.prefix, self.params.serial, self.scales['position'])
+
+    def refresh(self):
+        """Read the stage parameters again and recompute the scales."""
+        self.params.invalidate('MotorParamsExt')
+        velocity_scale, acceleration_scale, microsteps = self.controller
+        counts = counts_per_unit(self.params.get('MotorParamsExt'), microsteps)
+        self.scales = {
+            'position': counts,
+            'velocity': counts * velocity_scale,
+            'acceleration': counts * acceleration_scale}
+
+    def to_device(self, values, unit='position'):
+        """Device units (int32) of real values, an array or a scalar."""
+        rounded = _round(numpy.asarray(values, dtype=numpy.float64) * self.scales[unit])
+        if not numpy.all(numpy.abs(rounded) <= _int32_max):
+            raise OverflowError("%s outside the range of device units" % unit)
+        return rounded.astype(numpy.int32)
+
+    def to_real(self, values, unit='position'):
+        """Real values (float64) of device units, an array or a scalar."""
+        return numpy.asarray(values, dtype=numpy.float64) / self.scales[unit]
+
+    def check(self, values=None, unit=None):
+        """Compare conversions of values with the dll's, raising ValueError on a difference.
+
+        values are real values; by default a spread of values from 1e-3 to 10 of both
+        signs. Every unit type is checked unless unit is given. Costs two dll calls
+        per value and unit type.
+        """
+        if values is None:
+            magnitudes = numpy.logspace(-3, 1, 25)
+            values = numpy.concatenate([magnitudes, -magnitudes, [0.0]])
+        values = numpy.asarray(values, dtype=numpy.float64)
+        params = self.params
+        to_device = family_function(params.module, params.prefix, 'GetDeviceUnitFromRealValue')
+        to_real = family_function(params.module, params.prefix, 'GetRealValueFromDeviceUnit')
+        device_value = to_device.argtypes[len(params._selector) + 1]._type_()
+        real_value = to_real.argtypes[len(params._selector) + 1]._type_()
+        for name in [unit] if unit else unit_types:
+            converted = self.to_device(values, name)
+            for value, device in zip(values.tolist(), converted.tolist()):
+                self._call(to_device, params._selector + (value, device_value, unit_types[name]))
+                if device_value.value != device:
+                    raise ValueError("%s %r converts to %d device units, the dll gives %d"
+                                     % (name, value, device, device_value.value))
+                self._call(to_real, params._selector + (device, real_value, unit_types[name]))
+                real = float(self.to_real(device, name))
+                if real_value.value != real:
+                    raise ValueError("%s of %d device units converts to %r, the dll gives %r"
+                                     % (name, device, real, real_value.value))
+        return True
+
+    def _call(self, function, arguments):
+        params = self.params
+        check_result(params.module, function.__name__, function(*arguments), params.serial)
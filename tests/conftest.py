@@ -0,0 +1,75 @@
+import sys
+
+import pytest
+
+from pyscan_tlk import backend
+from pyscan_tlk.backend.lazylibrary import LazyLibrary, set_loader
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'simulated(**options): options of the simulated backend fixture')
+
+
+class StandInFunction(object):
+
+    def __init__(self, name, calls, result=0):
+        self.name = name
+        self.calls = calls
+        self.result = result
+        self.restype = None
+        self.argtypes = None
+
+    def __call__(self, *args):
+        self.calls.append((self.name, args))
+        return self.result() if callable(self.result) else self.result
+
+
+class StandInLibrary(object):
+    """Loader result that accepts any symbol and records every call made through it."""
+
+    def __init__(self, path, calls, results=None):
+        self.path = path
+        self.calls = calls
+        self.results = results if results is not None else {}
+
+    def __getattr__(self, name):
+        function = StandInFunction(name, self.calls, self.results.get(name, 0))
+        setattr(self, name, function)
+        return function
+
+
+def _reset_libraries():
+    for name, module in list(sys.modules.items()):
+        if name.startswith('pyscan_tlk.') and isinstance(getattr(module, 'lib', None), LazyLibrary):
+            module.lib.reset()
+
+
+class StandInLoader(object):
+
+    def __init__(self):
+        self.loaded = []
+        self.calls = []
+        self.results = {}
+
+    def __call__(self, path):
+        self.loaded.append(path)
+        return StandInLibrary(path, self.calls, self.results)
+
+
+@pytest.fixture
+def standin():
+    loader = StandInLoader()
+    previous = set_loader(loader)
+    _reset_libraries()
+    yield loader
+    set_loader(previous)
+    _reset_libraries()
+
+
+@pytest.fixture
+def simulated(request):
+    """The simulated backend, built with the options of the nearest simulated mark."""
+    marker = request.node.get_closest_marker('simulated')
+    previous = backend.get_backend()
+    yield backend.use_backend('simulated', **(marker.kwargs if marker is not None else {}))
+    backend.use_backend(previous)
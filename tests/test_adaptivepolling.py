@@ -0,0 +1,102 @@
+import time
+from ctypes import c_char_p
+
+import pytest
+
+from pyscan_tlk import benchtopbrushlessmotor, kcubedcservo, kcubeinertialmotor, kcubepiezo
+from pyscan_tlk.adaptivepolling import AdaptivePolling
+from pyscan_tlk.backend.simulatedmotor import SimulatedBenchtopBrushlessMotor, SimulatedMotor
+from pyscan_tlk.definitions.kinesisexception import KinesisException
+
+servo = c_char_p(b'27000001')
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '29000001', '97000001', '73000001'], speed=None)
+
+
+def test_follows_motion(simulated):
+    clock = simulated.clock
+    device = simulated.device(b'27000001', SimulatedMotor)
+    polling = AdaptivePolling(clock=clock.now)
+    polled = polling.add(kcubedcservo, 27000001, fast=10, slow=1000, linger=0.5)
+    assert device.polling_duration == 1000
+
+    kcubedcservo.KVS_MoveToPosition(servo, 10000)
+    polling.update()
+    assert device.polling_duration == 10
+    end = device.axis(1).move.end
+    while clock.now() < end:
+        clock.advance(0.1)
+        polling.update()
+        assert device.polling_duration == 10
+    clock.advance(0.6)
+    polling.update()
+    assert device.polling_duration == 1000
+    assert polled.changes == 3
+
+    polling.kick(27000001)
+    assert device.polling_duration == 10
+
+
+def test_follows_subscribers(simulated):
+    clock = simulated.clock
+    polling = AdaptivePolling(clock=clock.now)
+    piezo = polling.add(kcubepiezo, 29000001, fast=20, slow=500, linger=0)
+    assert piezo.moving_mask == 0 and piezo.period == 500
+    with polling.subscribe('29000001'):
+        assert piezo.period == 20
+        clock.advance(5)
+        polling.update()
+        assert piezo.period == 20
+    clock.advance(0.1)
+    polling.update()
+    assert piezo.period == 500
+
+
+def test_channels(simulated):
+    polling = AdaptivePolling(clock=simulated.clock.now)
+    inertial = polling.add(kcubeinertialmotor, 97000001, status_channels=[1, 2, 3, 4], slow=200)
+    assert inertial.period == 200
+    assert kcubeinertialmotor.KIM_MoveAbsolute(c_char_p(b'97000001'), 3, 1000) == 0
+    polling.update()
+    assert inertial.period == 10
+    with pytest.raises(KeyError):
+        polling.kick(97000002)
+
+
+def test_channel_polling(simulated):
+    polling = AdaptivePolling(clock=simulated.clock.now)
+    bench = polling.add(benchtopbrushlessmotor, 73000001, channel=2, slow=300)
+    assert bench.status_channels == [2]
+    assert simulated.device(b'73000001', SimulatedBenchtopBrushlessMotor).polling_duration == 300
+
+    # Without a channel a benchtop controller polls channel 1.
+    first = polling.add(benchtopbrushlessmotor, 73000001, slow=400)
+    assert first.channel == 1 and first.status_channels == [1]
+    assert set(polling.devices) == {(b'73000001', 1), (b'73000001', 2)}
+    polling.kick(73000001, 1)
+    with polling.subscribe(73000001) as device:
+        assert device is first
+    assert polling.remove(73000001, 1) is first
+    with pytest.raises(ValueError):
+        polling.add(kcubedcservo, 27000001, channel=2)
+
+
+def test_thread_errors(simulated, monkeypatch):
+    polling = AdaptivePolling(interval=0.01, clock=simulated.clock.now)
+    broken = polling.add(kcubedcservo, 27000001, slow=1000)
+    piezo = polling.add(kcubepiezo, 29000001, slow=500, linger=0)
+
+    def moving():
+        raise KinesisException(2, 'KVS_GetStatusBits', '27000001')
+    monkeypatch.setattr(broken, 'moving', moving)
+    with polling:
+        piezo.subscribers += 1
+        deadline = time.monotonic() + 5
+        while piezo.period != 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert piezo.period == 10
+    assert polling.errors > 0
+    assert isinstance(polling.last_error, KinesisException)
+    with pytest.raises(KinesisException):
+        polling.update()
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+import pytest
+
+from pyscan_tlk import backend, filterflipper, kcubedcservo, kcubeinertialmotor, polarizer
+from pyscan_tlk.asyncstage import AsyncStage
+from pyscan_tlk.backend.simulatedmotor import SimulatedInertialMotor, SimulatedMotor
+from pyscan_tlk.definitions.kinesisexception import KinesisException
+
+servos = ['27000001', '27000002', '27000003']
+
+
+pytestmark = pytest.mark.simulated(devices=servos + ['97000001'], speed=100)
+
+
+def test_concurrent_moves(simulated):
+    stages = [AsyncStage(kcubedcservo, serial) for serial in servos]
+    assert stages[0].prefix == 'KVS' and stages[0].channel is None
+
+    async def run():
+        await asyncio.gather(*(stage.home() for stage in stages))
+        await asyncio.gather(*(stage.move_to(10000 * (n + 1)) for n, stage in enumerate(stages)))
+        return [await stage.position() for stage in stages]
+
+    assert asyncio.run(run()) == [10000, 20000, 30000]
+    for serial in servos:
+        axis = simulated.device(serial.encode(), SimulatedMotor).axis(1)
+        assert axis.homed and axis.move is None
+
+
+def test_move_by(simulated):
+    stage = AsyncStage(kcubedcservo, servos[0])
+
+    async def run():
+        await stage.move_to(5000)
+        await stage.move_by(-2000)
+        await stage.move_by(0)
+        return await stage.position()
+
+    assert asyncio.run(run()) == 3000
+
+
+def test_messages(simulated):
+    # Polling alone would take 5 s to notice the end of each move.
+    stage = AsyncStage(kcubedcservo, servos[0], poll_interval=5, messages=True)
+
+    async def run():
+        await stage.home()
+        await stage.move_to(20000)
+        return await stage.position()
+
+    start = time.monotonic()
+    assert asyncio.run(run()) == 20000
+    assert time.monotonic() - start < 2.5
+
+
+def test_no_relative_move():
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncStage(filterflipper, '37000001').move_by(1))
+
+
+def test_tolerance():
+    stage = AsyncStage(polarizer, '38000001', channel=2)
+    assert stage.tolerance == 1e-3
+
+    async def position():
+        return 45.0000000001
+    stage.position = position
+    assert asyncio.run(stage._at(45.0))
+    assert not asyncio.run(stage._at(45.01))
+    assert AsyncStage(kcubedcservo, servos[0]).tolerance == 0
+
+
+def test_cancel_stops(simulated):
+    stage = AsyncStage(kcubedcservo, servos[0])
+    axis = simulated.device(servos[0].encode(), SimulatedMotor).axis(1)
+
+    async def run():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(stage.move_to(10 ** 7), 0.05)
+        return await stage.status_bits()
+
+    asyncio.run(run())
+    move = axis.move
+    assert move is None or move.target != 10 ** 7
+    assert 0 < axis.get_position() < 10 ** 7
+
+
+def test_channel(simulated):
+    stage = AsyncStage(kcubeinertialmotor, '97000001', channel=2)
+    assert stage.prefix == 'KIM'
+    device = simulated.device(b'97000001', SimulatedInertialMotor)
+
+    async def run():
+        await stage.move_to(500)
+        return await stage.position()
+
+    assert asyncio.run(run()) == 500
+    assert device.axis(2).get_position() == 500 and device.axis(1).get_position() == 0
+
+
+def test_errors(simulated):
+    stage = AsyncStage(kcubedcservo, '27999999')
+    with pytest.raises(KinesisException):
+        asyncio.run(stage.move_to(100))
+    with pytest.raises(ValueError):
+        AsyncStage(backend, servos[0])
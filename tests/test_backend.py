@@ -0,0 +1,71 @@
+import os
+from ctypes import c_char_p, create_string_buffer
+
+import pytest
+
+from pyscan_tlk import backend, kcubedcservo, kcubepiezo, tcubepiezo
+from pyscan_tlk.backend.kinesis import KinesisBackend
+from pyscan_tlk.backend.simulated import SimulatedBackend
+
+simulations = os.path.join(os.path.dirname(__file__), '..', 'test_wrappers', 'Simulations.Simulations')
+
+
+pytestmark = pytest.mark.simulated(devices=['29000001', '29000002'], simulations=simulations)
+
+
+def test_kinesis_path_from_environment(monkeypatch):
+    monkeypatch.setenv('PYSCAN_TLK_KINESIS_PATH', '/opt/kinesis')
+    assert KinesisBackend().path == '/opt/kinesis'
+    assert KinesisBackend('/elsewhere').path == '/elsewhere'
+
+
+def test_backend_from_environment(monkeypatch):
+    previous = backend.get_backend()
+    monkeypatch.setenv('PYSCAN_TLK_BACKEND', 'simulated')
+    try:
+        assert isinstance(backend.use_backend(), SimulatedBackend)
+    finally:
+        backend.use_backend(previous)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        backend.use_backend('nonexistent')
+
+
+def test_simulated_device_list(simulated):
+    assert kcubepiezo.TLI_BuildDeviceList() == 0
+    assert kcubepiezo.TLI_GetDeviceListSize() == 3
+    buffer = create_string_buffer(64)
+    assert kcubepiezo.TLI_GetDeviceListExt(buffer, 64) == 0
+    assert buffer.value == b'29000001,29000002,81000001'
+    assert kcubepiezo.TLI_GetDeviceListByTypeExt(buffer, 64, 81) == 0
+    assert buffer.value == b'81000001'
+
+
+def test_simulated_piezo(simulated):
+    sn = c_char_p(b'81000001')
+    assert tcubepiezo.PCC_Open(sn) == 0
+    assert tcubepiezo.PCC_CheckConnection(sn)
+    assert tcubepiezo.PCC_SetOutputVoltage(sn, 100) == 0
+    assert tcubepiezo.PCC_GetOutputVoltage(sn) == 100
+    assert tcubepiezo.PCC_GetMaxOutputVoltage(sn) == 750
+    tcubepiezo.PCC_Close(sn)
+    assert not tcubepiezo.PCC_CheckConnection(sn)
+
+    # Each device keeps its own state.
+    assert kcubepiezo.PCC_GetOutputVoltage(c_char_p(b'29000001')) == 0
+
+
+def test_unknown_serial_and_missing_export(simulated):
+    assert kcubepiezo.PCC_Open(c_char_p(b'12345678')) == 2
+    with pytest.raises(AttributeError):
+        kcubepiezo.PCC_SetLUTwaveParams(c_char_p(b'29000001'), None)
+
+
+def test_switching_backend_reloads(simulated):
+    kcubedcservo.KVS_Open(c_char_p(b'29000001'))
+    assert kcubedcservo.lib.loaded
+    backend.use_backend(SimulatedBackend())
+    assert not kcubedcservo.lib.loaded
+    assert kcubedcservo.KVS_Open(c_char_p(b'29000001')) == 2
@@ -0,0 +1,40 @@
+import threading
+import time
+
+from pyscan_tlk import devicemanager, kcubedcservo, kcubepiezo, tcubetec
+
+
+def test_families_share_device_manager_bindings():
+    for module in (kcubedcservo, kcubepiezo, tcubetec):
+        assert module.TLI_BuildDeviceList is devicemanager.TLI_BuildDeviceList
+        assert module.TLI_GetDeviceListSize is devicemanager.TLI_GetDeviceListSize
+        assert not hasattr(module, 'device_manager')
+
+
+def test_tli_calls_go_to_device_manager_dll(standin):
+    kcubepiezo.TLI_GetDeviceListSize()
+    assert standin.loaded == [devicemanager.lib.path]
+    assert not kcubepiezo.lib.loaded
+
+
+def test_concurrent_builds_are_coalesced(standin):
+    started = threading.Event()
+
+    def slow_build():
+        started.set()
+        time.sleep(0.05)
+        return 0
+
+    standin.results['TLI_BuildDeviceList'] = slow_build
+    builds = devicemanager.device_list_builds()
+    first = threading.Thread(target=kcubedcservo.TLI_BuildDeviceList)
+    first.start()
+    started.wait()
+    others = [threading.Thread(target=module.TLI_BuildDeviceList) for module in (kcubepiezo, tcubetec)]
+    for thread in others:
+        thread.start()
+    for thread in [first] + others:
+        thread.join()
+
+    assert [call[0] for call in standin.calls].count('TLI_BuildDeviceList') == 1
+    assert devicemanager.device_list_builds() == builds + 1
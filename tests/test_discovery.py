@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from pyscan_tlk import devicemanager
+from pyscan_tlk.definitions.kinesisexception import FT_DeviceNotFound, KinesisException
+from pyscan_tlk.discovery import Change, DeviceDiscovery
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '26000001'], speed=None)
+
+
+def test_cached_until_stale(simulated):
+    clock = Clock()
+    discovery = DeviceDiscovery(ttl=5.0, clock=clock)
+    builds = devicemanager.device_list_builds()
+    assert discovery.serials() == ['26000001', '27000001']
+    assert discovery.serials(type_id=27) == ['27000001']
+    info = discovery.info(27000001)
+    assert (info.typeID, info.serialNo) == (27, b'27000001')
+
+    # Within the ttl nothing is scanned again, even for new devices.
+    simulated.add_device('28000001')
+    clock.time = 4.0
+    assert discovery.serials() == ['26000001', '27000001']
+    assert discovery.info('27000001') is info
+    assert devicemanager.device_list_builds() == builds + 1
+
+    clock.time = 5.5
+    assert '28000001' in discovery.devices()
+    assert discovery.info('27000001') is info
+    assert discovery.scans == 2
+    with pytest.raises(KeyError):
+        discovery.info('83000001')
+
+
+def test_hot_plug(simulated):
+    discovery = DeviceDiscovery(ttl=None)
+    changes = []
+    discovery.subscribe(changes.append)
+    assert discovery.refresh() == Change(['26000001', '27000001'], [])
+
+    simulated.add_device('28000001')
+    simulated.remove_device('26000001')
+    assert discovery.refresh() == Change(['28000001'], ['26000001'])
+    assert discovery.refresh() == Change([], [])
+    assert changes == [Change(['26000001', '27000001'], []), Change(['28000001'], ['26000001'])]
+
+    discovery.unsubscribe(changes.append)
+    simulated.remove_device('28000001')
+    discovery.refresh()
+    assert len(changes) == 2
+    assert discovery.serials() == ['27000001']
+
+
+def test_background_refresh(simulated):
+    discovery = DeviceDiscovery(ttl=None, interval=0.01)
+    discovery.refresh()
+    plugged = threading.Event()
+    discovery.subscribe(lambda change: plugged.set())
+    with discovery:
+        simulated.add_device('28000001')
+        assert plugged.wait(5)
+    assert '28000001' in discovery.serials()
+
+
+def test_unreadable_device_skipped(simulated, monkeypatch):
+    device_info = devicemanager.device_info
+
+    def failing(serial):
+        if serial == '26000001':
+            raise FT_DeviceNotFound(function='TLI_GetDeviceInfo', serial=serial)
+        return device_info(serial)
+    monkeypatch.setattr(devicemanager, 'device_info', failing)
+    discovery = DeviceDiscovery(ttl=None)
+    assert discovery.refresh() == Change(['27000001'], [])
+    assert discovery.serials() == ['27000001']
+    assert isinstance(discovery.error, FT_DeviceNotFound)
+
+    monkeypatch.setattr(devicemanager, 'device_info', device_info)
+    assert discovery.refresh() == Change(['26000001'], [])
+    assert discovery.error is None
+
+
+def test_failed_rescan_keeps_cache(simulated, monkeypatch):
+    clock = Clock()
+    discovery = DeviceDiscovery(ttl=5.0, clock=clock)
+    assert discovery.serials() == ['26000001', '27000001']
+
+    monkeypatch.setattr(devicemanager, 'TLI_BuildDeviceList', lambda: 1)
+    clock.time = 10.0
+    assert discovery.serials() == ['26000001', '27000001']
+    assert discovery.error.code == 1
+    with pytest.raises(KinesisException):
+        DeviceDiscovery(clock=clock).serials()
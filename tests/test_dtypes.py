@@ -0,0 +1,69 @@
+import ctypes
+
+import pytest
+
+from pyscan_tlk.definitions import structures
+from pyscan_tlk.definitions.structures import (
+    MOT_JogParameters,
+    MOT_VelocityParameters,
+    QD_Readings,
+    TLI_DeviceInfo,
+    TLI_HardwareInformation)
+
+numpy = pytest.importorskip('numpy')
+from pyscan_tlk.definitions.dtypes import as_array, as_structures, dtype_of  # noqa: E402
+
+every_structure = sorted(
+    (value for value in vars(structures).values()
+     if isinstance(value, type) and issubclass(value, ctypes.Structure) and value is not ctypes.Structure),
+    key=lambda structure: structure.__name__)
+
+
+@pytest.mark.parametrize('structure', every_structure, ids=lambda structure: structure.__name__)
+def test_layout(structure):
+    dtype = dtype_of(structure)
+    assert dtype.itemsize == ctypes.sizeof(structure)
+    assert dtype.names == tuple(field[0] for field in structure._fields_)
+    for name in dtype.names:
+        assert dtype.fields[name][1] == getattr(structure, name).offset
+    # The same bytes, read through either.
+    value = structure.from_buffer_copy(bytes(range(1, ctypes.sizeof(structure) + 1)))
+    assert as_array(value).tobytes() == bytes(value)
+
+
+def test_fields():
+    assert dtype_of('QD_Readings') is dtype_of(QD_Readings)
+    info = dtype_of(TLI_DeviceInfo)
+    assert info['description'] == numpy.dtype('S65')
+    assert info['motorType'].kind == 'i'
+    assert dtype_of(MOT_JogParameters)['velParams'] == dtype_of(MOT_VelocityParameters)
+    assert dtype_of(TLI_HardwareInformation)['deviceDependantData'].shape == (12,)
+
+
+def test_shared_memory():
+    readings = (QD_Readings * 3)()
+    readings[1].posDifference.x = 5
+    table = as_array(readings)
+    assert table.shape == (3,)
+    assert list(table['posDifference']['x']) == [0, 5, 0]
+    table['sum'][2] = 7
+    assert readings[2].sum == 7
+
+    info = TLI_DeviceInfo()
+    info.serialNo = b'27000001'
+    assert as_array(info).shape == ()
+    assert as_array(info)['serialNo'] == b'27000001'
+
+    log = numpy.zeros(4, dtype_of(MOT_VelocityParameters))
+    params = as_structures(log, MOT_VelocityParameters)
+    params[2].maxVelocity = 9
+    assert log['maxVelocity'][2] == 9
+
+
+def test_layout_mismatch():
+    with pytest.raises(ValueError):
+        as_structures(numpy.zeros(4, numpy.int32), MOT_VelocityParameters)
+    with pytest.raises(ValueError):
+        as_structures(numpy.zeros(8, dtype_of(MOT_VelocityParameters))[::2], MOT_VelocityParameters)
+    with pytest.raises(TypeError):
+        as_array((ctypes.c_int * 3)())
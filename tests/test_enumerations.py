@@ -0,0 +1,70 @@
+from ctypes import CDLL, Structure, c_short
+from ctypes.util import find_library
+
+import pytest
+
+from pyscan_tlk.definitions import enumerations
+from pyscan_tlk.definitions.enumeration import simple_type
+from pyscan_tlk.definitions.enumerations import (
+    HubAnalogueModes,
+    KIM_Channels,
+    MOT_HomeLimitSwitchDirection,
+    MOT_StopModes,
+    MOT_TravelDirection,
+    POL_PaddleBits)
+
+
+def test_lookups():
+    assert MOT_StopModes.profiled == 2
+    assert MOT_StopModes.profiled.name == 'profiled'
+    assert MOT_StopModes.name_of(1) == 'immediate'
+    assert MOT_StopModes.name_of(c_short(1)) == 'immediate'
+    assert MOT_StopModes.name_of(7) is None
+    assert MOT_StopModes['immediate'] == 1
+    assert 2 in MOT_StopModes and 7 not in MOT_StopModes
+    assert [member.name for member in MOT_TravelDirection] == ['undefined', 'fowards', 'reverse']
+    assert repr(MOT_StopModes.profiled) == '<MOT_StopModes.profiled: 2>'
+    with pytest.raises(KeyError):
+        MOT_StopModes['sideways']
+
+
+def test_values():
+    assert KIM_Channels.Channel3 == 3
+    assert list(HubAnalogueModes) == [1, 2, 3]
+    assert MOT_HomeLimitSwitchDirection.forward == 4
+    # Aliases share a value; the first name declared is the one decoded.
+    assert POL_PaddleBits.name_of(4) == 'PaddleBit4'
+    assert enumerations.Channel3 == 3
+    assert isinstance(enumerations.profiled, MOT_StopModes)
+
+
+def test_ctypes():
+    assert simple_type(MOT_StopModes) is c_short
+    assert simple_type(c_short) is c_short
+
+    class Parameters(Structure):
+        _fields_ = [("stop", MOT_StopModes), ("count", c_short)]
+
+    parameters = Parameters(MOT_StopModes.profiled, 3)
+    assert parameters.stop == 2 and parameters.stop.name == 'profiled'
+    parameters.stop = 1
+    assert parameters.stop.name == 'immediate'
+
+    labs = CDLL(find_library('c') or find_library('msvcrt')).labs
+    labs.restype = MOT_StopModes
+    labs.argtypes = [MOT_StopModes]
+    assert type(labs(-2)) is int and labs(MOT_StopModes.profiled) == 2
+
+
+def test_decode():
+    assert MOT_StopModes.decode([0, 2, 9]) == ['undefined', 'profiled', None]
+    numpy = pytest.importorskip('numpy')
+    raw = numpy.array([[2, 1], [0, 9]], dtype=numpy.int16)
+    decoded = MOT_StopModes.decode(raw, default='?')
+    assert decoded.shape == (2, 2)
+    assert decoded.tolist() == [['profiled', 'immediate'], ['undefined', '?']]
+    assert MOT_StopModes.decode(numpy.array([-1, 3])).tolist() == [None, None]
+    assert MOT_StopModes.decode(numpy.int16(2)) == 'profiled'
+    assert enumerations.FF_Positions.decode(numpy.zeros(3)).tolist() == [None] * 3
+    flags = enumerations.BNT_FeedbackSignalSelection
+    assert flags.decode(numpy.array([0xFFFF, 1, 0])).tolist() == ['NT_FeedbackSignalAC', None, 'NT_FeedbackSignalDC']
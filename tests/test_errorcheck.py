@@ -0,0 +1,60 @@
+from ctypes import POINTER, c_char, c_short
+
+import pytest
+
+from pyscan_tlk import (
+    KinesisException,
+    SerialNumber,
+    check_errors,
+    devicemanager,
+    kcubedcservo,
+    kcubepiezo,
+    kcubesolenoid)
+from pyscan_tlk.backend.lazylibrary import LazyLibrary
+from pyscan_tlk.errorcheck import check_error_code, returns_error_code
+
+
+pytestmark = pytest.mark.simulated(devices=['29000001'])
+
+
+@pytest.fixture
+def checked(simulated):
+    check_errors()
+    yield SerialNumber(29000001)
+    check_errors(False)
+
+
+def test_error_codes_raise(checked):
+    assert kcubepiezo.PCC_Open(checked) == 0
+    with pytest.raises(KinesisException) as error:
+        kcubepiezo.PCC_SetMaxOutputVoltage(checked, 123)
+    assert (error.value.code, error.value.function, error.value.serial) == (6, 'PCC_SetMaxOutputVoltage', '29000001')
+    with pytest.raises(KinesisException):
+        kcubepiezo.PCC_Open(SerialNumber(12345678))
+    assert kcubepiezo.PCC_Open.errcheck is check_error_code
+
+    # Getters returning their value as a c_short are not checked.
+    kcubepiezo.PCC_SetOutputVoltage(checked, 100)
+    assert kcubepiezo.PCC_GetOutputVoltage(checked) == 100
+
+    check_errors(False)
+    assert kcubepiezo.PCC_SetMaxOutputVoltage(checked, 123) == 6
+
+
+def test_later_declarations_are_checked(checked):
+    lib = LazyLibrary("standin.dll", {})
+    lib.declare([("XX_Open", c_short, [POINTER(c_char)]), ("XX_GetOutputVoltage", c_short, [POINTER(c_char)])])
+    assert lib.XX_Open.errcheck is check_error_code
+    assert lib.XX_GetOutputVoltage.errcheck is None
+
+
+def test_returns_error_code():
+    assert returns_error_code(kcubedcservo.lib.KVS_MoveToPosition)
+    assert returns_error_code(kcubedcservo.lib.KVS_GetVelParams)
+    assert returns_error_code(kcubedcservo.lib.KVS_GetVelParamsBlock)
+    assert not returns_error_code(kcubedcservo.lib.KVS_GetPosition)
+    assert not returns_error_code(kcubepiezo.lib.PCC_GetMaxOutputVoltage)
+    assert not returns_error_code(kcubesolenoid.lib.SC_GetSolenoidState)
+    assert not returns_error_code(devicemanager.lib.TLI_GetDeviceListSize)
+    assert not returns_error_code(devicemanager.lib.TLI_GetDeviceInfo)
+    assert returns_error_code(devicemanager.lib.TLI_GetDeviceListExt)
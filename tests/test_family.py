@@ -0,0 +1,52 @@
+import pytest
+
+from pyscan_tlk import benchtopbrushlessmotor, benchtopprecisionpiezo, check_errors, kcubedcservo
+from pyscan_tlk.definitions.kinesisexception import KinesisException
+from pyscan_tlk.family import (
+    check_result,
+    default_channel,
+    family_function,
+    family_prefix,
+    takes_channel,
+    unchecked_error_code,
+    with_channel)
+
+
+def test_prefix():
+    assert family_prefix(kcubedcservo) == 'KVS'
+    assert family_prefix(benchtopbrushlessmotor) == 'BMC'
+    with pytest.raises(ValueError):
+        family_prefix(benchtopprecisionpiezo)
+
+
+def test_channel():
+    status = kcubedcservo.lib.KVS_GetStatusBits
+    bench = benchtopbrushlessmotor.lib.BMC_StartPolling
+    assert not takes_channel(status) and takes_channel(bench, 2)
+    assert default_channel(status, None) is None
+    assert default_channel(bench, None, 2) == 1 and default_channel(bench, 3, 2) == 3
+    assert with_channel(bench, 2, (b'73000001', 100)) == (b'73000001', 2, 100)
+    assert with_channel(kcubedcservo.lib.KVS_StartPolling, 2, (b'27000001', 100)) == (b'27000001', 100)
+
+
+def test_check_result():
+    assert check_result(kcubedcservo, 'KVS_Home', 0) == 0
+    with pytest.raises(KinesisException) as error:
+        check_result(kcubedcservo, 'KVS_Home', 2, 27000001)
+    assert error.value.serial == '27000001'
+    # Values, not error codes.
+    assert check_result(kcubedcservo, 'KVS_GetPosition', 5000) == 5000
+    check_errors()
+    try:
+        assert not unchecked_error_code(kcubedcservo, 'KVS_Home')
+        assert check_result(kcubedcservo, 'KVS_Home', 2) == 2
+    finally:
+        check_errors(False)
+    assert unchecked_error_code(kcubedcservo, 'KVS_Home')
+
+
+@pytest.mark.simulated(devices=['27000001'])
+def test_resolves(simulated):
+    function = family_function(kcubedcservo, 'KVS', 'GetPosition')
+    assert function.argtypes == kcubedcservo.lib.KVS_GetPosition.argtypes
+    assert function(b'27000001') == 0
@@ -5,12 +5,12 @@ from pyscan_tlk.benchtoppiezo import *
 from pyscan_tlk.benchtoppiezopdxc2 import *
 from pyscan_tlk.benchtopprecisionpiezo import *
 from pyscan_tlk.benchtopsteppermotor import *
-# from pyscan_tlk.benchtopvoicecoil import *
+from pyscan_tlk.benchtopvoicecoil import *
 from pyscan_tlk.filterflipper import *
 from pyscan_tlk.integratedprecisionpiezo import *
 from pyscan_tlk.integratedsteppermotor import *
 from pyscan_tlk.kcubebrushlessmotor import *
-# from pyscan_tlk.kcubedcservo import *
+from pyscan_tlk.kcubedcservo import *
 from pyscan_tlk.kcubeinertialmotor import *
 from pyscan_tlk.kcubelaserdiode import *
 from pyscan_tlk.kcubelasersource import *
@@ -20,8 +20,8 @@ from pyscan_tlk.kcubepiezostraingauge import *
 from pyscan_tlk.kcubepositionaligner import *
 from pyscan_tlk.kcubesolenoid import *
 from pyscan_tlk.kcubesteppermotor import *
-# from pyscan_tlk.modularnanotrack import *
-# from pyscan_tlk.modularsteppermotor import *
+from pyscan_tlk.modularnanotrack import *
+from pyscan_tlk.modularsteppermotor import *
 from pyscan_tlk.polarizer import *
 from pyscan_tlk.tcubebrushlessmotor import *
 from pyscan_tlk.tcubeinertialmotor import *
@@ -35,3 +35,20 @@ from pyscan_tlk.tcubesolenoid import *
 from pyscan_tlk.tcubesteppermotor import *
 from pyscan_tlk.tcubestraingauge import *
 from pyscan_tlk.tcubetec import *
+
+
+def test_package_import_is_lazy():
+    import subprocess
+    import sys
+    code = ("import sys, pyscan_tlk; "
+            "assert not [m for m in sys.modules if m.startswith('pyscan_tlk.') and m[11:] in pyscan_tlk.device_modules]; "
+            "pyscan_tlk.kcubepiezo; "
+            "assert 'pyscan_tlk.kcubepiezo' in sys.modules and 'pyscan_tlk.tcubepiezo' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_modules_keep_their_own_namespace():
+    import pyscan_tlk
+    assert pyscan_tlk.kcubepiezo.lib is not pyscan_tlk.tcubepiezo.lib
+    assert pyscan_tlk.kcubepiezo.PCC_GetOutputVoltage is not pyscan_tlk.tcubepiezo.PCC_GetOutputVoltage
+    assert pyscan_tlk.kcubebrushlessmotor.BMC_Open is not pyscan_tlk.benchtopbrushlessmotor.BMC_Open
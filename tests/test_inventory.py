@@ -0,0 +1,92 @@
+import json
+import os
+import stat
+
+import pytest
+
+from pyscan_tlk import devicemanager, kcubedcservo, kcubepiezo
+from pyscan_tlk.backend.simulated import SimulatedPiezo
+from pyscan_tlk.backend.simulatedmotor import SimulatedMotor
+from pyscan_tlk.inventory import FORMAT, Inventory
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '29000001'], speed=None)
+
+
+@pytest.fixture
+def opened(simulated):
+    devicemanager.TLI_BuildDeviceList()
+    kcubedcservo.KVS_Open(b'27000001')
+    kcubepiezo.PCC_Open(b'29000001')
+    return simulated
+
+
+def test_warm_start(opened, tmp_path):
+    path = str(tmp_path / 'inventory.json')
+    inventory = Inventory(path)
+    servo = inventory.facts(kcubedcservo, '27000001')
+    piezo = inventory.facts(kcubepiezo, 29000001)
+    assert (inventory.hits, inventory.misses) == (0, 2)
+    assert servo.prefix == 'KVS'
+    assert servo.hardware_info.modelNumber == b'SIM27'
+    assert servo.firmware_version == servo.hardware_info.firmwareVersion
+    assert servo.device_info.serialNo == b'27000001'
+    assert len(servo.motor_params) == 3
+    assert piezo.motor_params is None
+    assert inventory.facts(kcubedcservo, '27000001') is servo
+    assert inventory.hits == 1
+    inventory.save()
+
+    warm = Inventory(path)
+    assert len(warm) == 2 and '29000001' in warm
+    cached = warm.facts(kcubedcservo, '27000001')
+    assert (warm.hits, warm.misses) == (1, 0)
+    assert cached.motor_params == servo.motor_params
+    assert cached.hardware_info.modelNumber == b'SIM27'
+    assert cached.device_info.description == servo.device_info.description
+    assert warm.facts(kcubepiezo, '29000001').software_version == piezo.software_version
+
+
+def test_firmware_change(opened, tmp_path):
+    inventory = Inventory(str(tmp_path / 'inventory.json'))
+    inventory.facts(kcubepiezo, '29000001')
+    inventory.facts(kcubedcservo, '27000001')
+    opened.device('29000001', SimulatedPiezo).firmware_version = 0x00020000
+    opened.device('27000001', SimulatedMotor).firmware_version = 0x00020000
+    assert inventory.facts(kcubepiezo, '29000001').firmware_version == 0x00020000
+    assert inventory.facts(kcubedcservo, '27000001').hardware_info.firmwareVersion == 0x00020000
+    assert (inventory.hits, inventory.misses) == (0, 4)
+
+    inventory.forget('29000001')
+    inventory.facts(kcubepiezo, '29000001')
+    assert inventory.misses == 5
+
+
+def test_other_format(opened, tmp_path):
+    path = tmp_path / 'inventory.json'
+    inventory = Inventory(str(path))
+    inventory.facts(kcubepiezo, '29000001')
+    inventory.save()
+    contents = json.loads(path.read_text())
+    assert contents['format'] == FORMAT and list(contents['devices']) == ['29000001']
+
+    contents['format'] = FORMAT + 1
+    path.write_text(json.dumps(contents))
+    assert len(Inventory(str(path))) == 0
+    path.write_text('{not json')
+    assert len(Inventory(str(path))) == 0
+    assert len(Inventory(str(tmp_path / 'missing.json'))) == 0
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="file modes are POSIX")
+def test_file_mode(opened, tmp_path):
+    path = tmp_path / 'inventory.json'
+    inventory = Inventory(str(path))
+    inventory.facts(kcubepiezo, '29000001')
+    umask = os.umask(0o022)
+    try:
+        inventory.save()
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
@@ -0,0 +1,78 @@
+import pickle
+
+import pytest
+
+from pyscan_tlk import KinesisException, RetryPolicy
+from pyscan_tlk.definitions.kinesisexception import (
+    FT_IOError,
+    FTDIError,
+    TL_CMD_TEMP_UNAVAILABLE,
+    TL_UNHOMED,
+    DeviceError,
+    TransientError,
+    exceptions,
+    retryable_codes)
+
+
+def test_subclass_by_code():
+    error = KinesisException(47, 'KVS_MoveToPosition', '27000001')
+    assert type(error) is TL_CMD_TEMP_UNAVAILABLE
+    assert isinstance(error, DeviceError) and isinstance(error, TransientError)
+    assert (error.code, error.function, error.serial) == (47, 'KVS_MoveToPosition', '27000001')
+    assert error.retryable
+    assert str(error).startswith('KVS_MoveToPosition (27000001): TL_CMD_TEMP_UNAVAILABLE')
+
+    assert type(KinesisException(4)) is FT_IOError
+    assert isinstance(KinesisException(4), FTDIError)
+    assert not KinesisException(37).retryable
+    assert TL_UNHOMED().code == 37
+    assert retryable_codes == {4, 5, 33, 47}
+    assert all(code in KinesisException.error_codes for code in exceptions)
+
+
+def test_unknown_codes():
+    for code in (0, 22, 31, 99):
+        error = KinesisException(code)
+        assert type(error) is KinesisException
+        assert error.code == code
+        assert not error.retryable
+        assert str(code) in str(error)
+
+
+def test_pickle():
+    error = pickle.loads(pickle.dumps(KinesisException(4, 'PCC_Open', '29000001')))
+    assert type(error) is FT_IOError
+    assert (error.code, error.function, error.serial) == (4, 'PCC_Open', '29000001')
+
+
+def test_retry_policy():
+    waits = []
+    policy = RetryPolicy(attempts=5, delay=0.1, backoff=3, max_delay=0.5, sleep=waits.append)
+    assert list(policy.delays()) == pytest.approx([0.1, 0.3, 0.5, 0.5])
+
+    results = iter([KinesisException(4), KinesisException(47), 0])
+
+    def flaky():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    assert policy.call(flaky) == 0
+    assert waits == pytest.approx([0.1, 0.3])
+    assert policy.retries == 2
+
+    @policy
+    def unhomed():
+        raise KinesisException(37)
+
+    with pytest.raises(TL_UNHOMED):
+        unhomed()
+    assert policy.retries == 2
+
+    def disconnected():
+        raise KinesisException(4)
+
+    with pytest.raises(FT_IOError):
+        policy.call(disconnected)
+    assert policy.retries == 6
@@ -0,0 +1,77 @@
+from ctypes import CFUNCTYPE, POINTER, c_char, c_char_p, c_int, c_short
+
+from pyscan_tlk import kcubedcservo, kcubepiezo
+from pyscan_tlk.backend.lazylibrary import LazyLibrary, LazyFunction
+
+from conftest import StandInFunction, StandInLibrary
+
+
+def test_import_does_not_load(standin):
+    assert not kcubepiezo.lib.loaded
+    assert isinstance(kcubepiezo.PCC_GetMaxOutputVoltage, LazyFunction)
+    assert standin.loaded == []
+
+
+def test_first_call_loads_and_binds(standin):
+    sn = c_char_p(b"29000001")
+    assert kcubepiezo.PCC_GetMaxOutputVoltage(sn) == 0
+    assert standin.loaded == [kcubepiezo.lib.path]
+
+    bound = kcubepiezo.PCC_GetMaxOutputVoltage
+    assert isinstance(bound, StandInFunction)
+    assert bound.restype is c_short
+    assert bound.argtypes == [POINTER(c_char)]
+
+    # Only the called function is resolved, and no other device dll is touched.
+    assert isinstance(kcubepiezo.PCC_GetOutputVoltage, LazyFunction)
+    assert not kcubedcservo.lib.loaded
+
+    kcubepiezo.PCC_GetOutputVoltage(sn)
+    assert standin.loaded == [kcubepiezo.lib.path]
+
+
+def test_star_imported_proxy_keeps_working(standin):
+    proxy = kcubepiezo.lib.PCC_GetOutputVoltage
+    proxy(c_char_p(b"29000001"))
+    proxy(c_char_p(b"29000001"))
+    assert proxy.resolved
+    assert kcubepiezo.lib.handle.calls[-1][0] == "PCC_GetOutputVoltage"
+    assert len(kcubepiezo.lib.handle.calls) == 2
+
+
+def test_reset_restores_proxies(standin):
+    kcubepiezo.PCC_GetOutputVoltage(c_char_p(b"29000001"))
+    kcubepiezo.lib.reset()
+    assert isinstance(kcubepiezo.PCC_GetOutputVoltage, LazyFunction)
+    assert not kcubepiezo.lib.loaded
+    kcubepiezo.PCC_GetOutputVoltage(c_char_p(b"29000001"))
+    assert standin.loaded == [kcubepiezo.lib.path] * 2
+
+
+def test_attributes_follow_resolved_function(standin):
+    lib = LazyLibrary("standin.dll", loader=lambda path: StandInLibrary(path, []))
+    function = lib.Example
+    function.restype = c_short
+    function()
+    function.argtypes = []
+    assert lib.handle.Example.argtypes == []
+    assert lib.handle.Example.restype is c_short
+    assert standin.loaded == []
+
+
+def test_every_declared_signature_is_a_ctypes_prototype():
+    import pyscan_tlk
+    for name in pyscan_tlk.device_modules + ('devicemanager',):
+        lib = getattr(pyscan_tlk, name).lib
+        assert lib.functions, name
+        for function in lib.functions.values():
+            CFUNCTYPE(function.restype, *function.argtypes)
+
+
+def test_declare_replaces_signature(standin):
+    lib = LazyLibrary("standin.dll", {})
+    lib.declare([("Example", c_short, [POINTER(c_char)])])
+    lib.Example()
+    lib.declare([("Example", c_int, [])])
+    assert lib.handle.Example.restype is c_int
+    assert lib.handle.Example.argtypes == []
@@ -0,0 +1,63 @@
+import time
+from ctypes import c_char_p
+
+import pytest
+
+from pyscan_tlk import backend, kcubedcservo, kcubesteppermotor
+from pyscan_tlk.messages import message_name, message_table
+
+numpy = pytest.importorskip('numpy')
+from pyscan_tlk.messagelog import MessageLog  # noqa: E402
+
+servo = c_char_p(b'27000001')
+stepper = c_char_p(b'26000001')
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '26000001'], speed=None)
+
+
+def test_message_names():
+    assert message_name(2, 1) == 'GenericMotor.MoveCompleted'
+    assert message_name(2, 9) == 'GenericMotor.9'
+    assert message_name(42, 0) == '42.0'
+    motor = message_table('kcubedcservo')
+    assert motor[(2, 0)] == 'GenericMotor.Homed' and motor[(0, 1)] == 'GenericDevice.SettingsUpdated'
+    assert (1, 0) not in motor and (1, 0) in message_table()
+
+
+def test_drain(simulated):
+    log = MessageLog(capacity=8, clock=simulated.clock.now)
+    log.add(kcubedcservo, 27000001)
+    log.add(kcubesteppermotor, 26000001)
+    assert log.drain() == 0
+    kcubedcservo.KVS_Home(servo)
+    kcubesteppermotor.SCC_MoveToPosition(stepper, 1000)
+    simulated.clock.advance(30)
+    kcubedcservo.KVS_MoveToPosition(servo, 1000)
+    kcubedcservo.KVS_StopImmediate(servo)
+    assert log.drain(27000001) == 2
+    assert log.drain() == 1
+    records = log.latest()
+    assert records['serial'].tolist() == [27000001, 27000001, 26000001]
+    assert records['time'].tolist() == [30.0, 30.0, 30.0]
+    assert log.decode(records).tolist() == ['GenericMotor.Homed', 'GenericMotor.MoveStopped', 'GenericMotor.MoveCompleted']
+    assert log.decode(numpy.array([(0, 0, 7, 3, 0)], dtype=log.buffer.dtype)).tolist() == ['TECCtlr.3']
+
+
+def test_callback():
+    previous = backend.get_backend()
+    backend.use_backend('simulated', devices=['27000001'], speed=100)
+    try:
+        log = MessageLog()
+        log.add(kcubedcservo, 27000001, callback=True)
+        kcubedcservo.KVS_MoveToPosition(servo, 1000)
+        deadline = time.monotonic() + 5
+        while not len(log) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log.decode(log.latest()).tolist() == ['GenericMotor.MoveCompleted']
+        log.remove(27000001)
+        kcubedcservo.KVS_MoveToPosition(servo, 0)
+        time.sleep(0.2)
+        assert len(log) == 1
+    finally:
+        backend.use_backend(previous)
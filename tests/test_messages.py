@@ -0,0 +1,65 @@
+import asyncio
+import time
+from ctypes import c_char_p
+
+import pytest
+
+from pyscan_tlk import benchtopbrushlessmotor, kcubedcservo
+from pyscan_tlk.backend.simulatedmotor import SimulatedMotor
+from pyscan_tlk.messages import MessageQueue
+
+servo = c_char_p(b'27000001')
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '27000002', '73000001'], speed=100)
+
+
+def test_callback(simulated):
+    messages = MessageQueue()
+    messages.register(kcubedcservo, 27000001)
+    assert messages.get(timeout=0) == []
+    kcubedcservo.KVS_MoveToPosition(servo, 20000)
+    kcubedcservo.KVS_MoveToPosition(c_char_p(b'27000002'), -20000)
+    received = messages.get(timeout=5)
+    assert [(message.serial, message.type, message.id) for message in received] == [('27000001', 2, 1)]
+    assert simulated.device(b'27000001', SimulatedMotor).axis(1).move is None
+    assert kcubedcservo.KVS_MessageQueueSize(servo) == 0
+
+
+def test_drains_in_bulk(simulated):
+    kcubedcservo.KVS_Home(servo)
+    simulated.clock.sleep(10)
+    messages = MessageQueue()
+    messages.register(kcubedcservo, 27000001)
+    assert len(messages) == 1
+    assert messages.drain()[0].id == 0
+
+
+def test_asyncio(simulated):
+    messages = MessageQueue()
+    for serial in ('27000001', '27000002'):
+        messages.register(kcubedcservo, serial)
+
+    async def run():
+        assert await messages.wait(timeout=0.01) == []
+        kcubedcservo.KVS_MoveToPosition(servo, 5000)
+        kcubedcservo.KVS_MoveToPosition(c_char_p(b'27000002'), 5000)
+        received = []
+        while len(received) < 2:
+            received += await messages.wait(timeout=5)
+        return received
+
+    assert sorted(message.serial for message in asyncio.run(run())) == ['27000001', '27000002']
+
+
+def test_channel_and_unregister(simulated):
+    messages = MessageQueue()
+    messages.register(benchtopbrushlessmotor, 73000001, channel=2)
+    bench = c_char_p(b'73000001')
+    benchtopbrushlessmotor.BMC_MoveToPosition(bench, 2, 1000)
+    assert [message.id for message in messages.get(timeout=5)] == [1]
+    messages.unregister(73000001, 2)
+    benchtopbrushlessmotor.BMC_MoveToPosition(bench, 2, 0)
+    time.sleep(0.2)
+    assert len(messages) == 0
+    assert benchtopbrushlessmotor.BMC_MessageQueueSize(bench, 2) == 1
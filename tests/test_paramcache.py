@@ -0,0 +1,78 @@
+from ctypes import c_char_p
+
+import pytest
+
+from pyscan_tlk import benchtopbrushlessmotor, check_errors, kcubedcservo
+from pyscan_tlk.definitions.kinesisexception import KinesisException
+from pyscan_tlk.definitions.structures import MOT_VelocityParameters
+from pyscan_tlk.paramcache import ParameterCache
+
+servo = c_char_p(b'27000001')
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '73000001'], speed=None)
+
+
+def test_read_through(simulated):
+    params = ParameterCache(kcubedcservo, 27000001)
+    velocity = params.get('VelParamsBlock')
+    assert isinstance(velocity, MOT_VelocityParameters)
+    assert params.get('VelParamsBlock') is velocity
+    assert params.get('VelParams') == (velocity.acceleration, velocity.maxVelocity)
+    assert params.get('MotorParamsExt') == (512.0, 67.49, 1.0)
+    assert (params.hits, params.misses) == (1, 3)
+
+    # A setter through the cache invalidates what it changes, and nothing else.
+    assert params.set('VelParams', 400, 1000000) == 0
+    assert params.get('VelParamsBlock').maxVelocity == 1000000
+    assert params.get('VelParams') == (400, 1000000)
+    assert params.get('MotorParamsExt') == (512.0, 67.49, 1.0)
+    assert (params.hits, params.misses) == (2, 5)
+
+    # Direct calls bypass it until invalidated.
+    kcubedcservo.KVS_SetVelParams(servo, 500, 2000000)
+    assert params.get('VelParams') == (400, 1000000)
+    params.call('RequestSettings')
+    assert params.get('VelParams') == (500, 2000000)
+    with pytest.raises(KeyError):
+        params.get('Position')
+
+
+def test_max_age(simulated):
+    clock = Clock()
+    params = ParameterCache(kcubedcservo, 27000001, max_age=1.0, clock=clock)
+    params.get('HomingParamsBlock')
+    clock.time = 0.5
+    params.get('HomingParamsBlock')
+    clock.time = 1.6
+    params.get('HomingParamsBlock')
+    assert (params.hits, params.misses) == (1, 2)
+
+
+def test_channel(simulated):
+    params = ParameterCache(benchtopbrushlessmotor, 73000001, channel=2)
+    assert params.get('MotorParamsExt') == (20000.0,)
+    assert params.set('MotorParamsExt', 2000.0) == 0
+    assert params.get('MotorParamsExt') == (2000.0,)
+    assert ParameterCache(benchtopbrushlessmotor, 73000001).get('MotorParamsExt') == (20000.0,)
+
+
+def test_errors(simulated):
+    params = ParameterCache(kcubedcservo, 27999999)
+    with pytest.raises(KinesisException):
+        params.get('VelParams')
+    check_errors()
+    try:
+        with pytest.raises(KinesisException):
+            params.get('VelParamsBlock')
+    finally:
+        check_errors(False)
@@ -0,0 +1,83 @@
+import array
+import sys
+
+import pytest
+
+from pyscan_tlk.definitions import safearray
+
+windows = pytest.mark.skipif(sys.platform != 'win32', reason="SAFEARRAYs come from oleaut32")
+
+
+def test_nesting_follows_storage_order():
+    # Safearrays store the first index fastest.
+    flat = [(i, j) for j in range(3) for i in range(2)]
+    nested = safearray._nest(flat, (2, 3))
+    assert nested == tuple(tuple((i, j) for j in range(3)) for i in range(2))
+    assert safearray._nest([1, 2, 3], (3,)) == (1, 2, 3)
+
+
+def test_vartype_of_buffers():
+    assert safearray._numeric_format(array.array('d', [1.0, 2.0])) == (safearray.VT_R8, 2, 8)
+    assert safearray._numeric_format(array.array('i', [1]))[0] == safearray.VT_INT
+    assert safearray._numeric_format(array.array('h'))[:2] == (safearray.VT_I2, 0)
+    assert safearray._numeric_format(memoryview(bytearray(3)))[:2] == (safearray.VT_UI1, 3)
+    assert safearray._numeric_format([1.0, 2.0]) is None
+    numpy = pytest.importorskip('numpy')
+    assert safearray._numeric_format(numpy.zeros((2, 3), numpy.float32))[:2] == (safearray.VT_R4, 6)
+    assert safearray._numeric_format(numpy.zeros(4, '<u2'))[0] == safearray.VT_UI2
+    assert safearray._numeric_format(numpy.arange(4))[:2] == (safearray.VT_I8, 4)
+    assert safearray._numeric_format(numpy.zeros(4, numpy.uint64))[0] == safearray.VT_UI8
+    with pytest.raises(ValueError):
+        safearray._numeric_format(numpy.zeros(8)[::2])
+
+
+@windows
+def test_from_numpy():
+    numpy = pytest.importorskip('numpy')
+    values = numpy.arange(6, dtype=numpy.int16).reshape(2, 3)
+    vt, psa = safearray.SafeArray_FromArray(values)
+    try:
+        assert vt == safearray.VT_I2
+        assert safearray.UnpackSafeArray(psa) == tuple(range(6))
+    finally:
+        safearray.SafeArrayDestroy(psa)
+    values.flags.writeable = False
+    psa = safearray.SafeArray_FromSequence(values[1])
+    try:
+        assert safearray.UnpackSafeArray(psa) == (3, 4, 5)
+    finally:
+        safearray.SafeArrayDestroy(psa)
+    # NumPy's default integer is 64 bits wide.
+    psa = safearray.SafeArray_FromSequence(numpy.arange(5))
+    try:
+        assert safearray._get_vartype(psa) == safearray.VT_I8
+        assert safearray.UnpackSafeArray(psa) == tuple(range(5))
+    finally:
+        safearray.SafeArrayDestroy(psa)
+
+
+@windows
+def test_unpack_numeric():
+    vt, psa = safearray.SafeArray_FromArray(array.array('d', [0.5, 1.5, 2.5]))
+    try:
+        assert safearray.UnpackSafeArray(psa) == (0.5, 1.5, 2.5)
+        assert list(psa.contents) == [0.5, 1.5, 2.5]
+        with safearray.SafeArray_Data(psa) as data:
+            assert data.tolist() == [0.5, 1.5, 2.5]
+        numpy = pytest.importorskip('numpy')
+        assert safearray.SafeArray_ToNumPy(psa).dtype == numpy.float64
+    finally:
+        safearray.SafeArrayDestroy(psa)
+
+
+@windows
+def test_unpack_two_dimensions():
+    bounds = (safearray.SAFEARRAYBOUND * 2)()
+    bounds[0].cElements, bounds[1].cElements = 2, 3
+    psa = safearray.SafeArrayCreate(safearray.VT_I4, 2, bounds)
+    try:
+        with safearray.SafeArray_Data(psa) as data:
+            data[:] = array.array(data.format, range(6))
+        assert safearray.UnpackSafeArray(psa) == ((0, 2, 4), (1, 3, 5))
+    finally:
+        safearray.SafeArrayDestroy(psa)
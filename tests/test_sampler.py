@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from pyscan_tlk import kcubedcservo  # noqa: E402
+from pyscan_tlk.backend.simulatedmotor import SimulatedMotor  # noqa: E402
+from pyscan_tlk.ringbuffer import RingBuffer  # noqa: E402
+from pyscan_tlk.sampler import Sampler  # noqa: E402
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001'], speed=None)
+
+
+def test_ring_buffer():
+    buffer = RingBuffer(4, [('position', numpy.int32)])
+    assert len(buffer.latest()) == 0
+    for sample in range(10):
+        buffer.append(sample * 0.1, [sample])
+    assert len(buffer) == 4
+    assert buffer.latest()['position'].tolist() == [6, 7, 8, 9]
+    assert buffer.latest(2)['position'].tolist() == [8, 9]
+    assert buffer.latest()['time'].tolist() == pytest.approx([0.6, 0.7, 0.8, 0.9])
+    assert numpy.shares_memory(buffer.latest(), buffer.data)
+
+
+def test_ring_buffer_extend():
+    buffer = RingBuffer(4, [('position', numpy.int32), ('channel', numpy.int16)])
+    buffer.append(0.0, [0, 1])
+    buffer.extend(2, 1.0, [[1, 2], 1])
+    assert buffer.latest()['position'].tolist() == [0, 1, 2]
+    buffer.extend(3, [2.0, 3.0, 4.0], [[3, 4, 5], 2])
+    assert buffer.latest()['position'].tolist() == [2, 3, 4, 5]
+    assert buffer.latest()['channel'].tolist() == [1, 2, 2, 2]
+    buffer.extend(6, 5.0, [numpy.arange(6, 12), 3])
+    assert buffer.latest()['position'].tolist() == [8, 9, 10, 11]
+    buffer.extend(0, 6.0, [[], 3])
+    assert buffer.count == 12
+
+
+def test_sampler(simulated):
+    axis = simulated.device(b'27000001', SimulatedMotor).axis(1)
+    axis.position = 1234
+    sampler = Sampler(27000001, {
+        'position': kcubedcservo.KVS_GetPosition,
+        'status': kcubedcservo.KVS_GetStatusBits}, rate=1000, capacity=64, clock=simulated.clock.now)
+    assert sampler.buffer.dtype['position'] == numpy.dtype(numpy.int32)
+    assert sampler.buffer.dtype['status'].kind == 'u'
+    with sampler:
+        deadline = time.perf_counter() + 5
+        while sampler.samples < 100 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+    assert not sampler.running
+    assert sampler.samples >= 100
+    latest = sampler.latest()
+    assert len(latest) == 64
+    assert (latest['position'] == 1234).all()
+    assert sampler.errors == 0
@@ -0,0 +1,79 @@
+import ctypes
+import time
+
+import pytest
+
+pytest.importorskip('numpy')
+
+from pyscan_tlk import kcubedcservo, kcubepiezo  # noqa: E402
+from pyscan_tlk.sampler import Sampler  # noqa: E402
+from pyscan_tlk.scheduler import PollScheduler, Timing  # noqa: E402
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '27000002', '29000001'], speed=None)
+
+
+def test_rates(simulated):
+    fast = Sampler(27000001, {'position': kcubedcservo.KVS_GetPosition}, rate=400)
+    slow = Sampler(27000002, {'position': kcubedcservo.KVS_GetPosition}, rate=40)
+    piezo = Sampler(29000001, {'voltage': kcubepiezo.PCC_GetOutputVoltage}, rate=100)
+    scheduler = PollScheduler(workers=2)
+    scheduler.add(fast, priority=1)
+    scheduler.add(slow)
+    scheduler.add(piezo)
+    with pytest.raises(ValueError):
+        scheduler.add(fast)
+    with scheduler:
+        time.sleep(0.5)
+    assert 0 < scheduler.load() < 1
+    assert slow.samples < piezo.samples < fast.samples
+    assert fast.samples > 5 * slow.samples
+    statistics = scheduler.statistics()
+    assert [row['serial'] for row in statistics] == ['27000001', '27000002', '29000001']
+    assert all(row['errors'] == 0 and row['max_lateness'] >= row['mean_lateness'] for row in statistics)
+
+    scheduler.remove(slow)
+    samples = slow.samples
+    with scheduler:
+        time.sleep(0.05)
+    assert slow.samples == samples
+    assert fast.samples > 200
+
+
+def test_restart(simulated):
+    sampler = Sampler(27000001, {'position': kcubedcservo.KVS_GetPosition}, rate=100)
+    scheduler = PollScheduler()
+    scheduler.add(sampler)
+    with scheduler:
+        time.sleep(0.05)
+    missed = sampler.missed
+    time.sleep(0.3)
+    with scheduler:
+        time.sleep(0.05)
+    # The 30 rounds due while stopped are neither missed nor late.
+    assert sampler.missed - missed < 5
+    assert scheduler.statistics()[0]['max_lateness'] < 0.1
+
+
+def test_worker_survives_errors(simulated):
+    def broken(serial):
+        raise ctypes.ArgumentError("argument 1: wrong type")
+    failing = Sampler(27000002, {'position': broken}, rate=100)
+    sampler = Sampler(27000001, {'position': kcubedcservo.KVS_GetPosition}, rate=100)
+    scheduler = PollScheduler(workers=1)
+    scheduler.add(failing)
+    scheduler.add(sampler)
+    with scheduler:
+        time.sleep(0.1)
+    assert failing.errors > 5 and isinstance(failing.last_error, ctypes.ArgumentError)
+    assert sampler.samples > 5
+    assert [row['errors'] > 0 for row in scheduler.statistics()] == [True, False]
+
+
+def test_timing():
+    timing = Timing()
+    for lateness in (0.001, 0.003):
+        timing.record(lateness)
+    assert timing.mean == pytest.approx(0.002)
+    assert timing.maximum == 0.003
+    assert timing.jitter == pytest.approx(0.001)
@@ -0,0 +1,39 @@
+from ctypes import c_char_p, create_string_buffer
+
+import pytest
+
+from pyscan_tlk import SerialNumber, kcubedcservo, kcubepiezo
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '29000001'])
+
+
+def test_construction():
+    sn = SerialNumber(27000001)
+    assert sn == b'27000001'
+    assert SerialNumber('27000001') == sn
+    assert SerialNumber(c_char_p(b'27000001')) == sn
+    assert SerialNumber(create_string_buffer(b'27000001')) == sn
+    assert SerialNumber(sn) is sn
+    assert str(sn) == '27000001'
+    assert int(sn) == 27000001
+    assert repr(sn) == "SerialNumber('27000001')"
+    assert sn.type_id == 27
+    assert {b'27000001': 1}[sn] == 1
+
+
+def test_invalid():
+    for serial in ('', b'2700\x000001'):
+        with pytest.raises(ValueError):
+            SerialNumber(serial)
+    with pytest.raises(AttributeError):
+        SerialNumber(27000001).name = 'stage'
+
+
+def test_accepted_by_functions(simulated):
+    sn = SerialNumber(29000001)
+    assert kcubepiezo.PCC_Open(sn) == 0
+    assert kcubepiezo.PCC_SetOutputVoltage(sn, 100) == 0
+    assert kcubepiezo.PCC_GetOutputVoltage(sn) == 100
+    assert kcubepiezo.PCC_GetOutputVoltage(c_char_p(b'29000001')) == 100
+    assert kcubedcservo.KVS_GetPosition(SerialNumber(27000001)) == 0
@@ -0,0 +1,169 @@
+import time
+from ctypes import byref, c_char_p, c_ulong, c_ushort
+
+import pytest
+
+from pyscan_tlk import backend, kcubebrushlessmotor, kcubedcservo, kcubeinertialmotor, kcubesteppermotor
+from pyscan_tlk.backend.simulatedmotor import (
+    HOMED,
+    HOMING,
+    JOGGING_FORWARD,
+    MOVING_FORWARD,
+    MOVING_REVERSE,
+    SimulatedInertialMotor,
+    SimulatedMotor,
+    profile_duration)
+from pyscan_tlk.backend.virtualclock import VirtualClock
+from pyscan_tlk.definitions.enumerations import MOT_JogModes, MOT_StopModes
+from pyscan_tlk.definitions.structures import (
+    KIM_DriveOPParameters,
+    KIM_JogParameters,
+    MOT_JogParameters,
+    MOT_VelocityParameters)
+
+servo = c_char_p(b'27000001')
+stepper = c_char_p(b'26000001')
+brushless = c_char_p(b'28000001')
+inertial = c_char_p(b'97000001')
+
+
+def wait_for_message(wait, serial):
+    # (type, id, data) of the next message, or None if none will come.
+    message_type, message_id, message_data = c_ushort(), c_ushort(), c_ulong()
+    if not wait(serial, byref(message_type), byref(message_id), byref(message_data)):
+        return None
+    return message_type.value, message_id.value, message_data.value
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '26000001', '28000001', '97000001'], speed=None)
+
+
+def axis(simulated, serial, family=SimulatedMotor, channel=1):
+    return simulated.device(serial.value, family).axis(channel)
+
+
+def test_trapezoidal_move(simulated):
+    clock = simulated.clock
+    velocity = MOT_VelocityParameters(0, 396, 1777857)
+    assert kcubedcservo.KVS_SetVelParamsBlock(servo, velocity) == 0
+    assert kcubedcservo.KVS_MoveToPosition(servo, 100000) == 0
+
+    # 2.3 mm/s and 1.5 mm/s^2 on a Z8 stage: 34555 counts/mm.
+    duration = profile_duration(100000, 1777857 / 22.369621, 396 / 0.0076355)
+    assert axis(simulated, servo).move.end == pytest.approx(duration)
+
+    clock.advance(duration / 2)
+    assert kcubedcservo.KVS_GetStatusBits(servo) & MOVING_FORWARD
+    assert kcubedcservo.KVS_GetPosition(servo) == pytest.approx(50000, abs=1)
+    assert kcubedcservo.KVS_MessageQueueSize(servo) == 0
+
+    clock.advance(duration / 2)
+    assert not kcubedcservo.KVS_GetStatusBits(servo) & MOVING_FORWARD
+    assert kcubedcservo.KVS_GetPosition(servo) == 100000
+    assert list(simulated.device(b'27000001', SimulatedMotor).messages) == [(2, 1, 0)]
+
+
+def test_short_move_is_triangular(simulated):
+    kcubedcservo.KVS_SetVelParams(servo, 396, 1777857)
+    kcubedcservo.KVS_MoveToPosition(servo, 100)
+    acceleration = 396 / 0.0076355
+    assert axis(simulated, servo).move.end == pytest.approx(2 * (100 / acceleration) ** 0.5)
+
+
+def test_reverse_move_takes_up_backlash(simulated):
+    kcubedcservo.KVS_SetBacklash(servo, 1000)
+    axis(simulated, servo).position = 10000
+    kcubedcservo.KVS_MoveToPosition(servo, 5000)
+    move = axis(simulated, servo).move
+    lowest = min(phase[2] for phase in move.phases)
+    assert lowest == pytest.approx(4000)
+
+    simulated.clock.advance(move.end)
+    assert kcubedcservo.KVS_GetPosition(servo) == 5000
+    assert not kcubedcservo.KVS_GetStatusBits(servo) & MOVING_REVERSE
+
+
+def test_jog_parameters(simulated):
+    jog = MOT_JogParameters(2, 4096, MOT_VelocityParameters(0, 4506, 21987328), 2)
+    assert kcubesteppermotor.SCC_SetJogParamsBlock(stepper, jog) == 0
+    assert kcubesteppermotor.SCC_MoveJog(stepper, 1) == 0
+    assert kcubesteppermotor.SCC_GetStatusBits(stepper) & JOGGING_FORWARD
+    assert wait_for_message(kcubesteppermotor.SCC_WaitForMessage, stepper) == (2, 1, 0)
+    assert kcubesteppermotor.SCC_GetPosition(stepper) == 4096
+
+    # Continuous jogs run until stopped, then decelerate at the profile acceleration.
+    kcubesteppermotor.SCC_SetJogMode(stepper, 1, 2)
+    mode, stop_mode = MOT_JogModes(), MOT_StopModes()
+    assert kcubesteppermotor.SCC_GetJogMode(stepper, byref(mode), byref(stop_mode)) == 0
+    assert (mode.value, stop_mode.value) == (1, 2)
+    kcubesteppermotor.SCC_MoveJog(stepper, 2)
+    simulated.clock.advance(5)
+    assert kcubesteppermotor.SCC_GetStatusBits(stepper) & MOVING_REVERSE
+    assert kcubesteppermotor.SCC_StopProfiled(stepper) == 0
+    assert wait_for_message(kcubesteppermotor.SCC_WaitForMessage, stepper) == (2, 2, 0)
+    assert kcubesteppermotor.SCC_GetPosition(stepper) < -4096
+    assert not kcubesteppermotor.SCC_GetStatusBits(stepper) & MOVING_REVERSE
+
+
+def test_home(simulated):
+    axis(simulated, servo).position = 34555
+    assert kcubedcservo.KVS_Home(servo) == 0
+    assert kcubedcservo.KVS_GetStatusBits(servo) & HOMING
+    assert wait_for_message(kcubedcservo.KVS_WaitForMessage, servo) == (2, 0, 0)
+    assert simulated.clock.now() > 1.0
+    assert kcubedcservo.KVS_GetStatusBits(servo) & HOMED
+    assert kcubedcservo.KVS_GetPosition(servo) == 0
+    assert wait_for_message(kcubedcservo.KVS_WaitForMessage, servo) is None
+
+
+def test_channels(simulated):
+    assert kcubebrushlessmotor.BMC_MoveToPosition(brushless, 1, 2000) == 0
+    assert kcubebrushlessmotor.BMC_MoveToPosition(brushless, 2, 2000) == 43
+
+    assert kcubeinertialmotor.KIM_SetDriveOPParameters(inertial, 3, 110, 1000, 10000) == 0
+    assert kcubeinertialmotor.KIM_MoveAbsolute(inertial, 3, 1000) == 0
+    simulated.clock.advance(1.0)
+    assert kcubeinertialmotor.KIM_GetStatusBits(inertial, 3) & MOVING_FORWARD
+    assert kcubeinertialmotor.KIM_GetCurrentPosition(inertial, 1) == 0
+    simulated.clock.advance(0.2)
+    assert kcubeinertialmotor.KIM_GetCurrentPosition(inertial, 3) == 1000
+    assert not kcubeinertialmotor.KIM_GetStatusBits(inertial, 3) & MOVING_FORWARD
+    assert axis(simulated, inertial, SimulatedInertialMotor, 3).move is None
+
+
+def test_inertial_parameters(simulated):
+    drive = KIM_DriveOPParameters(maxVoltage=110, stepAcceleration=20000, stepRate=1500)
+    assert kcubeinertialmotor.KIM_SetDriveOPParametersStruct(inertial, 2, byref(drive)) == 0
+    jog = KIM_JogParameters(jogMode=2, jogStepAcceleration=5000, jogStepRate=800, jogStepSizeFwd=50, jogStepSizeRev=60)
+    assert kcubeinertialmotor.KIM_SetJogParametersStruct(inertial, 2, byref(jog)) == 0
+
+    drive, jog = KIM_DriveOPParameters(), KIM_JogParameters()
+    assert kcubeinertialmotor.KIM_GetDriveOPParametersStruct(inertial, 2, byref(drive)) == 0
+    assert (drive.stepRate, drive.stepAcceleration) == (1500, 20000)
+    assert kcubeinertialmotor.KIM_GetJogParametersStruct(inertial, 2, byref(jog)) == 0
+    assert (jog.jogMode.value, jog.jogStepSizeFwd, jog.jogStepSizeRev, jog.jogStepRate, jog.jogStepAcceleration) == (
+        2, 50, 60, 800, 5000)
+
+
+def test_accelerated_clock():
+    previous = backend.get_backend()
+    simulated = backend.use_backend('simulated', devices=['27000001'], speed=1000)
+    try:
+        start = time.perf_counter()
+        kcubedcservo.KVS_MoveToPosition(servo, 10 * 34555)
+        assert wait_for_message(kcubedcservo.KVS_WaitForMessage, servo) == (2, 1, 0)
+        assert simulated.clock.now() > 4.0
+        assert time.perf_counter() - start < 1.0
+    finally:
+        backend.use_backend(previous)
+
+
+def test_virtual_clock():
+    clock = VirtualClock(None)
+    clock.sleep(2.5)
+    assert clock.now() == 2.5
+    clock.speed = 100
+    clock.wait_until(2.6)
+    assert clock.now() >= 2.6
+    clock.speed = None
+    assert clock.now() == clock.now()
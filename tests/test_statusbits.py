@@ -0,0 +1,40 @@
+import pytest
+
+from pyscan_tlk import device_modules, kcubedcservo, status_bits
+from pyscan_tlk.statusbits import MOTOR, NANOTRAK, StatusBits
+
+
+def test_every_family_has_a_layout():
+    for name in device_modules:
+        assert isinstance(status_bits(name), StatusBits)
+    assert status_bits(kcubedcservo) is MOTOR
+    with pytest.raises(KeyError):
+        status_bits('devicemanager')
+
+
+def test_decode():
+    status = MOTOR.encode('moving_forward', 'homed', 'enabled')
+    assert status == 0x80000410
+    assert MOTOR.flags(status) == ['moving_forward', 'homed', 'enabled']
+    decoded = MOTOR.decode(status)
+    assert decoded['homed'] and not decoded['homing']
+    assert len(decoded) == len(MOTOR) == 32
+    with pytest.raises(ValueError):
+        StatusBits('bad', both=0x3)
+
+
+def test_columns():
+    numpy = pytest.importorskip('numpy')
+    statuses = numpy.array([0x80000410, 0x00000020, 0x00050000], dtype=numpy.uint32)
+    columns = NANOTRAK.columns(statuses)
+    assert columns.shape == (3,)
+    assert columns['channel_a_connected'].tolist() == [False, False, True]
+    assert columns['channel_a_enabled'].tolist() == [False, False, True]
+    assert columns['under_read'].tolist() == [False, True, False]
+
+    columns = MOTOR.columns(statuses.astype(numpy.int64).reshape(3, 1))
+    assert columns.shape == (3, 1)
+    assert columns['enabled'][:, 0].tolist() == [True, False, False]
+    assert columns['interlock'].dtype == numpy.bool_
+    for flag in MOTOR:
+        assert columns[flag][:, 0].tolist() == [bool(s & MOTOR[flag]) for s in statuses.tolist()]
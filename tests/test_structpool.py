@@ -0,0 +1,80 @@
+from ctypes import POINTER, byref, c_char_p, c_int16
+
+import pytest
+
+from pyscan_tlk import (
+    devicemanager,
+    kcubebrushlessmotor,
+    kcubedcservo,
+    kcubelasersource,
+    kcubenanotrack,
+    kcubesolenoid,
+    tcubequad)
+from pyscan_tlk.definitions.kinesisexception import FT_DeviceNotFound, KinesisException
+from pyscan_tlk.definitions.structures import (
+    KNA_TIAReading,
+    MOT_BrushlessPositionLoopParameters,
+    MOT_DC_PIDParameters,
+    MOT_VelocityParameters,
+    QD_Readings,
+    TLI_DeviceInfo)
+from pyscan_tlk.errorcheck import returns_error_code
+from pyscan_tlk.structpool import StructPool
+
+servo = c_char_p(b'27000001')
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '28000001'], speed=None)
+
+
+def test_out_parameters_by_reference():
+    assert kcubedcservo.lib.functions['KVS_GetDCPIDParams'].argtypes[-1] is POINTER(MOT_DC_PIDParameters)
+    assert tcubequad.lib.functions['QD_GetReading'].argtypes[-1] is POINTER(QD_Readings)
+    assert kcubenanotrack.lib.functions['NT_GetReading'].argtypes[1:] == [POINTER(KNA_TIAReading)]
+    assert devicemanager.lib.functions['TLI_GetDeviceInfo'].argtypes[1:] == [POINTER(TLI_DeviceInfo)]
+    position_loop = kcubebrushlessmotor.lib.functions['BMC_SetPosLoopParams'].argtypes
+    assert position_loop[-1] is POINTER(MOT_BrushlessPositionLoopParameters)
+    for module, name in ((kcubesolenoid, 'SC_GetMMIParams'), (kcubelasersource, 'LS_GetMMIParams')):
+        assert module.lib.functions[name].argtypes[1:] == [POINTER(c_int16)]
+        assert returns_error_code(getattr(module.lib, name))
+
+
+def test_reuses_structures(simulated):
+    pool = StructPool(kcubedcservo, 27000001)
+    velocity = pool.get('GetVelParamsBlock')
+    assert isinstance(velocity, MOT_VelocityParameters)
+    assert pool.get('GetVelParamsBlock') is velocity
+    assert pool.outs('GetVelParamsBlock') == (velocity,)
+
+    # The same structure is refilled with what the device now reports.
+    kcubedcservo.KVS_SetVelParams(servo, 500, 2000000)
+    assert pool.get('GetVelParamsBlock') is velocity
+    assert (velocity.acceleration, velocity.maxVelocity) == (500, 2000000)
+
+    steps, gearbox, pitch = outs = pool.get('GetMotorParamsExt')
+    assert (steps.value, gearbox.value, pitch.value) == (512.0, 67.49, 1.0)
+    assert pool.get('GetMotorParamsExt') is outs
+
+
+def test_channel(simulated):
+    pool = StructPool(kcubebrushlessmotor, 28000001)
+    assert pool.channel == 1
+    assert pool.get('GetVelParamsBlock').maxVelocity > 0
+
+
+def test_errors(simulated):
+    with pytest.raises(ValueError):
+        StructPool(kcubedcservo, 27000001).get('MoveToPosition')
+    with pytest.raises(KinesisException):
+        StructPool(kcubedcservo, 27000002).get('GetVelParamsBlock')
+
+
+def test_device_info(simulated):
+    info = TLI_DeviceInfo()
+    assert devicemanager.TLI_BuildDeviceList() == 0
+    assert devicemanager.TLI_GetDeviceInfo(b'27000001', byref(info)) == 1
+    assert (info.typeID, info.serialNo) == (27, b'27000001')
+    assert devicemanager.TLI_GetDeviceInfo(b'27000002', byref(info)) == 0
+    assert devicemanager.device_info(27000001).serialNo == b'27000001'
+    with pytest.raises(FT_DeviceNotFound):
+        devicemanager.device_info('27000002')
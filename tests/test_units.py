@@ -0,0 +1,93 @@
+from ctypes import byref, c_char_p, c_double, c_int
+
+import pytest
+
+from pyscan_tlk import benchtopvoicecoil, kcubebrushlessmotor, kcubedcservo, kcubesteppermotor
+from pyscan_tlk.paramcache import ParameterCache
+
+numpy = pytest.importorskip('numpy')
+from pyscan_tlk.units import UnitConverter, unit_types  # noqa: E402
+
+servo = c_char_p(b'27000001')
+
+
+pytestmark = pytest.mark.simulated(devices=['27000001', '26000001', '28000001'], speed=None)
+
+
+def test_dll_conversion(simulated):
+    device, real = c_int(), c_double()
+    assert kcubedcservo.KVS_GetDeviceUnitFromRealValue(servo, 1.0, byref(device), 0) == 0
+    assert device.value == 34555
+    assert kcubedcservo.KVS_GetDeviceUnitFromRealValue(servo, -2.5, byref(device), 1) == 0
+    assert device.value == -1932449
+    assert kcubedcservo.KVS_GetRealValueFromDeviceUnit(servo, 34555, byref(real), 0) == 0
+    assert real.value == 34555 / 34554.88
+
+
+@pytest.mark.parametrize('module, serial', [
+    (kcubedcservo, 27000001), (kcubesteppermotor, 26000001), (kcubebrushlessmotor, 28000001)])
+def test_matches_dll(simulated, module, serial):
+    # The simulator converts with the same scales, so this checks the plumbing and the
+    # rounding; test_published_scales checks the scales themselves.
+    units = UnitConverter(module, serial)
+    assert units.check()
+    values = numpy.random.default_rng(0).uniform(-10, 10, 1000)
+    assert units.check(values)
+    # Exact halves round away from zero, as the dll does.
+    halves = numpy.array([0.5, -0.5, 1.5, -1.5, 2.5]) / units.scales['position']
+    assert units.check(halves, 'position')
+
+
+# Stage scales published in the APT Communications Protocol, independent of both the
+# converter's and the simulator's arithmetic: device units per unit, per unit/s and
+# per unit/s^2.
+@pytest.mark.parametrize('module, serial, motor_params, published', [
+    # Z8 actuators (Z825B, MTS25-Z8) on a KDC101: 512 counts per revolution of the
+    # motor, a 67:1 gearbox and a 1 mm lead screw.
+    (kcubedcservo, 27000001, (512.0, 67.0, 1.0), (34304, 767367.49, 261.93)),
+    # PRM1-Z8 rotation mount: the same motor turning the stage 17.87 degrees per revolution.
+    (kcubedcservo, 27000001, (512.0, 67.0, 17.87), (1919.64, 42941.66, 14.66)),
+    # DDSM100 direct drive stage on a KBD101: 2000 encoder counts per mm.
+    (kcubebrushlessmotor, 28000001, (2000.0,), (2000, 13421.77, 1.374))])
+def test_published_scales(simulated, module, serial, motor_params, published):
+    params = ParameterCache(module, serial)
+    params.set('MotorParamsExt', *motor_params)
+    units = UnitConverter(module, serial, params=params)
+    # The protocol gives four or more significant figures.
+    for unit, value in zip(unit_types, published):
+        assert units.scales[unit] == pytest.approx(value, rel=5e-4)
+    assert units.to_device(1.0) == round(published[0])
+
+
+def test_arrays(simulated):
+    units = UnitConverter(kcubedcservo, 27000001)
+    positions = units.to_device(numpy.linspace(0.0, 25.0, 11))
+    assert positions.dtype == numpy.int32
+    assert positions[0] == 0 and positions[-1] == 863872
+    assert numpy.allclose(units.to_real(positions), numpy.linspace(0.0, 25.0, 11))
+    assert units.to_device(2.0, 'velocity') == 1545959
+    assert units.to_device([[1.0], [-1.0]], 'acceleration').shape == (2, 1)
+    with pytest.raises(OverflowError):
+        units.to_device(1e6, 'velocity')
+
+
+def test_refresh(simulated):
+    params = ParameterCache(kcubedcservo, 27000001)
+    units = UnitConverter(kcubedcservo, 27000001, params=params)
+    params.set('MotorParamsExt', 512.0, 67.49, 2.0)
+    # The converter keeps its scales until refreshed.
+    assert units.scales['position'] == 34554.88
+    units.refresh()
+    assert units.scales['position'] == 34554.88 / 2
+    assert units.check()
+
+
+def test_mismatch(simulated):
+    units = UnitConverter(kcubedcservo, 27000001, controller=(22.369621, 0.0076355, 2))
+    with pytest.raises(ValueError):
+        units.check([1.0], 'position')
+
+
+def test_unknown_family(simulated):
+    with pytest.raises(ValueError):
+        UnitConverter(benchtopvoicecoil, 27000001)